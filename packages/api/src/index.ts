@@ -17,6 +17,8 @@ import { logger } from 'hono/logger';
 import { prettyJSON } from 'hono/pretty-json';
 import {
   initUnifiedAuiWithStorage,
+  closeContentStore,
+  closeBooksStore,
   getModelRegistry,
   initUsageService,
   initApiKeyService,
@@ -312,6 +314,14 @@ async function main(): Promise<void> {
       provider: 'ollama',
     });
 
+    // Load the embedding model into Ollama now, in the background, so the
+    // first search doesn't pay the model cold start (not usage-recorded)
+    if (ollamaAvailable) {
+      rawEmbedFn('warmup').catch(err => {
+        console.warn('Embedding model warmup failed:', err);
+      });
+    }
+
     console.log('Embedding function wrapped with usage recording');
 
     // Create config manager seeded with all prompts
@@ -454,7 +464,7 @@ async function main(): Promise<void> {
 
     console.log(`Starting server on ${config.host}:${config.port}...`);
 
-    serve(
+    const server = serve(
       {
         fetch: app.fetch,
         port: config.port,
@@ -467,6 +477,23 @@ async function main(): Promise<void> {
         console.log(`Auth mode: ${process.env.JWT_SECRET ? 'production (JWT required)' : 'development (mock auth)'}`);
       }
     );
+
+    // Release pooled database connections on shutdown
+    let shuttingDown = false;
+    const shutdown = async (signal: string): Promise<void> => {
+      if (shuttingDown) return;
+      shuttingDown = true;
+      console.log(`${signal} received, shutting down...`);
+      server.close();
+      try {
+        await Promise.all([closeContentStore(), closeBooksStore()]);
+      } catch (error) {
+        console.error('Error closing storage:', error);
+      }
+      process.exit(0);
+    };
+    process.once('SIGINT', () => void shutdown('SIGINT'));
+    process.once('SIGTERM', () => void shutdown('SIGTERM'));
   } catch (error) {
     console.error('Failed to start server:', error);
     process.exit(1);
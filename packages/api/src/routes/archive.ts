@@ -77,6 +77,7 @@ archiveRouter.get('/browse', async (c) => {
         createdAt: node.createdAt,
       })),
       total: result.total,
+      totalIsEstimate: result.totalIsEstimate ?? false,
       hasMore: result.hasMore,
       limit,
       offset,
@@ -136,20 +137,18 @@ archiveRouter.get('/threads', async (c) => {
   const offset = parseInt(c.req.query('offset') ?? '0', 10);
 
   try {
-    // Get thread root nodes (hierarchyLevel 0, no parent)
+    // Get thread root nodes (hierarchyLevel 0, no parent). The root filter
+    // runs in SQL so pages stay full and total counts only roots.
     const result = await archiveStore.queryNodes({
       sourceType: sourceType ? sourceType.split(',') : undefined,
       hierarchyLevel: 0,
+      threadRootsOnly: true,
       limit: Math.min(limit, 200),
       offset,
       orderBy: 'sourceCreatedAt',
       orderDir: 'desc',
     });
-
-    // Filter to only include nodes that are thread roots
-    const threads = result.nodes.filter(
-      (node) => !node.parentNodeId || node.id === node.threadRootId
-    );
+    const threads = result.nodes;
 
     return c.json({
       threads: threads.map((node) => ({
@@ -174,7 +173,8 @@ archiveRouter.get('/threads', async (c) => {
 
 /**
  * GET /archive/thread/:threadId
- * Get all nodes in a thread (conversation/post with replies)
+ * Get the nodes in a thread (conversation/post with replies), a page at a
+ * time for long threads
  */
 archiveRouter.get('/thread/:threadId', async (c) => {
   const aui = c.get('aui');
@@ -185,13 +185,16 @@ archiveRouter.get('/thread/:threadId', async (c) => {
   }
 
   const threadId = c.req.param('threadId');
+  const limit = parseInt(c.req.query('limit') ?? '500', 10);
+  const offset = parseInt(c.req.query('offset') ?? '0', 10);
 
   try {
     const result = await archiveStore.queryNodes({
       threadRootId: threadId,
       orderBy: 'sourceCreatedAt',
       orderDir: 'asc',
-      limit: 500, // Get all messages in thread
+      limit: Math.min(limit, 1000),
+      offset,
     });
 
     return c.json({
@@ -211,6 +214,8 @@ archiveRouter.get('/thread/:threadId', async (c) => {
         sourceCreatedAt: node.sourceCreatedAt,
       })),
       count: result.nodes.length,
+      total: result.total,
+      hasMore: result.hasMore,
     });
   } catch (error) {
     return c.json(
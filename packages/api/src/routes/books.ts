@@ -25,13 +25,13 @@ booksRouter.get('/', async (c) => {
   const limit = parseInt(c.req.query('limit') ?? '50', 10);
 
   try {
-    const books = await aui.listBooks({ userId, limit });
+    const books = await aui.listBookSummaries({ userId, limit });
     return c.json({
       books: books.map((book) => ({
         id: book.id,
         title: book.title,
         description: book.description,
-        chapterCount: book.chapters?.length ?? 0,
+        chapterCount: book.chapterCount,
         status: book.status,
         createdAt: book.createdAt,
         updatedAt: book.updatedAt,
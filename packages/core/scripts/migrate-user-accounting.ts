@@ -4,6 +4,7 @@
  * Adds the user accounting system tables:
  * - aui_usage_events
  * - aui_user_usage_snapshots
+ * - aui_user_usage_breakdowns
  * - aui_api_keys
  * - aui_tier_defaults
  * - aui_user_quota_overrides
@@ -16,6 +17,8 @@ import { Pool } from 'pg';
 import {
   CREATE_AUI_USAGE_EVENTS_TABLE,
   CREATE_AUI_USER_USAGE_SNAPSHOTS_TABLE,
+  CREATE_AUI_USER_USAGE_BREAKDOWNS_TABLE,
+  BACKFILL_AUI_USER_USAGE_BREAKDOWNS,
   CREATE_AUI_API_KEYS_TABLE,
   CREATE_AUI_TIER_DEFAULTS_TABLE,
   CREATE_AUI_USER_QUOTA_OVERRIDES_TABLE,
@@ -48,6 +51,10 @@ async function main() {
     console.log('Creating aui_user_usage_snapshots...');
     await client.query(CREATE_AUI_USER_USAGE_SNAPSHOTS_TABLE);
 
+    console.log('Creating aui_user_usage_breakdowns...');
+    await client.query(CREATE_AUI_USER_USAGE_BREAKDOWNS_TABLE);
+    await client.query(BACKFILL_AUI_USER_USAGE_BREAKDOWNS);
+
     console.log('Creating aui_api_keys...');
     await client.query(CREATE_AUI_API_KEYS_TABLE);
 
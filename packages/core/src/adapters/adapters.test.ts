@@ -9,7 +9,12 @@
  */
 
 import { describe, it, expect, beforeEach } from 'vitest';
+import { mkdirSync, mkdtempSync, symlinkSync, writeFileSync } from 'fs';
+import { tmpdir } from 'os';
+import { join } from 'path';
 import type { ImportedNode } from './types.js';
+import { streamJsonArray } from './json-stream.js';
+import { findFiles, retainFileListing, releaseFileListing } from './parsers/utils.js';
 
 // Import all adapters
 import { ChatGPTAdapter } from './providers/chatgpt-adapter.js';
@@ -533,3 +538,183 @@ describe('Exported Constants', () => {
     expect(adapters.linkedin).toBeDefined();
   });
 });
+
+// ═══════════════════════════════════════════════════════════════════
+// STREAMING JSON TESTS
+// ═══════════════════════════════════════════════════════════════════
+
+describe('streamJsonArray', () => {
+  const dir = mkdtempSync(join(tmpdir(), 'json-stream-'));
+
+  async function collect(content: string): Promise<unknown[]> {
+    const path = join(dir, `${Math.random().toString(36).slice(2)}.json`);
+    writeFileSync(path, content);
+    const items: unknown[] = [];
+    for await (const item of streamJsonArray(path)) {
+      items.push(item);
+    }
+    return items;
+  }
+
+  it('yields each element of a large array across read chunks', async () => {
+    const data = Array.from({ length: 300 }, (_, i) => ({
+      id: i,
+      text: `brace } bracket ] quote \" backslash \\ ${'x'.repeat(500)}`,
+      nested: { list: [i, [i + 1]], empty: {} },
+    }));
+
+    expect(await collect(JSON.stringify(data, null, 2))).toEqual(data);
+  });
+
+  it('drops NUL characters from string values', async () => {
+    const content = '[{"text": "a\\u0000b\u0000c", "path": "C:\\\\u0000"}]';
+    expect(await collect(content)).toEqual([{ text: 'abc', path: 'C:\\u0000' }]);
+  });
+
+  it('handles empty arrays', async () => {
+    expect(await collect(' [ ] ')).toEqual([]);
+  });
+
+  it('rejects non-array documents', async () => {
+    await expect(collect('{"mapping": {}}')).rejects.toThrow('Expected a JSON array');
+    await expect(collect('[1, 2]')).rejects.toThrow('Expected an array of objects');
+    await expect(collect('[{"a": 1}')).rejects.toThrow('Unterminated JSON array');
+  });
+});
+
+describe('streamed parse progress', () => {
+  it('reports an extrapolated total while streaming conversations.json', async () => {
+    const dir = mkdtempSync(join(tmpdir(), 'chatgpt-progress-'));
+    const conversations = Array.from({ length: 200 }, (_, i) => ({
+      id: `conv-${i}`,
+      title: `Conversation ${i}`,
+      create_time: 1700000000 + i,
+      update_time: 1700000000 + i,
+      mapping: {
+        root: { id: 'root', parent: null, children: ['m1'] },
+        m1: {
+          id: 'm1',
+          parent: 'root',
+          children: [],
+          message: {
+            id: `msg-${i}`,
+            author: { role: 'user' },
+            create_time: 1700000000 + i,
+            content: { content_type: 'text', parts: ['x'.repeat(1000)] },
+          },
+        },
+      },
+    }));
+    writeFileSync(join(dir, 'conversations.json'), JSON.stringify(conversations));
+
+    const totals: Array<{ processed: number; total?: number }> = [];
+    let count = 0;
+    for await (const _node of new ChatGPTAdapter().parse(
+      { type: 'directory', path: dir },
+      { onProgress: (p) => totals.push({ processed: p.processed, total: p.total }) }
+    )) {
+      count++;
+    }
+
+    expect(count).toBe(400);
+    const withTotal = totals.filter((p) => p.total !== undefined);
+    // Estimated before the stream ends, then settles on the real count
+    expect(withTotal[0].processed).toBeLessThan(count);
+    expect(withTotal[0].total).toBeGreaterThan(withTotal[0].processed);
+    expect(totals[totals.length - 1].total).toBe(count);
+  });
+});
+
+// ═══════════════════════════════════════════════════════════════════
+// FILE WALK TESTS
+// ═══════════════════════════════════════════════════════════════════
+
+describe('findFiles', () => {
+  it('follows symlinks but skips dangling links and links back to the root', () => {
+    const root = mkdtempSync(join(tmpdir(), 'find-files-'));
+    const outside = mkdtempSync(join(tmpdir(), 'find-files-outside-'));
+    mkdirSync(join(root, 'a'));
+    writeFileSync(join(root, 'a', 'photo.jpg'), '');
+    writeFileSync(join(outside, 'linked.jpg'), '');
+    symlinkSync(outside, join(root, 'a', 'outside'));
+    symlinkSync(join(root, 'missing.jpg'), join(root, 'dangling.jpg'));
+    symlinkSync(root, join(root, 'a', 'to-root'));
+
+    const files = findFiles(root, '.jpg').sort();
+
+    expect(files).toEqual([
+      join(root, 'a', 'outside', 'linked.jpg'),
+      join(root, 'a', 'photo.jpg'),
+    ]);
+  });
+
+  it('terminates on symlink loops between sibling directories', () => {
+    const root = mkdtempSync(join(tmpdir(), 'find-files-'));
+    mkdirSync(join(root, 'x'));
+    mkdirSync(join(root, 'y'));
+    writeFileSync(join(root, 'x', 'x.jpg'), '');
+    writeFileSync(join(root, 'y', 'y.jpg'), '');
+    symlinkSync(join(root, 'y'), join(root, 'x', 'to-y'));
+    symlinkSync(join(root, 'x'), join(root, 'y', 'to-x'));
+
+    const files = findFiles(root, '.jpg');
+
+    expect(files).toContain(join(root, 'x', 'x.jpg'));
+    expect(files).toContain(join(root, 'y', 'y.jpg'));
+  });
+
+  describe('retained listing', () => {
+    function archiveTree(): string {
+      const root = mkdtempSync(join(tmpdir(), 'find-files-'));
+      mkdirSync(join(root, 'inbox', 'thread_1'), { recursive: true });
+      mkdirSync(join(root, 'inbox', 'thread_10'), { recursive: true });
+      mkdirSync(join(root, 'inbox', 'thread_1', 'photos'));
+      mkdirSync(join(root, 'empty'));
+      writeFileSync(join(root, 'inbox', 'thread_1', 'message_1.json'), '');
+      writeFileSync(join(root, 'inbox', 'thread_1', 'photos', 'a.jpg'), '');
+      writeFileSync(join(root, 'inbox', 'thread_10', 'message_1.json'), '');
+      writeFileSync(join(root, 'index.html'), '');
+      return root;
+    }
+
+    it('answers lookups under the root like a fresh walk', () => {
+      const root = archiveTree();
+      const dirs = [
+        root,
+        join(root, 'inbox'),
+        join(root, 'inbox', 'thread_1'),
+        join(root, 'inbox', 'thread_1', 'photos'),
+        join(root, 'inbox', 'thread_10'),
+        join(root, 'empty'),
+        join(root, 'missing'),
+      ];
+      const walked = dirs.map((dir) => findFiles(dir, '').sort());
+
+      retainFileListing(root);
+      try {
+        expect(dirs.map((dir) => findFiles(dir, '').sort())).toEqual(walked);
+        expect(findFiles(join(root, 'inbox', 'thread_1'), /message_\d+\.json$/)).toEqual([
+          join(root, 'inbox', 'thread_1', 'message_1.json'),
+        ]);
+      } finally {
+        releaseFileListing(root);
+      }
+    });
+
+    it('serves lookups from memory until the last release', () => {
+      const root = archiveTree();
+      const thread = join(root, 'inbox', 'thread_1');
+
+      retainFileListing(root);
+      retainFileListing(root);
+      writeFileSync(join(thread, 'message_2.json'), '');
+      expect(findFiles(thread, '.json')).toHaveLength(1);
+
+      releaseFileListing(root);
+      expect(findFiles(thread, '.json')).toHaveLength(1);
+
+      releaseFileListing(root);
+      expect(findFiles(thread, '.json')).toHaveLength(2);
+    });
+  });
+});
@@ -15,6 +15,7 @@ import { createHash } from 'crypto';
 import { promises as fs } from 'fs';
 import { join, extname } from 'path';
 import { getConfigManager } from '../config/index.js';
+import { streamJsonArray } from './json-stream.js';
 import type { ConfigManager } from '../config/types.js';
 import type {
   ContentAdapter,
@@ -29,6 +30,9 @@ import type {
   ADAPTER_CONFIG,
 } from './types.js';
 
+/** Largest epoch-millisecond value a Date can represent */
+const MAX_DATE_MS = 8.64e15;
+
 // ═══════════════════════════════════════════════════════════════════
 // BASE ADAPTER CLASS
 // ═══════════════════════════════════════════════════════════════════
@@ -262,6 +266,69 @@ export abstract class BaseAdapter implements ContentAdapter {
     return JSON.parse(content) as T;
   }
 
+  /**
+   * Stream the elements of a JSON array file one at a time
+   *
+   * Use for bulk exports (conversations.json and the like) that can be too
+   * large to parse in one piece.
+   */
+  protected async *streamJsonArray<T>(
+    path: string,
+    onBytesRead?: (bytesRead: number) => void
+  ): AsyncGenerator<T, void, undefined> {
+    const encoding = await this.configManager.getOrDefault<BufferEncoding>(
+      'limits',
+      'adapters.defaultEncoding',
+      'utf-8'
+    );
+    yield* streamJsonArray<T>(path, encoding, onBytesRead);
+  }
+
+  /**
+   * Stream a JSON array file during parse(), keeping the progress total up
+   * to date.
+   *
+   * The element count is unknown until the stream ends, so the total is
+   * extrapolated from the nodes processed so far and the share of the file
+   * read. Elements come from the newest chunk, so only the bytes before it
+   * count as consumed; the estimate errs high and settles on the real count
+   * at the end.
+   */
+  protected async *streamJsonArrayWithProgress<T>(path: string): AsyncGenerator<T, void, undefined> {
+    const { size } = await fs.stat(path);
+    let consumed = 0;
+    let read = 0;
+    const onBytesRead = (bytesRead: number) => {
+      consumed = read;
+      read = bytesRead;
+    };
+
+    for await (const item of this.streamJsonArray<T>(path, onBytesRead)) {
+      yield item;
+
+      // Runs once the caller has processed this element's nodes
+      const { processed } = this.currentProgress;
+      if (consumed > 0 && processed > 0) {
+        this.updateProgress({
+          total: Math.max(processed, Math.round((processed * size) / consumed)),
+        });
+      }
+    }
+
+    this.updateProgress({ total: this.currentProgress.processed });
+  }
+
+  /**
+   * Read only the first element of a JSON array file (for format sniffing).
+   * Returns undefined for an empty array.
+   */
+  protected async readFirstJsonArrayItem<T>(path: string): Promise<T | undefined> {
+    for await (const item of this.streamJsonArray<T>(path)) {
+      return item;
+    }
+    return undefined;
+  }
+
   /**
    * Read a directory
    */
@@ -317,19 +384,21 @@ export abstract class BaseAdapter implements ContentAdapter {
   protected parseTimestamp(value: unknown): Date | undefined {
     if (!value) return undefined;
 
-    // Already a Date
-    if (value instanceof Date) {
-      return isNaN(value.getTime()) ? undefined : value;
-    }
+    // Numbers first: this runs per message, and most exports use epochs.
+    // The explicit range check replaces building an Invalid Date and
+    // testing it afterwards.
+    if (typeof value === 'number') {
+      // Epoch milliseconds (> year 2001)
+      if (value > 1e12) {
+        return value <= MAX_DATE_MS ? new Date(value) : undefined;
+      }
 
-    // Epoch milliseconds (> year 2001)
-    if (typeof value === 'number' && value > 1e12) {
-      return new Date(value);
-    }
+      // Epoch seconds
+      if (value > 1e9 && value < 1e12) {
+        return new Date(value * 1000);
+      }
 
-    // Epoch seconds
-    if (typeof value === 'number' && value > 1e9 && value < 1e12) {
-      return new Date(value * 1000);
+      return undefined;
     }
 
     // String - try to parse
@@ -338,6 +407,11 @@ export abstract class BaseAdapter implements ContentAdapter {
       return isNaN(parsed.getTime()) ? undefined : parsed;
     }
 
+    // Already a Date
+    if (value instanceof Date) {
+      return isNaN(value.getTime()) ? undefined : value;
+    }
+
     return undefined;
   }
 
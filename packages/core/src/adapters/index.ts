@@ -51,6 +51,7 @@ export {
 // BASE ADAPTER
 // ═══════════════════════════════════════════════════════════════════
 export { BaseAdapter } from './base-adapter.js';
+export { streamJsonArray } from './json-stream.js';
 
 // ═══════════════════════════════════════════════════════════════════
 // REGISTRY
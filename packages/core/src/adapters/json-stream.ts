@@ -0,0 +1,170 @@
+/**
+ * Streaming JSON Array Reader
+ *
+ * Yields the elements of a top-level JSON array one at a time, so large
+ * exports (a multi-GB conversations.json) never have to be held in memory
+ * as a single string plus a full object graph.
+ */
+
+import { createReadStream } from 'fs';
+
+// ═══════════════════════════════════════════════════════════════════
+// CHARACTER CODES
+// ═══════════════════════════════════════════════════════════════════
+
+const QUOTE = 0x22; // "
+const BACKSLASH = 0x5c; // \
+const COMMA = 0x2c; // ,
+const OPEN_BRACE = 0x7b; // {
+const CLOSE_BRACE = 0x7d; // }
+const OPEN_BRACKET = 0x5b; // [
+const CLOSE_BRACKET = 0x5d; // ]
+const BOM = 0xfeff;
+
+/** Characters that can end a run of string content */
+const STRING_SPECIALS = /["\\]/g;
+
+/** Characters that matter inside an element, outside of strings */
+const STRUCTURAL = /["{}[\]]/g;
+
+/** NUL escapes and raw NULs; escaped backslashes match too, so `\\u0000` is kept */
+const NUL = /\\(?:\\|u0000)|\0/g;
+
+/** Quick check for element text that contains a NUL at all */
+const HAS_NUL = /\\u0000|\0/;
+
+function isWhitespace(code: number): boolean {
+  return code === 0x20 || code === 0x0a || code === 0x0d || code === 0x09 || code === BOM;
+}
+
+/**
+ * Drop NUL characters from element text before parsing
+ *
+ * Postgres text and JSONB columns cannot store U+0000, and it never carries
+ * meaning in exported content. Removing it from the raw text costs one
+ * native scan, instead of walking every string of the parsed object.
+ */
+function stripNul(text: string): string {
+  if (!HAS_NUL.test(text)) return text;
+  return text.replace(NUL, (match) => (match === '\\\\' ? match : ''));
+}
+
+// ═══════════════════════════════════════════════════════════════════
+// STREAMING READER
+// ═══════════════════════════════════════════════════════════════════
+
+/**
+ * Stream the elements of a JSON array file
+ *
+ * The file is read in chunks and scanned for element boundaries (tracking
+ * nesting and string state); each element is parsed with JSON.parse as
+ * soon as it is complete. Peak memory is one element, not the whole file.
+ *
+ * Elements must be objects or arrays, which covers every export format the
+ * adapters read. NUL characters are dropped from string values. Stopping
+ * iteration early closes the file.
+ *
+ * @param path Path to a file whose top-level value is an array
+ * @param encoding File encoding
+ * @param onBytesRead Called with the bytes read so far as each chunk arrives
+ * @throws If the top-level value is not an array, an element is a bare
+ *   primitive, or the array is not terminated
+ */
+export async function* streamJsonArray<T = unknown>(
+  path: string,
+  encoding: BufferEncoding = 'utf-8',
+  onBytesRead?: (bytesRead: number) => void
+): AsyncGenerator<T, void, undefined> {
+  const stream = createReadStream(path, { encoding });
+
+  let started = false;
+  let finished = false;
+  let depth = 0;
+  let inString = false;
+  let escaped = false;
+  let parts: string[] = [];
+
+  try {
+    for await (const chunk of stream as AsyncIterable<string>) {
+      onBytesRead?.(stream.bytesRead);
+
+      // An element carried over from the previous chunk continues at 0
+      let start = depth > 0 ? 0 : -1;
+
+      for (let i = 0; i < chunk.length; i++) {
+        // Inside an element, jump between interesting characters with a
+        // native regex scan instead of visiting every character in JS
+        if (inString) {
+          if (escaped) {
+            escaped = false;
+            continue;
+          }
+          STRING_SPECIALS.lastIndex = i;
+          const match = STRING_SPECIALS.exec(chunk);
+          if (!match) break;
+          i = match.index;
+          if (chunk.charCodeAt(i) === BACKSLASH) escaped = true;
+          else inString = false;
+          continue;
+        }
+
+        if (depth > 0) {
+          STRUCTURAL.lastIndex = i;
+          const match = STRUCTURAL.exec(chunk);
+          if (!match) break;
+          i = match.index;
+          const code = chunk.charCodeAt(i);
+
+          if (code === QUOTE) {
+            inString = true;
+          } else if (code === OPEN_BRACE || code === OPEN_BRACKET) {
+            depth++;
+          } else if (code === CLOSE_BRACE || code === CLOSE_BRACKET) {
+            depth--;
+            if (depth === 0) {
+              parts.push(chunk.slice(start, i + 1));
+              const element = JSON.parse(stripNul(parts.join(''))) as T;
+              parts = [];
+              start = -1;
+              yield element;
+            }
+          }
+          continue;
+        }
+
+        // Between elements, at the top level
+        const code = chunk.charCodeAt(i);
+        if (isWhitespace(code)) continue;
+
+        if (!started) {
+          if (code !== OPEN_BRACKET) {
+            throw new Error(`Expected a JSON array: ${path}`);
+          }
+          started = true;
+        } else if (finished) {
+          throw new Error(`Unexpected content after JSON array: ${path}`);
+        } else if (code === CLOSE_BRACKET) {
+          finished = true;
+        } else if (code === OPEN_BRACE || code === OPEN_BRACKET) {
+          depth = 1;
+          start = i;
+        } else if (code !== COMMA) {
+          throw new Error(`Expected an array of objects: ${path}`);
+        }
+      }
+
+      if (depth > 0) {
+        parts.push(chunk.slice(start));
+      }
+    }
+  } finally {
+    stream.destroy();
+  }
+
+  if (!started) {
+    throw new Error(`Expected a JSON array: ${path}`);
+  }
+  if (!finished) {
+    throw new Error(`Unterminated JSON array: ${path}`);
+  }
+}
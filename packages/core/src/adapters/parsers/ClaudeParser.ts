@@ -9,7 +9,8 @@ import * as fs from 'fs';
 import * as path from 'path';
 import * as crypto from 'crypto';
 import type { Conversation, ClaudeExport, ClaudeChatMessage, ConversationMapping, ConversationNode } from './types.js';
-import { readJSON, parseISOTimestamp } from './utils.js';
+import { parseISOTimestamp } from './utils.js';
+import { streamJsonArray } from '../json-stream.js';
 
 export class ClaudeParser {
   /**
@@ -18,25 +19,25 @@ export class ClaudeParser {
   async parseConversations(extractedDir: string): Promise<Conversation[]> {
     const conversations: Conversation[] = [];
 
-    // Claude exports have conversations.json in root
+    // Claude exports have conversations.json in root. It is streamed so each
+    // raw export object can be dropped as soon as it has been converted.
     const conversationsFile = path.join(extractedDir, 'conversations.json');
-    const claudeConversations = readJSON<ClaudeExport[]>(conversationsFile);
 
-    if (!claudeConversations || !Array.isArray(claudeConversations)) {
-      console.error('Failed to read conversations.json or invalid format');
+    try {
+      for await (const claudeConv of streamJsonArray<ClaudeExport>(conversationsFile)) {
+        try {
+          const conversation = this.convertToOpenAIFormat(claudeConv);
+          conversations.push(conversation);
+        } catch (err) {
+          console.error(`Failed to convert Claude conversation ${claudeConv.uuid}:`, err);
+        }
+      }
+    } catch (err) {
+      console.error('Failed to read conversations.json or invalid format', err);
       return [];
     }
 
-    console.log(`Found ${claudeConversations.length} Claude conversations`);
-
-    for (const claudeConv of claudeConversations) {
-      try {
-        const conversation = this.convertToOpenAIFormat(claudeConv);
-        conversations.push(conversation);
-      } catch (err) {
-        console.error(`Failed to convert Claude conversation ${claudeConv.uuid}:`, err);
-      }
-    }
+    console.log(`Found ${conversations.length} Claude conversations`);
 
     return conversations;
   }
@@ -175,18 +176,23 @@ export class ClaudeParser {
       return false;
     }
 
-    // Check structure of conversations.json
-    const data = readJSON<unknown>(conversationsFile);
-    if (!data || !Array.isArray(data)) {
+    // Check structure of conversations.json - only the first element is
+    // read; stopping the stream early closes the file
+    let firstConv: Record<string, unknown> | undefined;
+    try {
+      for await (const item of streamJsonArray<Record<string, unknown>>(conversationsFile)) {
+        firstConv = item;
+        break;
+      }
+    } catch {
       return false;
     }
 
-    if (data.length === 0) {
+    if (!firstConv) {
       return false;
     }
 
     // Claude conversations have 'uuid', 'name', 'chat_messages'
-    const firstConv = data[0] as Record<string, unknown>;
     const hasClaudeFields =
       firstConv.uuid !== undefined &&
       firstConv.chat_messages !== undefined &&
@@ -7,6 +7,7 @@
 
 import * as fs from 'fs';
 import * as path from 'path';
+import { findFiles } from './utils.js';
 
 export interface FileMetadata {
   size: number;
@@ -18,14 +19,24 @@ export interface FileMetadata {
   height?: number;
 }
 
+/**
+ * Files sharing one byte size. Size matching only needs to know whether a
+ * size is unique and which file came first, so the full list is not kept.
+ */
+export interface SizeBucket {
+  firstPath: string;
+  count: number;
+}
+
 export interface MediaIndex {
   allFiles: string[];
   basenameSizeToPath: Map<string, string>; // "basename|size" -> path
   fileIdToPath: Map<string, string>; // file-ID -> path
   fileHashToPath: Map<string, string>; // file_hash -> path
   conversationToPaths: Map<string, string[]>; // conversation_id -> [paths]
-  sizeToPaths: Map<number, string[]>; // size -> [paths]
+  sizeToFiles: Map<number, SizeBucket>; // size -> first path + file count
   sizeDimensionsToPath: Map<string, string>; // "size|width|height" -> path
+  basenameToPaths: Map<string, string[]>; // basename -> [paths]
   pathToMetadata: Map<string, FileMetadata>; // path -> metadata
 }
 
@@ -53,8 +64,9 @@ export class ComprehensiveMediaIndexer {
   private fileIdToPath: Map<string, string> = new Map();
   private fileHashToPath: Map<string, string> = new Map();
   private conversationToPaths: Map<string, string[]> = new Map();
-  private sizeToPaths: Map<number, string[]> = new Map();
+  private sizeToFiles: Map<number, SizeBucket> = new Map();
   private sizeDimensionsToPath: Map<string, string> = new Map();
+  private basenameToPaths: Map<string, string[]> = new Map();
 
   // Secondary indices for disambiguation
   private pathToMetadata: Map<string, FileMetadata> = new Map();
@@ -118,8 +130,9 @@ export class ComprehensiveMediaIndexer {
     this.fileIdToPath.clear();
     this.fileHashToPath.clear();
     this.conversationToPaths.clear();
-    this.sizeToPaths.clear();
+    this.sizeToFiles.clear();
     this.sizeDimensionsToPath.clear();
+    this.basenameToPaths.clear();
     this.pathToMetadata.clear();
 
     // Build list of directories to scan
@@ -142,9 +155,12 @@ export class ComprehensiveMediaIndexer {
     let fileHashCount = 0;
     let conversationFiles = 0;
 
-    // Walk ALL files in all scan directories
+    // Catalog ALL files in all scan directories. The extracted archive is
+    // usually already listed (retainFileListing), so it is not walked again
     for (const scanDir of dirsToScan) {
-      this.walkDirectory(scanDir, (filepath) => {
+      if (!fs.existsSync(scanDir)) continue;
+
+      findFiles(scanDir, '').forEach((filepath) => {
         const basename = path.basename(filepath);
         const ext = path.extname(basename).toLowerCase();
 
@@ -215,16 +231,26 @@ export class ComprehensiveMediaIndexer {
         }
 
         // Index 5: By file size (for DALL-E matching)
-        if (!this.sizeToPaths.has(fileSize)) {
-          this.sizeToPaths.set(fileSize, []);
+        const sizeBucket = this.sizeToFiles.get(fileSize);
+        if (sizeBucket) {
+          sizeBucket.count++;
+        } else {
+          this.sizeToFiles.set(fileSize, { firstPath: filepath, count: 1 });
         }
-        this.sizeToPaths.get(fileSize)!.push(filepath);
 
         // Index 6: By size + dimensions (for disambiguation when multiple files have same size)
         if (width && height) {
           const sizeDimKey = `${fileSize}|${width}|${height}`;
           this.sizeDimensionsToPath.set(sizeDimKey, filepath);
         }
+
+        // Index 7: By basename alone (filename-only fallback matching)
+        const sameName = this.basenameToPaths.get(basename);
+        if (sameName) {
+          sameName.push(filepath);
+        } else {
+          this.basenameToPaths.set(basename, [filepath]);
+        }
       });
     }
 
@@ -233,7 +259,7 @@ export class ComprehensiveMediaIndexer {
     this.log(`  - ${fileHashCount} files with file_{hash}-{uuid} pattern`);
     this.log(`  - ${conversationFiles} files in conversation directories`);
     this.log(`  - ${this.basenameSizeToPath.size} unique (basename, size) pairs`);
-    this.log(`  - ${this.sizeToPaths.size} unique file sizes`);
+    this.log(`  - ${this.sizeToFiles.size} unique file sizes`);
     this.log(`  - ${this.sizeDimensionsToPath.size} files with size+dimensions`);
 
     return {
@@ -242,33 +268,13 @@ export class ComprehensiveMediaIndexer {
       fileIdToPath: this.fileIdToPath,
       fileHashToPath: this.fileHashToPath,
       conversationToPaths: this.conversationToPaths,
-      sizeToPaths: this.sizeToPaths,
+      sizeToFiles: this.sizeToFiles,
       sizeDimensionsToPath: this.sizeDimensionsToPath,
+      basenameToPaths: this.basenameToPaths,
       pathToMetadata: this.pathToMetadata,
     };
   }
 
-  /**
-   * Recursively walk a directory and call callback for each file.
-   */
-  private walkDirectory(dir: string, callback: (filepath: string) => void): void {
-    if (!fs.existsSync(dir)) {
-      return;
-    }
-
-    const entries = fs.readdirSync(dir, { withFileTypes: true });
-
-    for (const entry of entries) {
-      const fullPath = path.join(dir, entry.name);
-
-      if (entry.isDirectory()) {
-        this.walkDirectory(fullPath, callback);
-      } else if (entry.isFile()) {
-        callback(fullPath);
-      }
-    }
-  }
-
   /**
    * Extract file-ID from filename.
    *
@@ -279,6 +285,12 @@ export class ComprehensiveMediaIndexer {
    * - file-{ID}.ext (direct file-ID with extension)
    */
   private extractFileId(filename: string): string | null {
+    // Every pattern below is anchored on this prefix; most media files
+    // lack it, so one string check spares them all four regexes
+    if (!filename.startsWith('file-')) {
+      return null;
+    }
+
     // Pattern 1: Underscore separator (top-level user uploads)
     const underscoreMatch = filename.match(/^(file-[A-Za-z0-9]+)_/);
     if (underscoreMatch) {
@@ -314,6 +326,9 @@ export class ComprehensiveMediaIndexer {
    * Pattern: file_{32-hex}-{uuid}.ext
    */
   private extractFileHash(filename: string): string | null {
+    if (!filename.startsWith('file_')) {
+      return null;
+    }
     const match = filename.match(/^(file_[a-f0-9]{32})-[a-f0-9-]{36}\./);
     if (match) {
       return match[1];
@@ -390,7 +405,7 @@ export class ComprehensiveMediaIndexer {
       fileIdFiles: this.fileIdToPath.size,
       fileHashFiles: this.fileHashToPath.size,
       conversationDirs: this.conversationToPaths.size,
-      uniqueSizes: this.sizeToPaths.size,
+      uniqueSizes: this.sizeToFiles.size,
       uniqueBasenameSizePairs: this.basenameSizeToPath.size,
     };
   }
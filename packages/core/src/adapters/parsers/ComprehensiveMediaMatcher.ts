@@ -161,17 +161,18 @@ export class ComprehensiveMediaMatcher {
         const height = dalleGen.height;
 
         if (sizeBytes) {
-          const candidateFiles = fileIndices.sizeToPaths.get(sizeBytes) || [];
+          const candidates = fileIndices.sizeToFiles.get(sizeBytes);
+          const candidateCount = candidates?.count ?? 0;
 
           // If we have only one file with this size, it's likely a match
-          if (candidateFiles.length === 1) {
-            const filepath = candidateFiles[0];
+          if (candidates && candidateCount === 1) {
+            const filepath = candidates.firstPath;
             if (!matchedFiles.has(filepath)) {
               matchedFiles.add(filepath);
               this.stats.bySizeMetadata++;
               this.log(`    Matched by size (unique): ${sizeBytes} bytes`);
             }
-          } else if (candidateFiles.length > 1) {
+          } else if (candidates && candidateCount > 1) {
             // Multiple files with same size - try to disambiguate by dimensions
             let matched = false;
 
@@ -188,12 +189,12 @@ export class ComprehensiveMediaMatcher {
 
             // Fallback: take first candidate if dimension matching failed
             if (!matched) {
-              const filepath = candidateFiles[0];
+              const filepath = candidates.firstPath;
               if (!matchedFiles.has(filepath)) {
                 matchedFiles.add(filepath);
                 this.stats.bySizeOnly++;
                 this.log(
-                  `    Matched by size (ambiguous): ${sizeBytes} bytes - ${candidateFiles.length} candidates`
+                  `    Matched by size (ambiguous): ${sizeBytes} bytes - ${candidateCount} candidates`
                 );
               }
             }
@@ -214,16 +215,17 @@ export class ComprehensiveMediaMatcher {
         }
 
         if (sizeBytes) {
-          const candidateFiles = fileIndices.sizeToPaths.get(sizeBytes) || [];
+          const candidates = fileIndices.sizeToFiles.get(sizeBytes);
+          const candidateCount = candidates?.count ?? 0;
 
-          if (candidateFiles.length === 1) {
-            const filepath = candidateFiles[0];
+          if (candidates && candidateCount === 1) {
+            const filepath = candidates.firstPath;
             if (!matchedFiles.has(filepath)) {
               matchedFiles.add(filepath);
               this.stats.bySizeOnly++;
               this.log(`    Matched by size: ${sizeBytes} bytes`);
             }
-          } else if (candidateFiles.length > 1) {
+          } else if (candidates && candidateCount > 1) {
             // Multiple files with same size - try to disambiguate by dimensions
             let matched = false;
 
@@ -241,7 +243,7 @@ export class ComprehensiveMediaMatcher {
             // Only match ambiguously if we have no other option and it's unique enough
             if (!matched) {
               this.log(
-                `    Skipping ambiguous size match: ${sizeBytes} bytes - ${candidateFiles.length} candidates`
+                `    Skipping ambiguous size match: ${sizeBytes} bytes - ${candidateCount} candidates`
               );
             }
           }
@@ -251,15 +253,13 @@ export class ComprehensiveMediaMatcher {
       // Strategy 7: Match by filename alone (least reliable)
       const filenames = this.referenceExtractor.getAllFilenames(references);
       for (const filename of filenames) {
-        // Look through all files for basename match
-        for (const [filepath, metadata] of fileIndices.pathToMetadata) {
-          if (metadata.basename === filename) {
-            if (!matchedFiles.has(filepath)) {
-              matchedFiles.add(filepath);
-              this.stats.byFilenameOnly++;
-              this.log(`    Matched by filename only: ${filename}`);
-              break;
-            }
+        const candidateFiles = fileIndices.basenameToPaths.get(filename) || [];
+        for (const filepath of candidateFiles) {
+          if (!matchedFiles.has(filepath)) {
+            matchedFiles.add(filepath);
+            this.stats.byFilenameOnly++;
+            this.log(`    Matched by filename only: ${filename}`);
+            break;
           }
         }
       }
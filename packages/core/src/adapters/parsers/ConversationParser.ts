@@ -20,7 +20,13 @@ import { SubstackParser } from './SubstackParser.js';
 import { ComprehensiveMediaIndexer } from './ComprehensiveMediaIndexer.js';
 import { ComprehensiveMediaMatcher } from './ComprehensiveMediaMatcher.js';
 import type { ParsedArchive, ParsedArchiveWithRelationships, Conversation, ExportFormat, MediaFile } from './types.js';
-import { extractZip, ensureDir, generateId } from './utils.js';
+import {
+  extractZip,
+  ensureDir,
+  generateId,
+  retainFileListing,
+  releaseFileListing,
+} from './utils.js';
 
 export class ConversationParser {
   private openAIParser: OpenAIParser;
@@ -84,6 +90,9 @@ export class ConversationParser {
       console.log(`✓ Extracted to: ${tempDir}`);
     }
 
+    // Detection and parsing search the tree repeatedly; walk it only once
+    retainFileListing(tempDir);
+
     try {
       // Step 2: Detect format
       console.log('\nStep 2: Detecting export format...');
@@ -168,6 +177,8 @@ export class ConversationParser {
     } catch (error) {
       console.error('Failed to parse archive:', error);
       throw error;
+    } finally {
+      releaseFileListing(tempDir);
     }
   }
 
@@ -365,11 +376,18 @@ export class ConversationParser {
     let totalSize = 0;
 
     const walk = (dir: string) => {
-      const files = fs.readdirSync(dir);
-      for (const file of files) {
-        const filePath = path.join(dir, file);
-        const stats = fs.statSync(filePath);
+      // Dirent types tell directories apart without a stat; only files
+      // (for their size) and symlinks (for their target) are stat'ed
+      const entries = fs.readdirSync(dir, { withFileTypes: true });
+      for (const entry of entries) {
+        const filePath = path.join(dir, entry.name);
 
+        if (entry.isDirectory()) {
+          walk(filePath);
+          continue;
+        }
+
+        const stats = fs.statSync(filePath);
         if (stats.isDirectory()) {
           walk(filePath);
         } else {
@@ -16,7 +16,7 @@ import type {
   MessageContent,
   MessageAttachment,
 } from './types.js';
-import { findFiles } from './utils.js';
+import { findFiles, readJSONFiles } from './utils.js';
 
 /**
  * Facebook message structure (from data export)
@@ -58,9 +58,12 @@ export class FacebookParser {
 
     console.log(`Found ${messageFiles.length} Facebook message JSON files`);
 
-    for (const filePath of messageFiles) {
+    // Later thread files are read while earlier ones are being converted
+    const threads = readJSONFiles<FacebookThread>(messageFiles, undefined, (content) =>
+      this.decodeFacebookUnicode(content)
+    );
+    for await (const [filePath, threadData] of threads) {
       try {
-        const threadData = this.readFacebookJSON<FacebookThread>(filePath);
         if (!threadData || !threadData.messages || threadData.messages.length === 0) {
           console.log(`Skipping empty conversation: ${filePath}`);
           continue;
@@ -93,21 +96,6 @@ export class FacebookParser {
     return allFiles;
   }
 
-  /**
-   * Read and decode Facebook JSON file
-   * Facebook uses non-standard Unicode escaping (\u00XX\u00YY for UTF-8)
-   */
-  private readFacebookJSON<T>(filePath: string): T | null {
-    try {
-      const content = fs.readFileSync(filePath, 'utf-8');
-      const decoded = this.decodeFacebookUnicode(content);
-      return JSON.parse(decoded);
-    } catch (err) {
-      console.error(`Failed to read Facebook JSON: ${filePath}`, err);
-      return null;
-    }
-  }
-
   /**
    * Decode Facebook's non-standard Unicode encoding
    * Facebook escapes UTF-8 bytes as Unicode code points (e.g., \u00e9 for é)
@@ -82,6 +82,12 @@ interface InstagramThread {
 export class InstagramParser {
   private username: string = '';
 
+  /**
+   * Every file in the export being parsed. Media references are checked
+   * against this instead of hitting the filesystem once per reference.
+   */
+  private exportFiles: Set<string> = new Set();
+
   /**
    * Parse all content from an extracted Instagram export directory
    */
@@ -98,6 +104,9 @@ export class InstagramParser {
     // Get username from personal_information if available
     await this.loadUsername(extractedDir);
 
+    // Scan the export once up front for media lookups ('' matches every file)
+    this.exportFiles = new Set(findFiles(extractedDir, ''));
+
     // Parse posts - one conversation per post
     const postConversations = await this.parsePosts(activityDir, extractedDir);
     conversations.push(...postConversations);
@@ -115,6 +124,8 @@ export class InstagramParser {
     const messageConversations = await this.parseMessages(activityDir, extractedDir);
     conversations.push(...messageConversations);
 
+    this.exportFiles = new Set();
+
     console.log(`Successfully parsed ${conversations.length} Instagram conversations total`);
     return conversations;
   }
@@ -271,7 +282,7 @@ export class InstagramParser {
       if (post.media) {
         for (const m of post.media) {
           const mediaPath = path.join(extractedDir, m.uri);
-          if (fs.existsSync(mediaPath)) {
+          if (this.exportFiles.has(mediaPath)) {
             mediaFiles.push(mediaPath);
           }
         }
@@ -615,11 +626,11 @@ export class InstagramParser {
           for (const item of arr) {
             // Try relative to message file first
             let mediaPath = path.join(baseDir, item.uri);
-            if (!fs.existsSync(mediaPath)) {
+            if (!this.exportFiles.has(mediaPath)) {
               // Try relative to extract dir
               mediaPath = path.join(extractedDir, item.uri);
             }
-            if (fs.existsSync(mediaPath)) {
+            if (this.exportFiles.has(mediaPath)) {
               mediaFiles.push(mediaPath);
             }
           }
@@ -48,6 +48,22 @@ export interface MediaReferences {
   text_references: TextRef[];
 }
 
+/**
+ * Patterns for media mentioned in message text: filenames with a media
+ * extension, file-IDs, and bare UUIDs. Shared across calls; each scan
+ * resets lastIndex to 0 instead of building new RegExp objects per message.
+ *
+ * The filename pattern only starts at the beginning of a name run. Without
+ * the lookbehind, every position inside a long run with no extension (a
+ * pasted base64 blob or minified code) re-scans to the end of the run,
+ * which is quadratic in the run length.
+ */
+const TEXT_REFERENCE_PATTERNS = [
+  /(?<![\w-])[\w-]+\.(jpg|jpeg|png|gif|webp|pdf|mp3|wav|mp4|mov)/gi,
+  /file-[A-Za-z0-9]+/g,
+  /[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}/g,
+];
+
 /**
  * Extracts ALL media references from conversation JSON.
  * This extractor makes no assumptions about reference format - it looks
@@ -171,13 +187,8 @@ export class MediaReferenceExtractor {
    * Extract media references from text content.
    */
   private extractFromText(text: string, references: MediaReferences): void {
-    const filenamePatterns = [
-      /[\w\-]+\.(jpg|jpeg|png|gif|webp|pdf|mp3|wav|mp4|mov)/gi,
-      /file-[A-Za-z0-9]+/g,
-      /[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}/g,
-    ];
-
-    for (const pattern of filenamePatterns) {
+    for (const pattern of TEXT_REFERENCE_PATTERNS) {
+      pattern.lastIndex = 0;
       let match;
       while ((match = pattern.exec(text)) !== null) {
         const start = Math.max(0, match.index - 50);
@@ -189,7 +200,6 @@ export class MediaReferenceExtractor {
           context,
         });
       }
-      pattern.lastIndex = 0;
     }
   }
 
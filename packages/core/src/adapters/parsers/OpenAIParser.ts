@@ -7,7 +7,11 @@
 
 import * as path from 'path';
 import type { Conversation, ConversationMapping, ConversationNode, Message } from './types.js';
-import { readJSON, findFiles } from './utils.js';
+import { readJSON, readJSONFiles, findFiles } from './utils.js';
+import { streamJsonArray } from '../json-stream.js';
+
+/** Bulk exports: one file holding the array of every conversation */
+const BULK_EXPORT_FILE = /conversations\.json$/i;
 
 export class OpenAIParser {
   /**
@@ -19,9 +23,18 @@ export class OpenAIParser {
 
     console.log(`Found ${conversationFiles.length} conversation.json files`);
 
-    for (const filePath of conversationFiles) {
+    // Bulk exports are streamed element by element; a multi-GB
+    // conversations.json can exceed the maximum string length if read whole
+    const singleFiles = conversationFiles.filter((f) => !BULK_EXPORT_FILE.test(f));
+    for (const filePath of conversationFiles.filter((f) => BULK_EXPORT_FILE.test(f))) {
+      if (!(await this.streamConversationsArray(filePath, conversations))) {
+        singleFiles.push(filePath);
+      }
+    }
+
+    // Later files are read while earlier ones are being normalized
+    for await (const [filePath, data] of readJSONFiles<unknown>(singleFiles)) {
       try {
-        const data = readJSON<unknown>(filePath);
         if (!data) continue;
 
         // Handle array of conversations (full export)
@@ -48,6 +61,34 @@ export class OpenAIParser {
     return conversations;
   }
 
+  /**
+   * Stream a conversations.json array, normalizing each element into
+   * `conversations`. Returns false if the file is not an array of objects,
+   * so the caller can read it whole instead.
+   */
+  private async streamConversationsArray(
+    filePath: string,
+    conversations: Conversation[]
+  ): Promise<boolean> {
+    let count = 0;
+    try {
+      for await (const item of streamJsonArray<unknown>(filePath)) {
+        count++;
+        try {
+          conversations.push(this.normalizeConversation(item));
+        } catch (err) {
+          console.error('Failed to normalize conversation:', err);
+        }
+      }
+    } catch (err) {
+      if (count === 0) return false;
+      console.error(`Failed to parse ${filePath}:`, err);
+    }
+
+    console.log(`Parsed array of ${count} conversations from ${path.basename(filePath)}`);
+    return true;
+  }
+
   /**
    * Find all conversations.json files in the extracted archive
    * IMPORTANT: Excludes files inside already-organized folders (pattern: YYYY-MM-DD_*_*)
@@ -97,9 +138,11 @@ export class OpenAIParser {
   private normalizeConversation(data: unknown): Conversation {
     const obj = data as Record<string, unknown>;
 
-    // Start with deep clone of original to preserve all fields
+    // Start with all original fields. The input is freshly parsed from the
+    // export file and owned by us, so a deep clone (a full serialize/parse
+    // walk of every message, mapping included) would buy nothing.
     const conversation: Conversation = {
-      ...(JSON.parse(JSON.stringify(data)) as Record<string, unknown>),
+      ...obj,
 
       // Ensure/normalize required fields
       conversation_id: (obj.id as string) || (obj.conversation_id as string) || '',
@@ -212,22 +255,11 @@ export class OpenAIParser {
     }
 
     // Check first file for OpenAI-specific structure
-    const firstFile = readJSON<unknown>(conversationFiles[0]);
-    if (!firstFile) {
+    const sample = await OpenAIParser.readSample(conversationFiles[0]);
+    if (!sample) {
       return false;
     }
 
-    // OpenAI exports can be either:
-    // 1. An array of conversations (conversations.json from full export)
-    // 2. A single conversation object
-    let sample = firstFile as Record<string, unknown>;
-    if (Array.isArray(firstFile)) {
-      if (firstFile.length === 0) {
-        return false;
-      }
-      sample = firstFile[0] as Record<string, unknown>;
-    }
-
     // OpenAI exports have 'mapping' field with conversation tree
     const hasMapping = sample.mapping !== undefined;
     const hasCreateTime = sample.create_time !== undefined;
@@ -236,31 +268,44 @@ export class OpenAIParser {
   }
 
   /**
-   * Parse conversations.json file that contains an array of conversations
+   * Read the first conversation of an export file
+   *
+   * OpenAI exports can be either:
+   * 1. An array of conversations (conversations.json from full export);
+   *    only its first element is read
+   * 2. A single conversation object
    */
-  async parseConversationsArray(filePath: string): Promise<Conversation[]> {
+  private static async readSample(filePath: string): Promise<Record<string, unknown> | undefined> {
+    try {
+      for await (const item of streamJsonArray<Record<string, unknown>>(filePath)) {
+        return item;
+      }
+      return undefined;
+    } catch {
+      // Not an array of objects; read it whole below
+    }
+
     const data = readJSON<unknown>(filePath);
     if (!data) {
-      return [];
+      return undefined;
     }
-
-    if (!Array.isArray(data)) {
-      console.warn(`Expected array but got object: ${filePath}`);
-      const single = this.parseConversationFile(filePath);
-      return single ? [single] : [];
+    if (Array.isArray(data)) {
+      return data[0] as Record<string, unknown> | undefined;
     }
+    return data as Record<string, unknown>;
+  }
 
+  /**
+   * Parse conversations.json file that contains an array of conversations
+   */
+  async parseConversationsArray(filePath: string): Promise<Conversation[]> {
     const conversations: Conversation[] = [];
-
-    for (const item of data) {
-      try {
-        const conversation = this.normalizeConversation(item);
-        conversations.push(conversation);
-      } catch (err) {
-        console.error('Failed to normalize conversation:', err);
-      }
+    if (await this.streamConversationsArray(filePath, conversations)) {
+      return conversations;
     }
 
-    return conversations;
+    console.warn(`Expected array but got object: ${filePath}`);
+    const single = this.parseConversationFile(filePath);
+    return single ? [single] : [];
   }
 }
@@ -164,6 +164,9 @@ export class TwitterParser {
       tweetById.set(tweet.tweet.id_str, tweet);
     }
 
+    // List the media directory once; each tweet is then a map lookup
+    const mediaByTweetId = this.indexTweetMedia(extractedDir);
+
     for (const tweet of tweets) {
       const t = tweet.tweet;
       const conversationId = `twitter_tweet_${t.id_str}`;
@@ -244,7 +247,7 @@ export class TwitterParser {
       }
 
       // Extract media files for this tweet
-      const mediaFiles = this.extractTweetMediaFiles(t, extractedDir);
+      const mediaFiles = this.extractTweetMediaFiles(t, mediaByTweetId);
 
       conversations.push({
         conversation_id: conversationId,
@@ -392,31 +395,46 @@ export class TwitterParser {
   }
 
   /**
-   * Extract media files for a single tweet
+   * Index the tweets_media directory by tweet ID
+   *
+   * Twitter media files are named with tweet ID prefix: {tweet_id}-{media_id}.ext
    */
-  private extractTweetMediaFiles(tweet: Tweet['tweet'], extractedDir: string): string[] {
-    const mediaFiles: string[] = [];
+  private indexTweetMedia(extractedDir: string): Map<string, string[]> {
+    const index = new Map<string, string[]>();
     const mediaDir = path.join(extractedDir, 'data', 'tweets_media');
 
-    if (!fs.existsSync(mediaDir)) return mediaFiles;
-
-    const media = tweet.extended_entities?.media || tweet.entities?.media || [];
-    if (media.length === 0) return mediaFiles;
+    if (!fs.existsSync(mediaDir)) return index;
 
     try {
-      const files = fs.readdirSync(mediaDir);
-      const tweetId = tweet.id_str;
+      for (const file of fs.readdirSync(mediaDir)) {
+        const tweetId = file.match(/^[^-.]+/)?.[0];
+        if (!tweetId) continue;
 
-      // Twitter media files are named with tweet ID prefix: {tweet_id}-{media_id}.ext
-      const matchingFiles = files.filter((f) => f.startsWith(tweetId));
-      matchingFiles.forEach((f) => {
-        mediaFiles.push(path.join(mediaDir, f));
-      });
+        const files = index.get(tweetId);
+        if (files) {
+          files.push(path.join(mediaDir, file));
+        } else {
+          index.set(tweetId, [path.join(mediaDir, file)]);
+        }
+      }
     } catch (error) {
       console.debug('[TwitterParser] Error reading media directory:', error);
     }
 
-    return mediaFiles;
+    return index;
+  }
+
+  /**
+   * Extract media files for a single tweet
+   */
+  private extractTweetMediaFiles(
+    tweet: Tweet['tweet'],
+    mediaByTweetId: Map<string, string[]>
+  ): string[] {
+    const media = tweet.extended_entities?.media || tweet.entities?.media || [];
+    if (media.length === 0) return [];
+
+    return mediaByTweetId.get(tweet.id_str) ?? [];
   }
 
   /**
@@ -0,0 +1,196 @@
+/**
+ * Import-to-DB Tests
+ *
+ * Incremental re-import against an in-memory stand-in for the content store.
+ *
+ * @module adapters/parsers/import-to-db.test
+ */
+
+import { describe, it, expect, beforeEach, vi } from 'vitest';
+import type { ImportedNode } from '../types.js';
+import type { Conversation, ParsedArchive } from './types.js';
+
+// ═══════════════════════════════════════════════════════════════════════════
+// MOCKS
+// ═══════════════════════════════════════════════════════════════════════════
+
+interface FakeRow {
+  uri: string;
+  contentHash: string;
+  jobId: string;
+  sourceUpdatedAt?: Date;
+}
+
+/** Just enough of the content store for the conversation import path */
+class FakeContentStore {
+  rows: FakeRow[] = [];
+  jobs = new Map<string, string>();
+  /** URIs whose next storeNode call throws */
+  failing = new Set<string>();
+  stored: string[] = [];
+
+  async createJob() {
+    const id = `job-${this.jobs.size + 1}`;
+    this.jobs.set(id, 'pending');
+    return { id };
+  }
+
+  async updateJob(id: string, update: { status?: string }) {
+    if (update.status) this.jobs.set(id, update.status);
+  }
+
+  async getImportedSourceUpdatedAt(uris: string[]) {
+    const latest = new Map<string, Date>();
+    for (const row of this.rows) {
+      if (!uris.includes(row.uri) || !row.sourceUpdatedAt) continue;
+      if (this.jobs.get(row.jobId) !== 'completed') continue;
+      const seen = latest.get(row.uri);
+      if (!seen || seen < row.sourceUpdatedAt) latest.set(row.uri, row.sourceUpdatedAt);
+    }
+    return latest;
+  }
+
+  async getExistingContentHashes(hashes: string[]) {
+    return new Set(this.rows.map((r) => r.contentHash).filter((h) => hashes.includes(h)));
+  }
+
+  async storeNode(node: ImportedNode, jobId: string) {
+    if (this.failing.delete(node.uri)) throw new Error('insert failed');
+    this.rows.push({
+      uri: node.uri,
+      contentHash: node.contentHash,
+      jobId,
+      sourceUpdatedAt: node.sourceUpdatedAt,
+    });
+    this.stored.push(node.uri);
+  }
+
+  async refreshImportedSourceUpdatedAt(updatedAt: Map<string, Date>) {
+    for (const row of this.rows) {
+      const next = updatedAt.get(row.uri);
+      if (next && (!row.sourceUpdatedAt || row.sourceUpdatedAt < next)) {
+        row.sourceUpdatedAt = next;
+      }
+    }
+  }
+}
+
+let fakeStore: FakeContentStore;
+
+vi.mock('../../storage/postgres-content-store.js', () => ({
+  initContentStore: vi.fn(async () => fakeStore),
+  getContentStore: vi.fn(() => fakeStore),
+  closeContentStore: vi.fn(async () => {}),
+}));
+
+import { importArchiveToDb } from './import-to-db.js';
+
+// ═══════════════════════════════════════════════════════════════════════════
+// FIXTURES
+// ═══════════════════════════════════════════════════════════════════════════
+
+function conversation(id: string, updateTime: number, texts: string[]): Conversation {
+  const mapping: Conversation['mapping'] = {
+    root: { id: 'root', children: texts.length ? ['m0'] : [] },
+  };
+  texts.forEach((text, i) => {
+    mapping[`m${i}`] = {
+      id: `m${i}`,
+      parent: i === 0 ? 'root' : `m${i - 1}`,
+      children: i + 1 < texts.length ? [`m${i + 1}`] : [],
+      message: {
+        id: `m${i}`,
+        author: { role: i % 2 === 0 ? 'user' : 'assistant' },
+        content: { content_type: 'text', parts: [text] },
+      },
+    } as Conversation['mapping'][string];
+  });
+  return {
+    conversation_id: id,
+    title: `Conversation ${id}`,
+    create_time: 1_700_000_000,
+    update_time: updateTime,
+    mapping,
+    moderation_results: [],
+  };
+}
+
+function archive(conversations: Conversation[]): ParsedArchive {
+  return {
+    conversations,
+    mediaFiles: [],
+    format: 'openai',
+    extractedPath: '/tmp/export',
+    stats: {
+      totalConversations: conversations.length,
+      totalMessages: 0,
+      totalMediaFiles: 0,
+      parseErrors: 0,
+    },
+  };
+}
+
+const importOptions = {
+  generateEmbeddings: false,
+  extractMediaText: false,
+  enrichContent: false,
+  detectPaste: false,
+};
+
+// ═══════════════════════════════════════════════════════════════════════════
+// TESTS
+// ═══════════════════════════════════════════════════════════════════════════
+
+describe('importArchiveToDb', () => {
+  beforeEach(() => {
+    fakeStore = new FakeContentStore();
+  });
+
+  it('skips conversations unchanged since a completed import', async () => {
+    const parsed = archive([conversation('c1', 1_700_000_100, ['hello', 'hi there'])]);
+
+    await importArchiveToDb(parsed, importOptions);
+    const second = await importArchiveToDb(parsed, importOptions);
+
+    expect(second.conversationsSkipped).toBe(1);
+    expect(fakeStore.stored).toEqual(['openai://c1', 'openai://c1/m0', 'openai://c1/m1']);
+  });
+
+  it('retries a message that failed on the previous import', async () => {
+    const parsed = archive([conversation('c1', 1_700_000_100, ['hello', 'hi there'])]);
+    fakeStore.failing.add('openai://c1/m1');
+
+    const first = await importArchiveToDb(parsed, importOptions);
+    expect(first.messagesFailed).toBe(1);
+
+    const second = await importArchiveToDb(parsed, importOptions);
+
+    expect(second.conversationsSkipped).toBe(0);
+    expect(second.messagesImported).toBe(1);
+    expect(fakeStore.stored).toEqual(['openai://c1', 'openai://c1/m0', 'openai://c1/m1']);
+
+    const third = await importArchiveToDb(parsed, importOptions);
+    expect(third.conversationsSkipped).toBe(1);
+  });
+
+  it('re-imports a conversation updated since the last import', async () => {
+    await importArchiveToDb(
+      archive([conversation('c1', 1_700_000_100, ['hello'])]),
+      importOptions
+    );
+
+    const second = await importArchiveToDb(
+      archive([conversation('c1', 1_700_000_200, ['hello', 'new reply'])]),
+      importOptions
+    );
+
+    expect(second.conversationsSkipped).toBe(0);
+    expect(second.messagesImported).toBe(1);
+
+    const third = await importArchiveToDb(
+      archive([conversation('c1', 1_700_000_200, ['hello', 'new reply'])]),
+      importOptions
+    );
+    expect(third.conversationsSkipped).toBe(1);
+  });
+});
@@ -56,6 +56,8 @@ export interface ImportResult {
   jobId: string;
   status: 'completed' | 'failed';
   conversationsProcessed: number;
+  /** Conversations skipped because a completed import already has this version */
+  conversationsSkipped: number;
   messagesImported: number;
   messagesSkipped: number;
   messagesFailed: number;
@@ -189,6 +191,7 @@ export async function importArchiveToDb(
   });
 
   let conversationsProcessed = 0;
+  let conversationsSkipped = 0;
   let messagesImported = 0;
   let messagesSkipped = 0;
   let messagesFailed = 0;
@@ -208,22 +211,53 @@ export async function importArchiveToDb(
   const pasteStartTime = Date.now();
 
   try {
+    // Conversations a completed import already stored at their current
+    // version are skipped before any node building or hashing
+    const importedUpdatedAt = skipExisting
+      ? await store.getImportedSourceUpdatedAt(
+          archive.conversations.map((c) => conversationRootUri(c, archive.format))
+        )
+      : undefined;
+
+    // Roots are stored without source_updated_at and stamped only once every
+    // node of their conversation is stored and the job completes, so a
+    // conversation with failed messages is retried by the next import
+    const settledRoots = new Map<string, Date>();
+
     // Process conversations in batches
     for (const conversation of archive.conversations) {
       conversationsProcessed++;
 
+      const importedAt = importedUpdatedAt?.get(conversationRootUri(conversation, archive.format));
+      if (
+        importedAt &&
+        (conversation.conversation_id || conversation.id) &&
+        conversation.update_time &&
+        importedAt.getTime() >= new Date(conversation.update_time * 1000).getTime()
+      ) {
+        conversationsSkipped++;
+        continue;
+      }
+
       // Convert conversation to nodes
       const nodes = conversationToNodes(conversation, archive.format);
 
+      // One existence query per conversation instead of one per message
+      const existingHashes = skipExisting
+        ? await store.getExistingContentHashes(nodes.map((n) => n.contentHash))
+        : undefined;
+
+      const failedBefore = messagesFailed;
+      const [rootNode] = nodes;
+      const rootUpdatedAt = rootNode.sourceUpdatedAt;
+      rootNode.sourceUpdatedAt = undefined;
+
       // Store nodes with optional hash generation
       for (const node of nodes) {
         try {
-          if (skipExisting) {
-            const existing = await store.getNodeByHash(node.contentHash);
-            if (existing) {
-              messagesSkipped++;
-              continue;
-            }
+          if (existingHashes?.has(node.contentHash)) {
+            messagesSkipped++;
+            continue;
           }
 
           // Generate fine-grained hashes if enabled
@@ -275,6 +309,7 @@ export async function importArchiveToDb(
           }
 
           await store.storeNode(node, job.id);
+          existingHashes?.add(node.contentHash);
           messagesImported++;
 
           if (node.media) {
@@ -288,6 +323,10 @@ export async function importArchiveToDb(
         }
       }
 
+      if (rootUpdatedAt && messagesFailed === failedBefore) {
+        settledRoots.set(rootNode.uri, rootUpdatedAt);
+      }
+
       // Progress update
       if (conversationsProcessed % 100 === 0) {
         log(`  Processed ${conversationsProcessed}/${archive.conversations.length} conversations...`);
@@ -332,6 +371,17 @@ export async function importArchiveToDb(
       let descriptionExtractions = 0;
       const gizmosDetected = new Set<string>();
 
+      // Associations are written across conversations in shared batches, so
+      // the store opens one transaction per batch rather than one per message pair
+      const associationBatchSize = 500;
+      let pendingAssociations: typeof allAssociations = [];
+      const flushAssociations = async () => {
+        if (pendingAssociations.length === 0) return;
+        const storeResult = await store.storeMediaTextAssociations(pendingAssociations);
+        associationsCreated += storeResult.stored;
+        pendingAssociations = [];
+      };
+
       // Process conversations for media-text extraction
       for (const conversation of archive.conversations) {
         // Check for gizmo_id in conversation metadata
@@ -368,13 +418,16 @@ export async function importArchiveToDb(
           const msgId = (msg.id as string) || `msg_${i}`;
           const nextMsgId = (nextMsg.id as string) || `msg_${i + 1}`;
 
+          const userPayload = extractMessagePayload(msg);
+          const assistantPayload = extractMessagePayload(nextMsg);
+
           // Build message objects for extraction
           const userMessage: MessageForExtraction = {
             messageId: msgId,
             conversationId: convId,
-            content: extractTextContent(msg),
+            content: userPayload.text,
             authorRole: 'user',
-            mediaRefs: extractMediaRefs(msg).map(m => ({
+            mediaRefs: userPayload.media.map(m => ({
               id: m.id,
               type: m.type,
               url: m.url,
@@ -389,9 +442,9 @@ export async function importArchiveToDb(
           const assistantMessage: MessageForExtraction = {
             messageId: nextMsgId,
             conversationId: convId,
-            content: extractTextContent(nextMsg),
+            content: assistantPayload.text,
             authorRole: 'assistant',
-            mediaRefs: extractMediaRefs(nextMsg).map(m => ({
+            mediaRefs: assistantPayload.media.map(m => ({
               id: m.id,
               type: m.type,
               url: m.url,
@@ -412,10 +465,12 @@ export async function importArchiveToDb(
           // Collect associations for enrichment
           allAssociations.push(...result.associations);
 
-          // Store associations
+          // Queue associations for storage
           if (result.associations.length > 0) {
-            const storeResult = await store.storeMediaTextAssociations(result.associations);
-            associationsCreated += storeResult.stored;
+            pendingAssociations.push(...result.associations);
+            if (pendingAssociations.length >= associationBatchSize) {
+              await flushAssociations();
+            }
 
             // Count by type
             for (const assoc of result.associations) {
@@ -428,6 +483,8 @@ export async function importArchiveToDb(
         }
       }
 
+      await flushAssociations();
+
       const extractionDurationMs = Date.now() - mediaTextStartTime;
 
       if (associationsCreated > 0) {
@@ -637,16 +694,24 @@ export async function importArchiveToDb(
       nodesFailed: messagesFailed,
       stats: {
         conversationsProcessed,
+        conversationsSkipped,
         mediaRefsLinked,
         format: archive.format,
         relationships: relationshipStats,
       },
     });
 
+    try {
+      await store.refreshImportedSourceUpdatedAt(settledRoots);
+    } catch (err) {
+      // Costs only a redundant pass over these conversations next import
+      console.warn('Failed to refresh conversation update times:', err);
+    }
+
     const durationMs = Date.now() - startTime;
 
     log(`\n✓ Import complete in ${(durationMs / 1000).toFixed(1)}s`);
-    log(`  Conversations: ${conversationsProcessed}`);
+    log(`  Conversations: ${conversationsProcessed} (${conversationsSkipped} unchanged since last import)`);
     log(`  Messages imported: ${messagesImported}`);
     log(`  Messages skipped: ${messagesSkipped}`);
     log(`  Messages failed: ${messagesFailed}`);
@@ -699,6 +764,7 @@ export async function importArchiveToDb(
       jobId: job.id,
       status: 'completed',
       conversationsProcessed,
+      conversationsSkipped,
       messagesImported,
       messagesSkipped,
       messagesFailed,
@@ -724,6 +790,7 @@ export async function importArchiveToDb(
       jobId: job.id,
       status: 'failed',
       conversationsProcessed,
+      conversationsSkipped,
       messagesImported,
       messagesSkipped,
       messagesFailed,
@@ -734,6 +801,14 @@ export async function importArchiveToDb(
   }
 }
 
+/**
+ * URI of a conversation's root node
+ */
+function conversationRootUri(conversation: Conversation, format: ExportFormat): string {
+  const convId = conversation.conversation_id || conversation.id || 'unknown';
+  return `${format}://${convId}`;
+}
+
 /**
  * Convert a Conversation to ImportedNode array
  */
@@ -746,7 +821,7 @@ function conversationToNodes(
   const convId = conversation.conversation_id || conversation.id || 'unknown';
 
   // Create conversation root node
-  const convUri = `${format}://${convId}`;
+  const convUri = conversationRootUri(conversation, format);
   const convContent = conversation.title || 'Untitled Conversation';
   const convHash = hashContent(convContent + convId);
 
@@ -785,8 +860,8 @@ function conversationToNodes(
     const msgId = (msg.id as string) || `${convId}_msg_${position}`;
     const msgUri = `${format}://${convId}/${msgId}`;
 
-    // Extract text content
-    const textContent = extractTextContent(msg);
+    // Extract text content and media references
+    const { text: textContent, media: mediaRefs } = extractMessagePayload(msg);
     if (!textContent || textContent.trim().length === 0) {
       continue; // Skip empty messages
     }
@@ -824,7 +899,6 @@ function conversationToNodes(
     };
 
     // Add media references if present
-    const mediaRefs = extractMediaRefs(msg);
     if (mediaRefs.length > 0) {
       msgNode.media = mediaRefs;
     }
@@ -865,12 +939,13 @@ function extractMessagesFromMapping(
     return messages;
   }
 
-  // BFS traversal from root, following first child (main thread)
+  // BFS traversal from root, following first child (main thread).
+  // The queue is consumed by index; shift() would re-copy it on every step.
   const visited = new Set<string>();
   const queue: string[] = [rootId];
 
-  while (queue.length > 0) {
-    const nodeId = queue.shift()!;
+  for (let head = 0; head < queue.length; head++) {
+    const nodeId = queue[head];
     if (visited.has(nodeId)) continue;
     visited.add(nodeId);
 
@@ -893,65 +968,57 @@ function extractMessagesFromMapping(
     }
   }
 
-  // Sort by create_time if available
-  messages.sort((a, b) => {
-    const timeA = (a.create_time as number) || 0;
-    const timeB = (b.create_time as number) || 0;
-    return timeA - timeB;
-  });
-
-  return messages;
-}
-
-/**
- * Extract text content from a message
- */
-function extractTextContent(message: Record<string, unknown>): string {
-  const content = message.content as { parts?: unknown[] } | undefined;
-
-  if (!content?.parts) {
-    return '';
-  }
-
-  const textParts: string[] = [];
-
-  for (const part of content.parts) {
-    if (typeof part === 'string') {
-      textParts.push(part);
-    } else if (typeof part === 'object' && part !== null) {
-      // Handle multimodal content
-      const partObj = part as { text?: string };
-      if (partObj.text) {
-        textParts.push(partObj.text);
-      }
+  // Sort by create_time if available. Read each time once, and skip the
+  // sort when BFS order is already chronological (the common case).
+  const times = messages.map((m) => (m.create_time as number) || 0);
+  let inOrder = true;
+  for (let i = 1; i < times.length; i++) {
+    if (times[i] - times[i - 1] < 0) {
+      inOrder = false;
+      break;
     }
   }
+  if (inOrder) return messages;
 
-  return textParts.join('\n');
+  return messages
+    .map((message, i) => ({ message, time: times[i] }))
+    .sort((a, b) => a.time - b.time)
+    .map((entry) => entry.message);
 }
 
 /**
- * Extract media references from a message
+ * Extract text content and media references from a message in one pass
+ * over its content parts
  */
-function extractMediaRefs(message: Record<string, unknown>): MediaReference[] {
-  const refs: MediaReference[] = [];
+function extractMessagePayload(message: Record<string, unknown>): {
+  text: string;
+  media: MediaReference[];
+} {
+  const textParts: string[] = [];
+  const media: MediaReference[] = [];
   const content = message.content as { parts?: unknown[] } | undefined;
   const metadata = message.metadata as { attachments?: unknown[] } | undefined;
 
-  // Check content parts for asset_pointers
   if (content?.parts) {
     for (const part of content.parts) {
-      if (typeof part === 'object' && part !== null) {
+      if (typeof part === 'string') {
+        textParts.push(part);
+      } else if (typeof part === 'object' && part !== null) {
+        // Handle multimodal content
         const partObj = part as {
+          text?: string;
           asset_pointer?: string;
-          content_type?: string;
           size_bytes?: number;
           width?: number;
           height?: number;
         };
 
+        if (partObj.text) {
+          textParts.push(partObj.text);
+        }
+
         if (partObj.asset_pointer) {
-          refs.push({
+          media.push({
             id: partObj.asset_pointer,
             type: 'image',
             url: partObj.asset_pointer,
@@ -978,7 +1045,7 @@ function extractMediaRefs(message: Record<string, unknown>): MediaReference[] {
         height?: number;
       };
 
-      refs.push({
+      media.push({
         id: attObj.id || attObj.name || 'unknown',
         type: mimeToMediaType(attObj.mimeType),
         mimeType: attObj.mimeType,
@@ -991,7 +1058,7 @@ function extractMediaRefs(message: Record<string, unknown>): MediaReference[] {
     }
   }
 
-  return refs;
+  return { text: textParts.join('\n'), media };
 }
 
 /**
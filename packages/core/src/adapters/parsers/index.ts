@@ -28,7 +28,7 @@ export { SubstackParser } from './SubstackParser.js';
 
 // Media indexing and matching
 export { ComprehensiveMediaIndexer } from './ComprehensiveMediaIndexer.js';
-export type { FileMetadata, MediaIndex, IndexStats } from './ComprehensiveMediaIndexer.js';
+export type { FileMetadata, MediaIndex, IndexStats, SizeBucket } from './ComprehensiveMediaIndexer.js';
 
 export { ComprehensiveMediaMatcher } from './ComprehensiveMediaMatcher.js';
 export type { MatcherStats, ConversationWithMedia } from './ComprehensiveMediaMatcher.js';
@@ -87,6 +87,8 @@ export type { ImportResult as ArchiveImportResult } from './import-to-db.js';
 export {
   extractZip,
   findFiles,
+  retainFileListing,
+  releaseFileListing,
   hashFile,
   hashContent,
   sanitizeFilename,
@@ -101,6 +103,7 @@ export {
   deepClone,
   extractFileId,
   readJSON,
+  readJSONFiles,
   writeJSON,
   generateId,
   isDirectoryNonEmpty,
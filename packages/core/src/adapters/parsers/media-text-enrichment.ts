@@ -135,8 +135,8 @@ export class MediaTextEnrichmentService {
     const transcripts: string[] = [];
     const descriptions: string[] = [];
     const captions: string[] = [];
-    const mediaIds: string[] = [];
-    const associationTypes: string[] = [];
+    const mediaIds = new Set<string>();
+    const associationTypes = new Set<string>();
     let totalConfidence = 0;
     let confidenceCount = 0;
 
@@ -149,15 +149,11 @@ export class MediaTextEnrichmentService {
     for (const assoc of validAssociations) {
       if (!assoc.extractedText) continue;
 
-      // Track media IDs
-      if (assoc.mediaId && !mediaIds.includes(assoc.mediaId)) {
-        mediaIds.push(assoc.mediaId);
-      }
-
-      // Track association types
-      if (!associationTypes.includes(assoc.associationType)) {
-        associationTypes.push(assoc.associationType);
+      // Track media IDs and association types (deduplicated as they arrive)
+      if (assoc.mediaId) {
+        mediaIds.add(assoc.mediaId);
       }
+      associationTypes.add(assoc.associationType);
 
       // Accumulate confidence
       if (assoc.confidence) {
@@ -215,8 +211,8 @@ export class MediaTextEnrichmentService {
       captions,
       combined,
       confidence: avgConfidence,
-      mediaIds,
-      associationTypes,
+      mediaIds: [...mediaIds],
+      associationTypes: [...associationTypes],
       wordCount: this.countWords(combined),
     };
   }
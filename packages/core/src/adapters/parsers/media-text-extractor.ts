@@ -66,6 +66,23 @@ export interface MediaTextExtractionResult {
   extractionMethod: string;
 }
 
+/**
+ * Media and text blocks scanned out of a user/assistant pair
+ *
+ * Built once per pair and shared by the generic and gizmo extractors, so
+ * each message body is regex-scanned only once.
+ */
+export interface MessagePairContent {
+  /** Media in the user message */
+  userMedia: ExtractedMedia[];
+  /** Media in the assistant message */
+  assistantMedia: ExtractedMedia[];
+  /** Code blocks in the assistant message */
+  codeBlocks: ExtractedTextBlock[];
+  /** Markdown tables in the assistant message */
+  tables: ExtractedTextBlock[];
+}
+
 /**
  * Message content to analyze
  */
@@ -116,15 +133,18 @@ const CODE_BLOCK_PATTERN = /```(\w*)\n([\s\S]*?)```/g;
 /** Pattern for markdown tables */
 const TABLE_PATTERN = /\|[^\n]+\|\n\|[-:\s|]+\|\n((?:\|[^\n]+\|\n?)+)/g;
 
-/** Pattern for file-service pointers */
-const FILE_SERVICE_PATTERN = /file-service:\/\/file-([A-Za-z0-9]+)/g;
-
-/** Pattern for sediment pointers */
-const SEDIMENT_PATTERN = /sediment:\/\/file_([A-Za-z0-9]+)/g;
+/** Pattern for file-service:// and sediment:// pointers (one pass for both) */
+const POINTER_PATTERN = /(?:file-service:\/\/file-|sediment:\/\/file_)([A-Za-z0-9]+)/g;
 
 /** Pattern for asset_pointer references */
 const ASSET_POINTER_PATTERN = /"asset_pointer"\s*:\s*"([^"]+)"/g;
 
+/** File ID inside an asset_pointer value */
+const ASSET_FILE_ID_PATTERN = /file-([A-Za-z0-9]+)/;
+
+// The global patterns above are shared: each scan resets lastIndex to 0
+// instead of cloning the RegExp on every call.
+
 // ═══════════════════════════════════════════════════════════════════
 // EXTRACTION FUNCTIONS
 // ═══════════════════════════════════════════════════════════════════
@@ -134,53 +154,41 @@ const ASSET_POINTER_PATTERN = /"asset_pointer"\s*:\s*"([^"]+)"/g;
  */
 export function extractMediaFromContent(content: string): ExtractedMedia[] {
   const media: ExtractedMedia[] = [];
+  const seen = new Set<string>();
   let position = 0;
 
-  // Extract file-service:// pointers
-  let match: RegExpExecArray | null;
-  const fileServicePattern = new RegExp(FILE_SERVICE_PATTERN);
-  while ((match = fileServicePattern.exec(content)) !== null) {
-    media.push({
-      mediaId: `file-${match[1]}`,
-      pointer: match[0],
-      type: 'image',
-      position: position++,
-    });
-  }
+  // Positions count every pointer found; duplicates keep the first entry
+  const add = (mediaId: string, pointer: string): void => {
+    const at = position++;
+    if (seen.has(mediaId)) return;
+    seen.add(mediaId);
+    media.push({ mediaId, pointer, type: 'image', position: at });
+  };
 
-  // Extract sediment:// pointers
-  const sedimentPattern = new RegExp(SEDIMENT_PATTERN);
-  while ((match = sedimentPattern.exec(content)) !== null) {
-    media.push({
-      mediaId: `file-${match[1]}`,
-      pointer: match[0],
-      type: 'image',
-      position: position++,
-    });
+  // Most messages are plain text: a substring check is far cheaper than
+  // starting a regex scan that will find nothing
+  let match: RegExpExecArray | null;
+  if (content.includes('://')) {
+    // Extract file-service:// and sediment:// pointers in document order
+    POINTER_PATTERN.lastIndex = 0;
+    while ((match = POINTER_PATTERN.exec(content)) !== null) {
+      add(`file-${match[1]}`, match[0]);
+    }
   }
 
   // Extract asset_pointer references
-  const assetPattern = new RegExp(ASSET_POINTER_PATTERN);
-  while ((match = assetPattern.exec(content)) !== null) {
-    const pointer = match[1];
-    const idMatch = pointer.match(/file-([A-Za-z0-9]+)/);
-    if (idMatch) {
-      media.push({
-        mediaId: `file-${idMatch[1]}`,
-        pointer,
-        type: 'image',
-        position: position++,
-      });
+  if (content.includes('"asset_pointer"')) {
+    ASSET_POINTER_PATTERN.lastIndex = 0;
+    while ((match = ASSET_POINTER_PATTERN.exec(content)) !== null) {
+      const pointer = match[1];
+      const idMatch = ASSET_FILE_ID_PATTERN.exec(pointer);
+      if (idMatch) {
+        add(`file-${idMatch[1]}`, pointer);
+      }
     }
   }
 
-  // Deduplicate by mediaId
-  const seen = new Set<string>();
-  return media.filter((m) => {
-    if (seen.has(m.mediaId)) return false;
-    seen.add(m.mediaId);
-    return true;
-  });
+  return media;
 }
 
 /**
@@ -202,10 +210,11 @@ export function extractMediaFromRefs(
  */
 export function extractCodeBlocks(content: string): ExtractedTextBlock[] {
   const blocks: ExtractedTextBlock[] = [];
-  const pattern = new RegExp(CODE_BLOCK_PATTERN);
+  if (!content.includes('```')) return blocks;
   let match: RegExpExecArray | null;
 
-  while ((match = pattern.exec(content)) !== null) {
+  CODE_BLOCK_PATTERN.lastIndex = 0;
+  while ((match = CODE_BLOCK_PATTERN.exec(content)) !== null) {
     const language = match[1] || undefined;
     const text = match[2].trim();
 
@@ -228,10 +237,11 @@ export function extractCodeBlocks(content: string): ExtractedTextBlock[] {
  */
 export function extractTables(content: string): ExtractedTextBlock[] {
   const blocks: ExtractedTextBlock[] = [];
-  const pattern = new RegExp(TABLE_PATTERN);
+  if (!content.includes('|')) return blocks;
   let match: RegExpExecArray | null;
 
-  while ((match = pattern.exec(content)) !== null) {
+  TABLE_PATTERN.lastIndex = 0;
+  while ((match = TABLE_PATTERN.exec(content)) !== null) {
     const text = match[0].trim();
 
     if (text.length > 0) {
@@ -281,6 +291,23 @@ export function parseTable(tableText: string): Array<Record<string, string>> {
   return rows;
 }
 
+/**
+ * Scan a user/assistant pair for media and text blocks
+ */
+export function scanMessagePair(
+  userMessage: MessageForExtraction,
+  assistantMessage: MessageForExtraction
+): MessagePairContent {
+  return {
+    userMedia: userMessage.mediaRefs
+      ? extractMediaFromRefs(userMessage.mediaRefs)
+      : extractMediaFromContent(userMessage.content),
+    assistantMedia: extractMediaFromContent(assistantMessage.content),
+    codeBlocks: extractCodeBlocks(assistantMessage.content),
+    tables: extractTables(assistantMessage.content),
+  };
+}
+
 // ═══════════════════════════════════════════════════════════════════
 // GIZMO-SPECIFIC EXTRACTORS
 // ═══════════════════════════════════════════════════════════════════
@@ -295,20 +322,17 @@ export function parseTable(tableText: string): Array<Record<string, string>> {
  */
 export function extractJournalRecognizerOCR(
   userMessage: MessageForExtraction,
-  assistantMessage: MessageForExtraction
+  assistantMessage: MessageForExtraction,
+  pair: MessagePairContent = scanMessagePair(userMessage, assistantMessage)
 ): Omit<MediaTextAssociation, 'id' | 'createdAt'>[] {
   const associations: Omit<MediaTextAssociation, 'id' | 'createdAt'>[] = [];
 
-  // Get media from user message
-  const userMedia = userMessage.mediaRefs
-    ? extractMediaFromRefs(userMessage.mediaRefs)
-    : extractMediaFromContent(userMessage.content);
+  // Media from the user message, code blocks (OCR transcript) from the
+  // assistant response
+  const { userMedia, codeBlocks } = pair;
 
   if (userMedia.length === 0) return associations;
 
-  // Get code blocks from assistant response (OCR transcript)
-  const codeBlocks = extractCodeBlocks(assistantMessage.content);
-
   // If we have media and code blocks, create associations
   if (codeBlocks.length > 0) {
     // Generate batch ID if multiple images
@@ -354,20 +378,14 @@ export function extractJournalRecognizerOCR(
 export function extractImageEchoDescription(
   userMessage: MessageForExtraction,
   assistantMessage: MessageForExtraction,
-  previousEchoMediaId?: string
+  previousEchoMediaId?: string,
+  pair: MessagePairContent = scanMessagePair(userMessage, assistantMessage)
 ): Omit<MediaTextAssociation, 'id' | 'createdAt'>[] {
   const associations: Omit<MediaTextAssociation, 'id' | 'createdAt'>[] = [];
 
-  // Get media from user message (uploaded image)
-  const userMedia = userMessage.mediaRefs
-    ? extractMediaFromRefs(userMessage.mediaRefs)
-    : extractMediaFromContent(userMessage.content);
-
-  // Get generated media from assistant message (echo image)
-  const assistantMedia = extractMediaFromContent(assistantMessage.content);
-
-  // Get tables from assistant response (title/description)
-  const tables = extractTables(assistantMessage.content);
+  // Uploaded images (user), echo images (assistant), and the
+  // title/description tables from the assistant response
+  const { userMedia, assistantMedia, tables } = pair;
 
   // Parse tables for title/description
   for (const table of tables) {
@@ -486,23 +504,20 @@ export function extractMediaTextAssociations(
     (assistantMessage.metadata?.gizmo_id as string) ||
     (userMessage.metadata?.gizmo_id as string);
 
-  // Extract media from both messages
-  const userMedia = userMessage.mediaRefs
-    ? extractMediaFromRefs(userMessage.mediaRefs)
-    : extractMediaFromContent(userMessage.content);
-
-  const assistantMedia = extractMediaFromContent(assistantMessage.content);
+  // Scan both messages once; the gizmo extractors reuse the results
+  const pair = scanMessagePair(userMessage, assistantMessage);
+  const { userMedia, assistantMedia } = pair;
   const allMedia = [...userMedia, ...assistantMedia];
 
   // Extract text blocks
   const textBlocks: ExtractedTextBlock[] = [];
 
   if (!skipCodeBlocks) {
-    textBlocks.push(...extractCodeBlocks(assistantMessage.content));
+    textBlocks.push(...pair.codeBlocks);
   }
 
   if (!skipTables) {
-    textBlocks.push(...extractTables(assistantMessage.content));
+    textBlocks.push(...pair.tables);
   }
 
   // Filter by minimum length
@@ -513,10 +528,10 @@ export function extractMediaTextAssociations(
   let extractionMethod = 'generic';
 
   if (gizmoId === KNOWN_GIZMO_IDS.JOURNAL_RECOGNIZER_OCR) {
-    associations = extractJournalRecognizerOCR(userMessage, assistantMessage);
+    associations = extractJournalRecognizerOCR(userMessage, assistantMessage, pair);
     extractionMethod = 'journal-recognizer';
   } else if (gizmoId === KNOWN_GIZMO_IDS.IMAGE_ECHO_BOUNCE) {
-    associations = extractImageEchoDescription(userMessage, assistantMessage);
+    associations = extractImageEchoDescription(userMessage, assistantMessage, undefined, pair);
     extractionMethod = 'image-echo-bounce';
   } else if (allMedia.length > 0 && filteredBlocks.length > 0) {
     // Generic extraction: link all media to all text blocks
@@ -100,6 +100,86 @@ export async function extractZip(zipPath: string, outputDir: string): Promise<vo
   }
 }
 
+/**
+ * Cached full file listings, keyed by root directory
+ *
+ * Format detection and parsing each search the same extracted archive
+ * (Facebook and OpenAI detection both walk the whole tree), so a listing
+ * taken once per parse serves every later findFiles call beneath it.
+ */
+const fileListings = new Map<string, FileListing>();
+
+interface FileListing {
+  /** Every file under the root, in walk order */
+  files: string[];
+  /** [start, end) range of files under each directory */
+  dirs: Map<string, [number, number]>;
+  refs: number;
+}
+
+/**
+ * Walk a directory once and serve later findFiles calls under it from
+ * memory until releaseFileListing. The tree must not change meanwhile.
+ */
+export function retainFileListing(dir: string): void {
+  const root = path.resolve(dir);
+  const listing = fileListings.get(root);
+  if (listing) {
+    listing.refs++;
+  } else {
+    const files = walkFiles(root, () => true, []);
+    fileListings.set(root, { files, dirs: indexDirectories(root, files), refs: 1 });
+  }
+}
+
+/**
+ * Drop a listing taken with retainFileListing
+ */
+export function releaseFileListing(dir: string): void {
+  const root = path.resolve(dir);
+  const listing = fileListings.get(root);
+  if (listing && --listing.refs === 0) {
+    fileListings.delete(root);
+  }
+}
+
+/**
+ * Map each directory below root to the range of its files in a walk
+ *
+ * The walk is depth-first, so everything under a directory is contiguous.
+ */
+function indexDirectories(root: string, files: string[]): Map<string, [number, number]> {
+  const dirs = new Map<string, [number, number]>();
+  files.forEach((file, i) => {
+    for (let dir = path.dirname(file); dir !== root && dir.startsWith(root); dir = path.dirname(dir)) {
+      const range = dirs.get(dir);
+      if (range) {
+        range[1] = i + 1;
+      } else {
+        dirs.set(dir, [i, i + 1]);
+      }
+    }
+  });
+  return dirs;
+}
+
+/**
+ * Files under dir from a retained listing, in walk order, if one covers it
+ */
+function cachedFilesUnder(dir: string): string[] | undefined {
+  if (fileListings.size === 0) return undefined;
+
+  const target = path.resolve(dir);
+  for (const [root, listing] of fileListings) {
+    if (target === root) return listing.files;
+    if (target.startsWith(root + path.sep)) {
+      const range = listing.dirs.get(target);
+      return range ? listing.files.slice(range[0], range[1]) : [];
+    }
+  }
+  return undefined;
+}
+
 /**
  * Recursively find all files matching a pattern
  */
@@ -107,31 +187,75 @@ export function findFiles(
   dir: string,
   pattern: RegExp | string,
   results: string[] = []
+): string[] {
+  // Test pattern against full path for path-based patterns (like Facebook's inbox path)
+  // or against filename for simple filename patterns
+  const matches = (filePath: string) =>
+    pattern instanceof RegExp
+      ? pattern.test(filePath)
+      : path.basename(filePath).includes(pattern);
+
+  const cached = cachedFilesUnder(dir);
+  if (cached) {
+    // Listings hold resolved paths; map back onto the caller's dir spelling
+    const target = path.resolve(dir);
+    for (const file of cached) {
+      const filePath = target === dir ? file : path.join(dir, path.relative(target, file));
+      if (matches(filePath)) results.push(filePath);
+    }
+    return results;
+  }
+
+  return walkFiles(dir, matches, results);
+}
+
+/**
+ * Depth-first walk collecting files that satisfy a predicate
+ *
+ * Symlinks are followed. Dangling links are skipped, and each symlinked
+ * directory is entered at most once (by real path), so link cycles end.
+ */
+function walkFiles(
+  dir: string,
+  matches: (filePath: string) => boolean,
+  results: string[],
+  linkedDirs?: Set<string>
 ): string[] {
   if (!fs.existsSync(dir)) {
     return results;
   }
 
-  const files = fs.readdirSync(dir);
+  // Seeded with the root so a link back to it is skipped immediately
+  linkedDirs ??= new Set([fs.realpathSync(dir)]);
+
+  // Dirent types come from the directory read itself, so only symlinks
+  // need a stat to learn what they point at
+  const entries = fs.readdirSync(dir, { withFileTypes: true });
 
-  for (const file of files) {
+  for (const entry of entries) {
+    const file = entry.name;
     const filePath = path.join(dir, file);
-    const stat = fs.statSync(filePath);
-
-    if (stat.isDirectory()) {
-      findFiles(filePath, pattern, results);
-    } else {
-      // Test pattern against full path for path-based patterns (like Facebook's inbox path)
-      // or against filename for simple filename patterns
-      const matches =
-        pattern instanceof RegExp
-          ? pattern.test(filePath)
-          : file.includes(pattern);
-
-      if (matches) {
-        results.push(filePath);
+
+    let isDirectory = entry.isDirectory();
+    if (entry.isSymbolicLink()) {
+      try {
+        isDirectory = fs.statSync(filePath).isDirectory();
+        if (isDirectory) {
+          const target = fs.realpathSync(filePath);
+          if (linkedDirs.has(target)) continue;
+          linkedDirs.add(target);
+        }
+      } catch {
+        // Dangling link
+        continue;
       }
     }
+
+    if (isDirectory) {
+      walkFiles(filePath, matches, results, linkedDirs);
+    } else if (matches(filePath)) {
+      results.push(filePath);
+    }
   }
 
   return results;
@@ -187,11 +311,88 @@ export function generateFolderName(
   return `${date}_${safeTitle}_${paddedIndex}`;
 }
 
+/**
+ * Read `count` ASCII digits starting at `start`; -1 if any is not a digit
+ */
+function readDigits(value: string, start: number, count: number): number {
+  let n = 0;
+  for (let i = start; i < start + count; i++) {
+    const d = value.charCodeAt(i) - 48;
+    if (d < 0 || d > 9) return -1;
+    n = n * 10 + d;
+  }
+  return n;
+}
+
+/**
+ * Parse a canonical UTC ISO 8601 timestamp (`YYYY-MM-DDTHH:MM:SS[.fff...]Z`,
+ * the form most exports write) straight from its character codes.
+ *
+ * Returns epoch milliseconds, or undefined for any other shape or an
+ * out-of-range field, in which case the caller falls back to Date parsing.
+ * Fractions are truncated to milliseconds, as Date parsing does.
+ */
+function parseIsoUtc(value: string): number | undefined {
+  const length = value.length;
+  if (
+    length < 20 ||
+    value.charCodeAt(length - 1) !== 0x5a || // Z
+    value.charCodeAt(4) !== 0x2d || // -
+    value.charCodeAt(7) !== 0x2d ||
+    value.charCodeAt(10) !== 0x54 || // T
+    value.charCodeAt(13) !== 0x3a || // :
+    value.charCodeAt(16) !== 0x3a
+  ) {
+    return undefined;
+  }
+
+  const year = readDigits(value, 0, 4);
+  const month = readDigits(value, 5, 2);
+  const day = readDigits(value, 8, 2);
+  const hour = readDigits(value, 11, 2);
+  const minute = readDigits(value, 14, 2);
+  const second = readDigits(value, 17, 2);
+
+  // Date.UTC maps years 0-99 to 1900-1999, and would silently roll over
+  // fields that Date parsing rejects; leave those cases to Date
+  if (
+    year < 100 ||
+    month < 1 || month > 12 ||
+    day < 1 || day > 31 ||
+    hour < 0 || hour > 23 ||
+    minute < 0 || minute > 59 ||
+    second < 0 || second > 59
+  ) {
+    return undefined;
+  }
+
+  let ms = 0;
+  if (length > 20) {
+    // Fraction: '.' then 1-9 digits, up to the trailing Z
+    if (
+      length < 22 ||
+      length > 30 ||
+      value.charCodeAt(19) !== 0x2e ||
+      readDigits(value, 20, length - 21) < 0
+    ) {
+      return undefined;
+    }
+    const digits = Math.min(length - 21, 3);
+    ms = readDigits(value, 20, digits) * (digits === 1 ? 100 : digits === 2 ? 10 : 1);
+  }
+
+  return Date.UTC(year, month - 1, day, hour, minute, second, ms);
+}
+
 /**
  * Parse ISO 8601 timestamp to Unix timestamp
+ *
+ * Canonical UTC strings (every Claude export timestamp) are read directly
+ * without allocating a Date; other forms go through Date parsing.
  */
 export function parseISOTimestamp(isoString: string): number {
-  return Math.floor(new Date(isoString).getTime() / 1000);
+  const ms = parseIsoUtc(isoString) ?? new Date(isoString).getTime();
+  return Math.floor(ms / 1000);
 }
 
 /**
@@ -290,6 +491,45 @@ export function readJSON<T>(filePath: string): T | null {
   }
 }
 
+/**
+ * Read several JSON files with a bounded number of reads in flight
+ *
+ * Yields `[filePath, data]` pairs in input order, so the caller can work on
+ * one file while the next ones are still being read. `data` is null for
+ * files that fail to read or parse, as with readJSON.
+ *
+ * @param decode Optional rewrite of the raw text before it is parsed
+ */
+export async function* readJSONFiles<T>(
+  filePaths: string[],
+  concurrency: number = 4,
+  decode?: (content: string) => string
+): AsyncGenerator<[string, T | null], void, undefined> {
+  const read = async (filePath: string): Promise<T | null> => {
+    try {
+      const content = await fs.promises.readFile(filePath, 'utf-8');
+      return JSON.parse(decode ? decode(content) : content) as T;
+    } catch (err) {
+      console.error(`Failed to read JSON: ${filePath}`, err);
+      return null;
+    }
+  };
+
+  const inFlight: Promise<T | null>[] = [];
+  let next = 0;
+  for (; next < Math.min(concurrency, filePaths.length); next++) {
+    inFlight.push(read(filePaths[next]));
+  }
+
+  for (let i = 0; i < filePaths.length; i++) {
+    const data = await inFlight.shift()!;
+    if (next < filePaths.length) {
+      inFlight.push(read(filePaths[next++]));
+    }
+    yield [filePaths[i], data];
+  }
+}
+
 /**
  * Write JSON file with pretty formatting
  */
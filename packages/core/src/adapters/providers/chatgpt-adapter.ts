@@ -129,18 +129,16 @@ export class ChatGPTAdapter extends BaseAdapter {
       // Check for conversations.json (bulk export)
       const conversationsPath = join(path, 'conversations.json');
       if (await this.fileExists(conversationsPath)) {
-        // Verify it's OpenAI format
-        const sample = await this.readJson<unknown[]>(conversationsPath);
-        if (Array.isArray(sample) && sample.length > 0) {
-          const first = sample[0] as Record<string, unknown>;
-          if ('mapping' in first && 'create_time' in first) {
-            return {
-              canHandle: true,
-              confidence: 0.95,
-              format: 'openai-export',
-              reason: 'Found conversations.json with OpenAI structure',
-            };
-          }
+        // Verify it's OpenAI format (only the first conversation is parsed)
+        const first = await this.readFirstJsonArrayItem<Record<string, unknown>>(conversationsPath)
+          .catch(() => undefined);
+        if (first && 'mapping' in first && 'create_time' in first) {
+          return {
+            canHandle: true,
+            confidence: 0.95,
+            format: 'openai-export',
+            reason: 'Found conversations.json with OpenAI structure',
+          };
         }
       }
 
@@ -212,19 +210,21 @@ export class ChatGPTAdapter extends BaseAdapter {
     // Check for conversations
     const conversationsPath = join(source.path, 'conversations.json');
     if (await this.fileExists(conversationsPath)) {
-      const conversations = await this.readJson<OpenAIConversation[]>(conversationsPath);
-      if (!Array.isArray(conversations)) {
+      try {
+        const first = await this.readFirstJsonArrayItem<OpenAIConversation>(conversationsPath);
+        if (first === undefined) {
+          warnings.push({
+            code: 'EMPTY_EXPORT',
+            message: 'No conversations found in export',
+            path: conversationsPath,
+          });
+        }
+      } catch {
         errors.push({
           code: 'INVALID_STRUCTURE',
           message: 'conversations.json is not an array',
           path: conversationsPath,
         });
-      } else if (conversations.length === 0) {
-        warnings.push({
-          code: 'EMPTY_EXPORT',
-          message: 'No conversations found in export',
-          path: conversationsPath,
-        });
       }
     }
 
@@ -247,12 +247,10 @@ export class ChatGPTAdapter extends BaseAdapter {
     let latestDate: Date | undefined;
     const contentTypes = new Set<string>();
 
-    // Load conversations to get counts
+    // Stream conversations to get counts
     const conversationsPath = join(source.path, 'conversations.json');
     if (await this.fileExists(conversationsPath)) {
-      const conversations = await this.readJson<OpenAIConversation[]>(conversationsPath);
-
-      for (const conv of conversations) {
+      for await (const conv of this.streamJsonArray<OpenAIConversation>(conversationsPath)) {
         estimatedCount++; // Count conversation
         contentTypes.add('chatgpt-conversation');
 
@@ -316,23 +314,23 @@ export class ChatGPTAdapter extends BaseAdapter {
     source: AdapterSource,
     _options: ParseOptions
   ): AsyncGenerator<ImportedNode, void, undefined> {
-    let conversations: OpenAIConversation[];
+    let conversations: AsyncIterable<OpenAIConversation> | OpenAIConversation[];
 
     const bulkPath = join(source.path, 'conversations.json');
     const singlePath = join(source.path, 'conversation.json');
 
     if (await this.fileExists(bulkPath)) {
-      conversations = await this.readJson<OpenAIConversation[]>(bulkPath);
+      // Stream the bulk export one conversation at a time
+      conversations = this.streamJsonArrayWithProgress<OpenAIConversation>(bulkPath);
     } else if (await this.fileExists(singlePath)) {
       const single = await this.readJson<OpenAIConversation>(singlePath);
       conversations = [single];
+      this.updateProgress({ total: 1 });
     } else {
       return;
     }
 
-    this.updateProgress({ total: conversations.length });
-
-    for (const conv of conversations) {
+    for await (const conv of conversations) {
       // Yield conversation node
       yield this.conversationToNode(conv);
 
@@ -481,11 +479,17 @@ export class ChatGPTAdapter extends BaseAdapter {
   }
 
   private extractContent(message: OpenAIMessage): string {
-    if (!message.content?.parts) return '';
+    const contentParts = message.content?.parts;
+    if (!contentParts) return '';
+
+    // Nearly every message is a single plain-text part; skip the copy and join
+    if (contentParts.length === 1 && typeof contentParts[0] === 'string') {
+      return contentParts[0];
+    }
 
     const parts: string[] = [];
 
-    for (const part of message.content.parts) {
+    for (const part of contentParts) {
       if (typeof part === 'string') {
         parts.push(part);
       } else if (part.content_type === 'text' && 'text' in part) {
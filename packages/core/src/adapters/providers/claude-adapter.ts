@@ -97,35 +97,33 @@ export class ClaudeAdapter extends BaseAdapter {
       const hasConversations = await this.fileExists(conversationsPath);
       const hasUsers = await this.fileExists(usersPath);
 
-      if (hasConversations && hasUsers) {
+      // Only the first conversation is needed to recognize the format
+      const first = hasConversations
+        ? await this.readFirstJsonArrayItem<ClaudeConversation>(conversationsPath)
+            .catch(() => undefined)
+        : undefined;
+
+      if (first && hasUsers) {
         // Verify Claude format (has uuid, chat_messages)
-        const conversations = await this.readJson<ClaudeConversation[]>(conversationsPath);
-        if (Array.isArray(conversations) && conversations.length > 0) {
-          const first = conversations[0];
-          if ('uuid' in first && 'chat_messages' in first) {
-            return {
-              canHandle: true,
-              confidence: 0.95,
-              format: 'claude-export',
-              reason: 'Found conversations.json with Claude structure and users.json',
-            };
-          }
+        if ('uuid' in first && 'chat_messages' in first) {
+          return {
+            canHandle: true,
+            confidence: 0.95,
+            format: 'claude-export',
+            reason: 'Found conversations.json with Claude structure and users.json',
+          };
         }
       }
 
       // Check for just conversations.json with Claude structure
-      if (hasConversations) {
-        const conversations = await this.readJson<ClaudeConversation[]>(conversationsPath);
-        if (Array.isArray(conversations) && conversations.length > 0) {
-          const first = conversations[0];
-          if ('uuid' in first && 'chat_messages' in first && 'sender' in (first.chat_messages?.[0] || {})) {
-            return {
-              canHandle: true,
-              confidence: 0.85,
-              format: 'claude-export',
-              reason: 'Found conversations.json with Claude message structure',
-            };
-          }
+      if (first) {
+        if ('uuid' in first && 'chat_messages' in first && 'sender' in (first.chat_messages?.[0] || {})) {
+          return {
+            canHandle: true,
+            confidence: 0.85,
+            format: 'claude-export',
+            reason: 'Found conversations.json with Claude message structure',
+          };
         }
       }
 
@@ -162,9 +160,9 @@ export class ClaudeAdapter extends BaseAdapter {
     }
 
     const conversationsPath = join(source.path, 'conversations.json');
-    const conversations = await this.readJson<ClaudeConversation[]>(conversationsPath);
+    const first = await this.readFirstJsonArrayItem<ClaudeConversation>(conversationsPath);
 
-    if (conversations.length === 0) {
+    if (first === undefined) {
       warnings.push({
         code: 'EMPTY_EXPORT',
         message: 'No conversations found in export',
@@ -213,9 +211,7 @@ export class ClaudeAdapter extends BaseAdapter {
     // Parse conversations
     const conversationsPath = join(source.path, 'conversations.json');
     if (await this.fileExists(conversationsPath)) {
-      const conversations = await this.readJson<ClaudeConversation[]>(conversationsPath);
-
-      for (const conv of conversations) {
+      for await (const conv of this.streamJsonArray<ClaudeConversation>(conversationsPath)) {
         estimatedCount++; // Conversation node
         contentTypes.add('claude-conversation');
 
@@ -259,11 +255,9 @@ export class ClaudeAdapter extends BaseAdapter {
     _options: ParseOptions
   ): AsyncGenerator<ImportedNode, void, undefined> {
     const conversationsPath = join(source.path, 'conversations.json');
-    const conversations = await this.readJson<ClaudeConversation[]>(conversationsPath);
-
-    this.updateProgress({ total: conversations.length });
 
-    for (const conv of conversations) {
+    // Stream one conversation at a time rather than parsing the whole export
+    for await (const conv of this.streamJsonArrayWithProgress<ClaudeConversation>(conversationsPath)) {
       // Yield conversation node
       yield this.conversationToNode(conv);
 
@@ -778,9 +778,10 @@ export class AgenticSearchService {
 
     // Convert to AgenticSearchResult
     const results: AgenticSearchResult[] = [];
+    const excludeIds = new Set(options.excludeIds);
     for (const fused of fusedResults) {
       // Apply exclusions
-      if (options.excludeIds?.includes(fused.id)) {
+      if (excludeIds.has(fused.id)) {
         stats.excludedManually++;
         continue;
       }
@@ -466,6 +466,23 @@ describe('UnifiedStore', () => {
       expect(store.hasBooksStore()).toBe(true);
     });
   });
+
+  describe('getNodes', () => {
+    it('fetches archive nodes in one query and asks books only for the rest', async () => {
+      const mockArchive = createMockArchiveStore();
+      mockArchive.getNodes.mockResolvedValue([{ id: 'a' }, { id: 'c' }]);
+      const stubBooks = new StubBooksStore({ available: true });
+      const booksGetNodes = vi.spyOn(stubBooks, 'getNodes');
+      const store = new UnifiedStore(mockArchive as any, stubBooks);
+
+      const nodes = await store.getNodes(['a', 'b', 'c']);
+
+      expect(nodes.map((n) => n.id)).toEqual(['a', 'c']);
+      expect(mockArchive.getNodes).toHaveBeenCalledTimes(1);
+      expect(mockArchive.getNode).not.toHaveBeenCalled();
+      expect(booksGetNodes).toHaveBeenCalledWith(['b']);
+    });
+  });
 });
 
 // ═══════════════════════════════════════════════════════════════════
@@ -683,6 +700,7 @@ describe('Constants', () => {
 function createMockArchiveStore() {
   return {
     getNode: vi.fn().mockResolvedValue(undefined),
+    getNodes: vi.fn().mockResolvedValue([]),
     getEmbedding: vi.fn().mockResolvedValue(undefined),
     searchByEmbedding: vi.fn().mockResolvedValue([]),
     searchByKeyword: vi.fn().mockResolvedValue([]),
@@ -238,13 +238,8 @@ export class UnifiedStore {
     // Query archive if target includes it
     if (target === 'archive' || target === 'all') {
       if (ids && ids.length > 0) {
-        // Get specific nodes by ID
-        for (const id of ids) {
-          const node = await this.archiveStore.getNode(id);
-          if (node) {
-            archiveNodes.push(node);
-          }
-        }
+        // Get specific nodes by ID (one query)
+        archiveNodes.push(...(await this.archiveStore.getNodes(ids)));
       } else {
         // Query with filters
         const result = await this.archiveStore.queryNodes({
@@ -297,18 +292,10 @@ export class UnifiedStore {
    * Get nodes by IDs from both stores.
    */
   async getNodes(ids: string[]): Promise<Array<StoredNode | BookNode>> {
-    const nodes: Array<StoredNode | BookNode> = [];
-    const notFoundInArchive: string[] = [];
-
-    // Try archive first
-    for (const id of ids) {
-      const node = await this.archiveStore.getNode(id);
-      if (node) {
-        nodes.push(node);
-      } else {
-        notFoundInArchive.push(id);
-      }
-    }
+    // Try archive first, in one query
+    const nodes: Array<StoredNode | BookNode> = await this.archiveStore.getNodes(ids);
+    const foundInArchive = new Set(nodes.map((node) => node.id));
+    const notFoundInArchive = ids.filter((id) => !foundInArchive.has(id));
 
     // Try books for remaining IDs
     if (notFoundInArchive.length > 0 && this.hasBooksStore()) {
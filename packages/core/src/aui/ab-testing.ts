@@ -421,13 +421,13 @@ export class ABTestManager {
       throw new Error(`Test not found: ${testId}`);
     }
 
-    const samples = this.samples.get(testId) ?? [];
-    const controlSamples = samples.filter((s) => s.variant === 'control');
-    const treatmentSamples = samples.filter((s) => s.variant === 'treatment');
-
-    // Calculate aggregate metrics
-    const controlMetrics = this.aggregateMetrics(controlSamples, test.metrics);
-    const treatmentMetrics = this.aggregateMetrics(treatmentSamples, test.metrics);
+    // Split by variant in a single pass
+    const controlSamples: ABTestSample[] = [];
+    const treatmentSamples: ABTestSample[] = [];
+    for (const sample of this.samples.get(testId) ?? []) {
+      if (sample.variant === 'control') controlSamples.push(sample);
+      else if (sample.variant === 'treatment') treatmentSamples.push(sample);
+    }
 
     // Statistical analysis
     const statistics = this.calculateStatistics(
@@ -437,6 +437,14 @@ export class ABTestManager {
       test.significanceThreshold ?? this.options.defaultSignificanceThreshold
     );
 
+    // Aggregate metrics are the per-variant means computed above
+    const controlMetrics: Record<string, number> = {};
+    const treatmentMetrics: Record<string, number> = {};
+    for (const metric of test.metrics) {
+      controlMetrics[metric] = statistics.metricAnalysis[metric].controlMean;
+      treatmentMetrics[metric] = statistics.metricAnalysis[metric].treatmentMean;
+    }
+
     // Determine winner
     const hasMinimumSamples =
       controlSamples.length >= test.minSampleSize &&
@@ -464,25 +472,6 @@ export class ABTestManager {
     };
   }
 
-  /**
-   * Calculate aggregate metrics from samples
-   */
-  private aggregateMetrics(
-    samples: ABTestSample[],
-    metricNames: string[]
-  ): Record<string, number> {
-    if (samples.length === 0) {
-      return Object.fromEntries(metricNames.map((m) => [m, 0]));
-    }
-
-    const result: Record<string, number> = {};
-    for (const metric of metricNames) {
-      const values = samples.map((s) => s.metrics[metric] ?? 0);
-      result[metric] = values.reduce((a, b) => a + b, 0) / values.length;
-    }
-    return result;
-  }
-
   /**
    * Calculate statistical analysis
    */
@@ -495,21 +484,16 @@ export class ABTestManager {
     const metricAnalysis: ABTestStatistics['metricAnalysis'] = {};
 
     for (const metric of metricNames) {
-      const controlValues = controlSamples.map((s) => s.metrics[metric] ?? 0);
-      const treatmentValues = treatmentSamples.map((s) => s.metrics[metric] ?? 0);
-
-      const controlMean = this.mean(controlValues);
-      const controlStdDev = this.stdDev(controlValues, controlMean);
-      const treatmentMean = this.mean(treatmentValues);
-      const treatmentStdDev = this.stdDev(treatmentValues, treatmentMean);
+      const { mean: controlMean, stdDev: controlStdDev } = this.summarize(controlSamples, metric);
+      const { mean: treatmentMean, stdDev: treatmentStdDev } = this.summarize(treatmentSamples, metric);
 
       const difference = treatmentMean - controlMean;
       const differencePercent = controlMean !== 0 ? (difference / controlMean) * 100 : 0;
 
       // Simple t-test approximation (Welch's t-test)
       const pValue = this.welchTTest(
-        controlValues,
-        treatmentValues,
+        controlSamples.length,
+        treatmentSamples.length,
         controlMean,
         treatmentMean,
         controlStdDev,
@@ -604,16 +588,30 @@ export class ABTestManager {
   // Statistical Helpers
   // ─────────────────────────────────────────────────────────────────────────
 
-  private mean(values: number[]): number {
-    if (values.length === 0) return 0;
-    return values.reduce((a, b) => a + b, 0) / values.length;
-  }
+  /**
+   * Mean and sample standard deviation of one metric, read straight from
+   * the samples (missing values count as 0) without building value arrays
+   */
+  private summarize(
+    samples: ABTestSample[],
+    metric: string
+  ): { mean: number; stdDev: number } {
+    const n = samples.length;
+    if (n === 0) return { mean: 0, stdDev: 0 };
+
+    let sum = 0;
+    for (let i = 0; i < n; i++) {
+      sum += samples[i].metrics[metric] ?? 0;
+    }
+    const mean = sum / n;
+    if (n < 2) return { mean, stdDev: 0 };
 
-  private stdDev(values: number[], mean?: number): number {
-    if (values.length < 2) return 0;
-    const m = mean ?? this.mean(values);
-    const squaredDiffs = values.map((v) => Math.pow(v - m, 2));
-    return Math.sqrt(squaredDiffs.reduce((a, b) => a + b, 0) / (values.length - 1));
+    let squaredDiffs = 0;
+    for (let i = 0; i < n; i++) {
+      const diff = (samples[i].metrics[metric] ?? 0) - mean;
+      squaredDiffs += diff * diff;
+    }
+    return { mean, stdDev: Math.sqrt(squaredDiffs / (n - 1)) };
   }
 
   /**
@@ -621,17 +619,14 @@ export class ABTestManager {
    * Returns approximate p-value
    */
   private welchTTest(
-    control: number[],
-    treatment: number[],
+    n1: number,
+    n2: number,
     controlMean: number,
     treatmentMean: number,
     controlStdDev: number,
     treatmentStdDev: number
   ): number {
-    if (control.length < 2 || treatment.length < 2) return 1;
-
-    const n1 = control.length;
-    const n2 = treatment.length;
+    if (n1 < 2 || n2 < 2) return 1;
 
     // Standard error
     const se1 = (controlStdDev * controlStdDev) / n1;
@@ -14,10 +14,7 @@
 import { randomUUID } from 'crypto';
 import type {
   UserTier,
-  TierLimits,
   UserUsage,
-  ModelUsage,
-  OperationUsage,
   LlmCostEntry,
   CostReportOptions,
   CostReport,
@@ -39,7 +36,7 @@ import type {
   ConfigCategory,
   ConfigAuditEntry,
 } from '../config/types.js';
-import { AUI_DEFAULTS, DEFAULT_TIERS, MODEL_COST_RATES, OPERATION_TYPES } from './constants.js';
+import { AUI_DEFAULTS, DEFAULT_TIERS, MODEL_COST_RATES } from './constants.js';
 import { getModelRegistry } from '../models/index.js';
 
 // ═══════════════════════════════════════════════════════════════════════════
@@ -14,9 +14,12 @@ import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
 import {
   AgenticLoop,
   createToolExecutor,
+  findJsonObject,
   initAgenticLoop,
   getAgenticLoop,
   resetAgenticLoop,
+  toToolCall,
+  toToolCalls,
   type AgentLlmAdapter,
   type ToolExecutor,
 } from './agentic-loop.js';
@@ -245,6 +248,22 @@ describe('AgenticLoop', () => {
       expect(observeStep?.toolResult?.success).toBe(true);
     });
 
+    it('executes a batch of independent tool calls', async () => {
+      const llm = createMockLlmAdapter([
+        '```tool\n{"calls": [{"tool": "search", "args": {"query": "a"}}, {"tool": "buffer_list", "args": {}}]}\n```',
+        '```complete\n{"answer": "Done"}\n```',
+      ]);
+      const localLoop = new AgenticLoop(llm, mockExecutor, { verbose: false });
+
+      const task = await localLoop.run('Search and list');
+
+      expect(mockExecutor.execute).toHaveBeenCalledWith('search', { query: 'a' });
+      expect(mockExecutor.execute).toHaveBeenCalledWith('buffer_list', {});
+
+      const observed = task.steps.filter(s => s.type === 'observe' && s.toolResult);
+      expect(observed.map(s => s.toolCall?.tool)).toEqual(['search', 'buffer_list']);
+    });
+
     it('executes BQL pipeline', async () => {
       const llm = createMockLlmAdapter([
         '```tool\n{"tool": "bql", "bql": "harvest photos | transform"}\n```',
@@ -315,6 +334,164 @@ describe('AgenticLoop', () => {
     });
   });
 
+  // ═══════════════════════════════════════════════════════════════════════════
+  // RESPONSE PARSING
+  // ═══════════════════════════════════════════════════════════════════════════
+
+  describe('Response Parsing', () => {
+    it('ignores prose after the tool JSON', async () => {
+      const llm = createMockLlmAdapter([
+        '```tool\n{"tool": "search", "args": {"query": "test"}} and then I will summarize\n```',
+        '```complete\n{"answer": "Done"}\n```',
+      ]);
+      const localLoop = new AgenticLoop(llm, mockExecutor, { verbose: false });
+
+      await localLoop.run('Search');
+
+      expect(mockExecutor.execute).toHaveBeenCalledWith('search', { query: 'test' });
+    });
+
+    it('handles braces inside string arguments', async () => {
+      const llm = createMockLlmAdapter([
+        '```tool\n{"tool": "search", "args": {"query": "a } b { \\"c\\""}}\n```',
+        '```complete\n{"answer": "Done"}\n```',
+      ]);
+      const localLoop = new AgenticLoop(llm, mockExecutor, { verbose: false });
+
+      await localLoop.run('Search');
+
+      expect(mockExecutor.execute).toHaveBeenCalledWith('search', { query: 'a } b { "c"' });
+    });
+
+    it('uses fenced text as the answer when complete JSON is invalid', async () => {
+      const llm = createMockLlmAdapter(['```complete\nAll done here\n```']);
+      const localLoop = new AgenticLoop(llm, mockExecutor, { verbose: false });
+
+      const task = await localLoop.run('Test');
+
+      expect(task.status).toBe('completed');
+      expect(task.result).toBe('All done here');
+    });
+  });
+
+  // ═══════════════════════════════════════════════════════════════════════════
+  // STREAMING
+  // ═══════════════════════════════════════════════════════════════════════════
+
+  describe('Streaming', () => {
+    function createStreamingLlmAdapter(responses: string[]) {
+      let callCount = 0;
+      const state = { chunksRead: 0, closed: 0 };
+      const adapter: AgentLlmAdapter = {
+        complete: vi.fn(async () => {
+          throw new Error('complete() should not be used when stream() exists');
+        }),
+        async *stream() {
+          const response = responses[callCount++ % responses.length];
+          try {
+            // Emit in small chunks to exercise incremental detection
+            for (let i = 0; i < response.length; i += 8) {
+              state.chunksRead++;
+              yield { delta: response.slice(i, i + 8), tokensUsed: 2 };
+            }
+          } finally {
+            state.closed++;
+          }
+        },
+        isAvailable: vi.fn(async () => true),
+        getModel: vi.fn(() => 'mock-stream'),
+      };
+      return { adapter, state };
+    }
+
+    it('dispatches the tool before trailing text is generated', async () => {
+      const trailing = ' and now a long explanation'.repeat(20);
+      const { adapter, state } = createStreamingLlmAdapter([
+        '```tool\n{"tool": "search", "args": {"query": "test"}}\n```' + trailing,
+        '```complete\n{"answer": "Done"}\n```',
+      ]);
+      const localLoop = new AgenticLoop(adapter, mockExecutor, { verbose: false });
+
+      const task = await localLoop.run('Search');
+
+      expect(task.status).toBe('completed');
+      expect(mockExecutor.execute).toHaveBeenCalledWith('search', { query: 'test' });
+      expect(state.closed).toBe(2);
+      // Far fewer chunks read than the full tool response would take
+      expect(state.chunksRead).toBeLessThan(20);
+    });
+
+    it('accumulates streamed token usage', async () => {
+      const { adapter } = createStreamingLlmAdapter(['```complete\n{"answer": "Done"}\n```']);
+      const localLoop = new AgenticLoop(adapter, mockExecutor, { verbose: false });
+
+      const task = await localLoop.run('Test');
+
+      expect(task.result).toBe('Done');
+      expect(task.totalTokens).toBeGreaterThan(0);
+    });
+  });
+
+  // ═══════════════════════════════════════════════════════════════════════════
+  // PROMPT BUILDING
+  // ═══════════════════════════════════════════════════════════════════════════
+
+  describe('Prompt Building', () => {
+    it('lists available tools in the reasoning prompt', async () => {
+      await loop.run('Test');
+
+      const prompt = (mockLlm.complete as ReturnType<typeof vi.fn>).mock.calls[0][0] as string;
+      expect(prompt).toContain('- search: Search for content');
+      expect(prompt).toContain('- buffer_create: Create a buffer');
+    });
+
+    it('re-renders the tool list when the tool set changes', async () => {
+      await loop.run('Test');
+
+      (mockExecutor.listTools as ReturnType<typeof vi.fn>).mockReturnValue([
+        { name: 'harvest', description: 'Harvest passages', parameters: {} },
+      ]);
+      await loop.run('Test again');
+
+      const calls = (mockLlm.complete as ReturnType<typeof vi.fn>).mock.calls;
+      const prompt = calls[calls.length - 1][0] as string;
+      expect(prompt).toContain('- harvest: Harvest passages');
+      expect(prompt).not.toContain('- search: Search for content');
+    });
+
+    it('shows a changed description for a tool with the same name', async () => {
+      await loop.run('Test');
+
+      (mockExecutor.listTools as ReturnType<typeof vi.fn>).mockReturnValue([
+        { name: 'search', description: 'Search the archive', parameters: {} },
+        { name: 'buffer_create', description: 'Create a buffer', parameters: {} },
+        { name: 'buffer_delete', description: 'Delete a buffer (destructive)', parameters: {} },
+      ]);
+      await loop.run('Test again');
+
+      const calls = (mockLlm.complete as ReturnType<typeof vi.fn>).mock.calls;
+      const prompt = calls[calls.length - 1][0] as string;
+      expect(prompt).toContain('- search: Search the archive');
+    });
+
+    it('omits empty optional sections without template residue', async () => {
+      await loop.run('Test');
+
+      const prompt = (mockLlm.complete as ReturnType<typeof vi.fn>).mock.calls[0][0] as string;
+      expect(prompt).not.toContain('{{');
+      expect(prompt).not.toContain('Current plan:');
+      expect(prompt).not.toContain('Last tool result:');
+      expect(prompt).toContain('Available tools:');
+    });
+
+    it('inserts the request text verbatim', async () => {
+      await loop.run('Replace $& and $1 literally');
+
+      const prompt = (mockLlm.complete as ReturnType<typeof vi.fn>).mock.calls[0][0] as string;
+      expect(prompt).toContain('Current task: Replace $& and $1 literally');
+    });
+  });
+
   // ═══════════════════════════════════════════════════════════════════════════
   // TASK MANAGEMENT
   // ═══════════════════════════════════════════════════════════════════════════
@@ -495,6 +672,86 @@ describe('AgenticLoop', () => {
   });
 });
 
+// ═══════════════════════════════════════════════════════════════════════════
+// JSON SCANNER TESTS
+// ═══════════════════════════════════════════════════════════════════════════
+
+describe('findJsonObject', () => {
+  it('finds the first balanced object', () => {
+    const text = 'prefix {"a": {"b": 1}} suffix {"c": 2}';
+    const span = findJsonObject(text);
+
+    expect(span).not.toBeNull();
+    expect(text.slice(span!.start, span!.end)).toBe('{"a": {"b": 1}}');
+  });
+
+  it('continues scanning from a previous end', () => {
+    const text = '{"a": 1} {"b": 2}';
+    const first = findJsonObject(text)!;
+    const second = findJsonObject(text, first.end)!;
+
+    expect(text.slice(second.start, second.end)).toBe('{"b": 2}');
+  });
+
+  it('returns null for unbalanced input', () => {
+    expect(findJsonObject('{"a": {"b": 1}')).toBeNull();
+    expect(findJsonObject('no json here')).toBeNull();
+  });
+});
+
+describe('toToolCall', () => {
+  it('accepts a well-formed envelope', () => {
+    expect(toToolCall({ tool: 'search', args: { q: 'x' } })).toEqual({
+      tool: 'search',
+      args: { q: 'x' },
+      rawBql: undefined,
+    });
+  });
+
+  it('accepts parameters as an alias for args', () => {
+    expect(toToolCall({ tool: 'search', parameters: { q: 'x' } })?.args).toEqual({ q: 'x' });
+  });
+
+  it('defaults missing args to an empty object', () => {
+    expect(toToolCall({ tool: 'buffer_list' })?.args).toEqual({});
+  });
+
+  it('accepts a bql-only envelope as a bql call', () => {
+    expect(toToolCall({ bql: 'harvest "x" | limit 5' })).toEqual({
+      tool: 'bql',
+      args: {},
+      rawBql: 'harvest "x" | limit 5',
+    });
+  });
+
+  it('rejects malformed envelopes', () => {
+    expect(toToolCall({ args: {} })).toBeNull();
+    expect(toToolCall({ tool: 42 })).toBeNull();
+    expect(toToolCall({ tool: 'search', args: ['x'] })).toBeNull();
+    expect(toToolCall({ tool: 'bql', bql: 7 })).toBeNull();
+    expect(toToolCall({ bql: '' })).toBeNull();
+  });
+});
+
+describe('toToolCalls', () => {
+  it('wraps a single envelope', () => {
+    expect(toToolCalls({ tool: 'search', args: { q: 'x' } })?.map(c => c.tool)).toEqual(['search']);
+  });
+
+  it('accepts a batch of calls', () => {
+    const calls = toToolCalls({
+      calls: [{ tool: 'search', args: { q: 'x' } }, { tool: 'buffer_list' }],
+    });
+    expect(calls?.map(c => c.tool)).toEqual(['search', 'buffer_list']);
+  });
+
+  it('rejects a batch with any malformed call', () => {
+    expect(toToolCalls({ calls: [{ tool: 'search' }, { args: {} }] })).toBeNull();
+    expect(toToolCalls({ calls: [] })).toBeNull();
+    expect(toToolCalls({ calls: 'search' })).toBeNull();
+  });
+});
+
 // ═══════════════════════════════════════════════════════════════════════════
 // TOOL EXECUTOR FACTORY TESTS
 // ═══════════════════════════════════════════════════════════════════════════
@@ -662,6 +919,18 @@ describe('createToolExecutor', () => {
       expect(customHandler).toHaveBeenCalledWith({ param: 'value' });
     });
 
+    it('lets custom handlers override built-in tools', async () => {
+      const override = vi.fn(async (): Promise<ToolResult> => ({ success: true, data: 'custom' }));
+      const customExecutor = createToolExecutor(mockBqlExecutor, bufferManager, {
+        buffer_list: override,
+      });
+
+      const result = await customExecutor.execute('buffer_list', {});
+
+      expect(override).toHaveBeenCalled();
+      expect(result.data).toBe('custom');
+    });
+
     it('lists custom handlers in tools', () => {
       const customExecutor = createToolExecutor(mockBqlExecutor, bufferManager, {
         my_custom_tool: async () => ({ success: true }),
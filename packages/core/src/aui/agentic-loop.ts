@@ -16,15 +16,12 @@
 import { randomUUID } from 'crypto';
 import type {
   AgentStep,
-  AgentStepType,
   AgentTask,
   AgentTaskStatus,
-  AgentPlanStep,
   AgentLoopOptions,
   ToolCall,
   ToolResult,
   ToolDefinition,
-  ToolParameter,
   TaskContext,
   ReasoningResult,
 } from './types.js';
@@ -56,6 +53,24 @@ export interface AgentLlmAdapter {
     finishReason: 'stop' | 'max_tokens' | 'tool_use';
   }>;
 
+  /**
+   * Stream a completion as it is generated (optional).
+   *
+   * When present, the loop stops consuming the stream as soon as a complete
+   * action block has arrived, so the tool dispatches without waiting for
+   * any trailing text. Ending iteration early calls the iterator's
+   * return(), which adapters should use to abort the underlying request.
+   */
+  stream?(prompt: string, options?: {
+    maxTokens?: number;
+    temperature?: number;
+    systemPrompt?: string;
+    stopSequences?: string[];
+  }): AsyncIterable<{
+    delta: string;
+    tokensUsed?: number;
+  }>;
+
   /** Check if adapter is available */
   isAvailable(): Promise<boolean>;
 
@@ -107,6 +122,16 @@ When you need to use a tool, respond with a JSON block:
 }
 \`\`\`
 
+To run several independent tools at once, list them in one block:
+\`\`\`tool
+{
+  "calls": [
+    { "tool": "tool_a", "args": { "param1": "value1" } },
+    { "tool": "tool_b", "args": { "param1": "value1" } }
+  ]
+}
+\`\`\`
+
 When you have completed the task, respond with:
 \`\`\`complete
 {
@@ -122,38 +147,150 @@ If you need clarification from the user:
 }
 \`\`\``;
 
-const REASONING_PROMPT_TEMPLATE = `
-Current task: {{request}}
+/** Closing instruction appended to every reasoning prompt */
+const REASONING_PROMPT_FOOTER = `What should I do next? Think step by step and then either:
+1. Use a tool (respond with a \`\`\`tool block)
+2. Complete the task (respond with a \`\`\`complete block)
+3. Ask the user for clarification (respond with a \`\`\`ask block)
+`;
+
+// ═══════════════════════════════════════════════════════════════════════════
+// RESPONSE PARSING
+// ═══════════════════════════════════════════════════════════════════════════
 
-{{#if plan}}
-Current plan:
-{{#each plan}}
-{{@index}}. {{description}} {{#if completed}}[DONE]{{/if}}
-{{/each}}
+/**
+ * Locate the first balanced JSON object in `text` at or after `from`.
+ *
+ * Single pass that tracks brace depth and string/escape state, so braces
+ * inside strings are ignored and prose after the object (or a second
+ * object) does not break extraction. Returns the [start, end) span, or
+ * null if no complete object is found. Callers can continue scanning from
+ * `end` to find further objects.
+ */
+export function findJsonObject(
+  text: string,
+  from = 0
+): { start: number; end: number } | null {
+  const start = text.indexOf('{', from);
+  if (start === -1) return null;
+
+  let depth = 0;
+  let inString = false;
+  let escaped = false;
+
+  for (let i = start; i < text.length; i++) {
+    const ch = text.charCodeAt(i);
+    if (inString) {
+      if (escaped) escaped = false;
+      else if (ch === 0x5c /* backslash */) escaped = true;
+      else if (ch === 0x22 /* " */) inString = false;
+    } else if (ch === 0x22 /* " */) {
+      inString = true;
+    } else if (ch === 0x7b /* { */) {
+      depth++;
+    } else if (ch === 0x7d /* } */) {
+      depth--;
+      if (depth === 0) return { start, end: i + 1 };
+    }
+  }
 
-Current step: {{currentStepIndex}}
-{{/if}}
+  return null;
+}
 
-{{#if previousSteps}}
-Previous steps in this task:
-{{#each previousSteps}}
-[{{type}}] {{content}}
-{{/each}}
-{{/if}}
+/**
+ * Parse the JSON object following a fenced action marker (e.g. ```tool).
+ */
+function parseActionBlock(
+  response: string,
+  marker: string
+): { index: number; parsed?: Record<string, unknown> } | null {
+  const index = response.indexOf(marker);
+  if (index === -1) return null;
+
+  const span = findJsonObject(response, index + marker.length);
+  if (!span) return { index };
+
+  try {
+    return { index, parsed: JSON.parse(response.slice(span.start, span.end)) };
+  } catch {
+    return { index };
+  }
+}
 
-{{#if lastToolResult}}
-Last tool result:
-{{lastToolResult}}
-{{/if}}
+function isPlainObject(value: unknown): value is Record<string, unknown> {
+  return typeof value === 'object' && value !== null && !Array.isArray(value);
+}
 
-Available tools:
-{{toolList}}
+/**
+ * Validate a parsed ```tool block into a ToolCall.
+ *
+ * Accepts `parameters` as an alias for `args` (the shape some local models
+ * emit), and a bare `{ "bql": "..." }` envelope as a call to the bql tool.
+ * Returns null when the envelope is malformed so the caller can fall
+ * through to the other block types instead of dispatching garbage.
+ */
+export function toToolCall(parsed: Record<string, unknown>): ToolCall | null {
+  const { bql } = parsed;
+  const args = parsed.args ?? parsed.parameters ?? {};
+  const tool = parsed.tool ?? (typeof bql === 'string' && bql.length > 0 ? 'bql' : undefined);
 
-What should I do next? Think step by step and then either:
-1. Use a tool (respond with a \`\`\`tool block)
-2. Complete the task (respond with a \`\`\`complete block)
-3. Ask the user for clarification (respond with a \`\`\`ask block)
-`;
+  if (typeof tool !== 'string' || tool.length === 0) return null;
+  if (!isPlainObject(args)) return null;
+  if (bql !== undefined && typeof bql !== 'string') return null;
+
+  return { tool, args, rawBql: bql };
+}
+
+/**
+ * Validate a parsed ```tool block into one or more ToolCalls.
+ *
+ * A block is either a single call envelope or `{ "calls": [...] }` listing
+ * independent calls. Returns null if the block or any listed call is
+ * malformed, so nothing from a garbled batch is dispatched.
+ */
+export function toToolCalls(parsed: Record<string, unknown>): ToolCall[] | null {
+  const { calls } = parsed;
+  if (calls === undefined) {
+    const call = toToolCall(parsed);
+    return call ? [call] : null;
+  }
+
+  if (!Array.isArray(calls) || calls.length === 0) return null;
+
+  const toolCalls: ToolCall[] = [];
+  for (const entry of calls) {
+    const call = isPlainObject(entry) ? toToolCall(entry) : null;
+    if (!call) return null;
+    toolCalls.push(call);
+  }
+  return toolCalls;
+}
+
+/** Fenced markers that introduce an action block */
+const ACTION_MARKERS = ['```tool', '```complete', '```ask'] as const;
+
+/**
+ * Whether a (partial) response already contains a complete action block,
+ * i.e. an action marker followed by a balanced JSON object.
+ */
+function hasCompleteActionBlock(response: string): boolean {
+  for (const marker of ACTION_MARKERS) {
+    const index = response.indexOf(marker);
+    if (index !== -1 && findJsonObject(response, index + marker.length)) {
+      return true;
+    }
+  }
+  return false;
+}
+
+/**
+ * Raw text between a fenced action marker and its closing fence.
+ */
+function fencedContent(response: string, index: number, marker: string): string {
+  const bodyStart = index + marker.length;
+  const close = response.indexOf('```', bodyStart);
+  return response.slice(bodyStart, close === -1 ? undefined : close).trim();
+}
 
 // ═══════════════════════════════════════════════════════════════════════════
 // AGENTIC LOOP
@@ -489,33 +626,88 @@ export class AgenticLoop {
 
   /**
    * Execute a tool action.
+   *
+   * A batch of independent calls runs concurrently (the executor bounds
+   * actual parallelism); destructive calls still run one at a time after
+   * the concurrent ones. Observations are recorded in call order: all but
+   * the last are pushed here, the last is returned like a single call's.
    */
   private async executeToolAction(
     task: AgentTask,
     reasoning: ReasoningResult,
     options?: AgentLoopOptions
   ): Promise<AgentStep> {
-    const startTime = Date.now();
-    const toolCall = reasoning.toolCall!;
-
-    // Check if approval is needed
-    if (this.isDestructiveAction(toolCall) && !options?.autoApprove) {
-      if (options?.onApprovalNeeded) {
-        const approved = await options.onApprovalNeeded(toolCall);
-        if (!approved) {
-          return {
-            id: randomUUID(),
-            type: 'observe',
-            content: `Tool "${toolCall.tool}" was not approved by user`,
-            toolCall,
-            toolResult: { success: false, error: 'User rejected action' },
-            timestamp: Date.now(),
-            durationMs: Date.now() - startTime,
-          };
-        }
+    const toolCalls = reasoning.toolCalls ?? [reasoning.toolCall!];
+    const observations: AgentStep[] = new Array(toolCalls.length);
+    const concurrent: number[] = [];
+    const serial: number[] = [];
+
+    // Approvals are requested one at a time, before anything runs
+    for (let i = 0; i < toolCalls.length; i++) {
+      const rejection = await this.checkApproval(toolCalls[i], options);
+      if (rejection) {
+        observations[i] = rejection;
+      } else if (this.isDestructiveAction(toolCalls[i])) {
+        serial.push(i);
+      } else {
+        concurrent.push(i);
       }
     }
 
+    await Promise.all(
+      concurrent.map(async (i) => {
+        observations[i] = await this.runToolCall(task, toolCalls[i], options);
+      })
+    );
+    for (const i of serial) {
+      observations[i] = await this.runToolCall(task, toolCalls[i], options);
+    }
+
+    for (let i = 0; i < observations.length - 1; i++) {
+      task.steps.push(observations[i]);
+      options?.onStep?.(observations[i]);
+    }
+    return observations[observations.length - 1];
+  }
+
+  /**
+   * Ask for approval of a destructive call. Returns the observe step to
+   * record if the user rejects it, otherwise null.
+   */
+  private async checkApproval(
+    toolCall: ToolCall,
+    options?: AgentLoopOptions
+  ): Promise<AgentStep | null> {
+    if (!this.isDestructiveAction(toolCall) || options?.autoApprove || !options?.onApprovalNeeded) {
+      return null;
+    }
+
+    const startTime = Date.now();
+    const approved = await options.onApprovalNeeded(toolCall);
+    if (approved) return null;
+
+    return {
+      id: randomUUID(),
+      type: 'observe',
+      content: `Tool "${toolCall.tool}" was not approved by user`,
+      toolCall,
+      toolResult: { success: false, error: 'User rejected action' },
+      timestamp: Date.now(),
+      durationMs: Date.now() - startTime,
+    };
+  }
+
+  /**
+   * Run one tool call: record the act step, execute, and return the
+   * observe step.
+   */
+  private async runToolCall(
+    task: AgentTask,
+    toolCall: ToolCall,
+    options?: AgentLoopOptions
+  ): Promise<AgentStep> {
+    const startTime = Date.now();
+
     // Record the act step
     const actStep: AgentStep = {
       id: randomUUID(),
@@ -628,11 +820,14 @@ export class AgenticLoop {
     const temperature = options?.temperature ?? AUI_DEFAULTS.temperature;
     const maxTokens = options?.maxTokens ?? 2000;
 
-    const response = await this.llm.complete(prompt, {
+    const completionOptions = {
       temperature,
       maxTokens,
       systemPrompt: SYSTEM_PROMPT,
-    });
+    };
+    const response = this.llm.stream
+      ? await this.completeStreaming(prompt, completionOptions)
+      : await this.llm.complete(prompt, completionOptions);
 
     const parsed = this.parseReasoningResponse(response.text);
 
@@ -642,6 +837,30 @@ export class AgenticLoop {
     };
   }
 
+  /**
+   * Consume a streamed completion, stopping at the first complete action
+   * block so the next action can start while the model is still generating.
+   */
+  private async completeStreaming(
+    prompt: string,
+    options: { temperature: number; maxTokens: number; systemPrompt: string }
+  ): Promise<{ text: string; tokensUsed: number }> {
+    let text = '';
+    let tokensUsed = 0;
+
+    for await (const chunk of this.llm.stream!(prompt, options)) {
+      text += chunk.delta;
+      tokensUsed += chunk.tokensUsed ?? 0;
+
+      // A block can only become complete when its closing brace arrives
+      if (chunk.delta.includes('}') && hasCompleteActionBlock(text)) {
+        break;
+      }
+    }
+
+    return { text, tokensUsed };
+  }
+
   /**
    * Build the reasoning prompt.
    */
@@ -651,10 +870,6 @@ export class AgenticLoop {
 
     // Get recent steps
     const recentSteps = task.steps.slice(-MAX_HISTORY_IN_CONTEXT);
-    const previousSteps = recentSteps.map(s => ({
-      type: s.type,
-      content: s.content.substring(0, 500),
-    }));
 
     // Get last tool result
     let lastToolResult: string | undefined;
@@ -665,48 +880,34 @@ export class AgenticLoop {
       }
     }
 
-    // Build prompt (simplified template rendering)
-    let prompt = REASONING_PROMPT_TEMPLATE
-      .replace('{{request}}', task.request)
-      .replace('{{toolList}}', toolList);
+    // Assemble sections in a single pass; optional sections are skipped
+    // entirely rather than rendered and stripped afterwards.
+    const sections: string[] = [`Current task: ${task.request}`];
 
-    // Handle plan section
     if (task.plan && task.plan.length > 0) {
-      const planStr = task.plan.map((p, i) =>
-        `${i + 1}. ${p.description}${p.completed ? ' [DONE]' : ''}`
-      ).join('\n');
-      prompt = prompt
-        .replace('{{#if plan}}', '')
-        .replace('{{/if}}', '')
-        .replace('{{#each plan}}\n{{@index}}. {{description}} {{#if completed}}[DONE]{{/if}}\n{{/each}}', planStr)
-        .replace('{{currentStepIndex}}', String(task.currentStepIndex));
-    } else {
-      // Remove plan section
-      prompt = prompt.replace(/\{\{#if plan\}\}[\s\S]*?\{\{\/if\}\}/g, '');
+      let planStr = 'Current plan:';
+      for (let i = 0; i < task.plan.length; i++) {
+        const p = task.plan[i];
+        planStr += `\n${i + 1}. ${p.description}${p.completed ? ' [DONE]' : ''}`;
+      }
+      sections.push(`${planStr}\n\nCurrent step: ${task.currentStepIndex}`);
     }
 
-    // Handle previous steps
-    if (previousSteps.length > 0) {
-      const stepsStr = previousSteps.map(s => `[${s.type}] ${s.content}`).join('\n');
-      prompt = prompt
-        .replace('{{#if previousSteps}}', '')
-        .replace('{{/if}}', '')
-        .replace('{{#each previousSteps}}\n[{{type}}] {{content}}\n{{/each}}', stepsStr);
-    } else {
-      prompt = prompt.replace(/\{\{#if previousSteps\}\}[\s\S]*?\{\{\/if\}\}/g, '');
+    if (recentSteps.length > 0) {
+      let stepsStr = 'Previous steps in this task:';
+      for (const s of recentSteps) {
+        stepsStr += `\n[${s.type}] ${s.content.substring(0, 500)}`;
+      }
+      sections.push(stepsStr);
     }
 
-    // Handle last tool result
     if (lastToolResult) {
-      prompt = prompt
-        .replace('{{#if lastToolResult}}', '')
-        .replace('{{/if}}', '')
-        .replace('{{lastToolResult}}', lastToolResult);
-    } else {
-      prompt = prompt.replace(/\{\{#if lastToolResult\}\}[\s\S]*?\{\{\/if\}\}/g, '');
+      sections.push(`Last tool result:\n${lastToolResult}`);
     }
 
-    return prompt;
+    sections.push(`Available tools:\n${toolList}`, REASONING_PROMPT_FOOTER);
+
+    return `\n${sections.join('\n\n')}`;
   }
 
   /**
@@ -714,66 +915,57 @@ export class AgenticLoop {
    */
   private parseReasoningResponse(response: string): ReasoningResult {
     // Try to find tool block
-    const toolMatch = response.match(/```tool\s*\n([\s\S]*?)\n```/);
-    if (toolMatch) {
-      try {
-        const parsed = JSON.parse(toolMatch[1]);
-        return {
-          nextAction: 'tool',
-          reasoning: response.split('```tool')[0].trim(),
-          toolCall: {
-            tool: parsed.tool,
-            args: parsed.args ?? {},
-            rawBql: parsed.bql,
-          },
-          confidence: 0.8,
-        };
-      } catch {
-        // Invalid JSON, continue parsing
-      }
+    const toolBlock = parseActionBlock(response, '```tool');
+    const toolCalls = toolBlock?.parsed ? toToolCalls(toolBlock.parsed) : null;
+    if (toolBlock && toolCalls) {
+      return {
+        nextAction: 'tool',
+        reasoning: response.slice(0, toolBlock.index).trim(),
+        toolCall: toolCalls[0],
+        ...(toolCalls.length > 1 && { toolCalls }),
+        confidence: 0.8,
+      };
     }
 
     // Try to find complete block
-    const completeMatch = response.match(/```complete\s*\n([\s\S]*?)\n```/);
-    if (completeMatch) {
-      try {
-        const parsed = JSON.parse(completeMatch[1]);
+    const completeBlock = parseActionBlock(response, '```complete');
+    if (completeBlock) {
+      const parsed = completeBlock.parsed;
+      if (parsed) {
         return {
           nextAction: 'complete',
-          reasoning: response.split('```complete')[0].trim(),
-          answer: parsed.answer ?? parsed.summary ?? 'Task completed',
+          reasoning: response.slice(0, completeBlock.index).trim(),
+          answer: (parsed.answer ?? parsed.summary ?? 'Task completed') as string,
           confidence: 0.9,
         };
-      } catch {
-        // If JSON parsing fails, treat the whole content as the answer
-        return {
-          nextAction: 'complete',
-          reasoning: response,
-          answer: completeMatch[1].trim(),
-          confidence: 0.7,
-        };
       }
+      // If JSON parsing fails, treat the whole content as the answer
+      return {
+        nextAction: 'complete',
+        reasoning: response,
+        answer: fencedContent(response, completeBlock.index, '```complete'),
+        confidence: 0.7,
+      };
     }
 
     // Try to find ask block
-    const askMatch = response.match(/```ask\s*\n([\s\S]*?)\n```/);
-    if (askMatch) {
-      try {
-        const parsed = JSON.parse(askMatch[1]);
+    const askBlock = parseActionBlock(response, '```ask');
+    if (askBlock) {
+      const parsed = askBlock.parsed;
+      if (parsed) {
         return {
           nextAction: 'ask_user',
-          reasoning: response.split('```ask')[0].trim(),
-          question: parsed.question,
+          reasoning: response.slice(0, askBlock.index).trim(),
+          question: parsed.question as string,
           confidence: 0.8,
         };
-      } catch {
-        return {
-          nextAction: 'ask_user',
-          reasoning: response,
-          question: askMatch[1].trim(),
-          confidence: 0.6,
-        };
       }
+      return {
+        nextAction: 'ask_user',
+        reasoning: response,
+        question: fencedContent(response, askBlock.index, '```ask'),
+        confidence: 0.6,
+      };
     }
 
     // No recognizable block, assume it's just reasoning
@@ -929,21 +1121,86 @@ export function createToolExecutor(
     },
   };
 
-  return {
-    listTools(): ToolDefinition[] {
-      const tools = Object.values(bufferTools);
-      if (customHandlers) {
-        for (const name of Object.keys(customHandlers)) {
-          if (!bufferTools[name]) {
-            tools.push({
-              name,
-              description: `Custom handler: ${name}`,
-              parameters: {},
-            });
-          }
-        }
+  type Handler = (args: Record<string, unknown>) => Promise<ToolResult> | ToolResult;
+
+  // Dispatch table built once per executor; custom handlers override builtins
+  const handlers = new Map<string, Handler>([
+    ['buffer_list', () => ({
+      success: true,
+      data: bufferManager.listBuffers().map(b => ({
+        name: b.name,
+        itemCount: b.workingContent.length,
+        branch: b.currentBranch,
+        isDirty: b.isDirty,
+      })),
+    })],
+
+    ['buffer_get', args => {
+      const buffer = bufferManager.getBuffer(args.name as string);
+      if (!buffer) {
+        return { success: false, error: `Buffer "${args.name}" not found` };
       }
-      return tools;
+      const limit = (args.limit as number) ?? 100;
+      const content = buffer.workingContent.slice(0, limit);
+      return {
+        success: true,
+        data: { name: buffer.name, content, total: buffer.workingContent.length },
+      };
+    }],
+
+    ['buffer_create', args => {
+      const content = (args.content as unknown[]) ?? [];
+      const buffer = bufferManager.createBuffer(args.name as string, content);
+      return { success: true, data: { name: buffer.name, id: buffer.id } };
+    }],
+
+    ['buffer_commit', args => {
+      const version = bufferManager.commit(args.name as string, args.message as string);
+      return { success: true, data: { versionId: version.id, message: version.message } };
+    }],
+
+    ['buffer_history', args => {
+      const limit = (args.limit as number) ?? 10;
+      const history = bufferManager.getHistory(args.name as string, limit);
+      return {
+        success: true,
+        data: history.map(v => ({ id: v.id, message: v.message, timestamp: v.timestamp })),
+      };
+    }],
+
+    ['buffer_branch_create', args => {
+      const branch = bufferManager.createBranch(
+        args.bufferName as string,
+        args.branchName as string
+      );
+      return { success: true, data: { branch: branch.name } };
+    }],
+
+    ['buffer_branch_switch', args => {
+      bufferManager.switchBranch(args.bufferName as string, args.branchName as string);
+      return { success: true, data: { branch: args.branchName } };
+    }],
+
+    ['bql', args => executor.executeBql(args.pipeline as string)],
+  ]);
+
+  const toolList = Object.values(bufferTools);
+  if (customHandlers) {
+    for (const [name, handler] of Object.entries(customHandlers)) {
+      handlers.set(name, handler);
+      if (!bufferTools[name]) {
+        toolList.push({
+          name,
+          description: `Custom handler: ${name}`,
+          parameters: {},
+        });
+      }
+    }
+  }
+
+  const executor: ToolExecutor = {
+    listTools(): ToolDefinition[] {
+      return toolList.slice();
     },
 
     getTool(name: string): ToolDefinition | undefined {
@@ -953,95 +1210,16 @@ export function createToolExecutor(
     async execute(name: string, args: Record<string, unknown>): Promise<ToolResult> {
       const startTime = Date.now();
 
-      try {
-        // Check custom handlers first
-        if (customHandlers?.[name]) {
-          return await customHandlers[name](args);
-        }
+      const handler = handlers.get(name);
+      if (!handler) {
+        return { success: false, error: `Unknown tool: ${name}` };
+      }
 
-        // Built-in buffer tools
-        switch (name) {
-          case 'buffer_list': {
-            const buffers = bufferManager.listBuffers().map(b => ({
-              name: b.name,
-              itemCount: b.workingContent.length,
-              branch: b.currentBranch,
-              isDirty: b.isDirty,
-            }));
-            return { success: true, data: buffers, durationMs: Date.now() - startTime };
-          }
-
-          case 'buffer_get': {
-            const buffer = bufferManager.getBuffer(args.name as string);
-            if (!buffer) {
-              return { success: false, error: `Buffer "${args.name}" not found` };
-            }
-            const limit = (args.limit as number) ?? 100;
-            const content = buffer.workingContent.slice(0, limit);
-            return {
-              success: true,
-              data: { name: buffer.name, content, total: buffer.workingContent.length },
-              durationMs: Date.now() - startTime,
-            };
-          }
-
-          case 'buffer_create': {
-            const content = (args.content as unknown[]) ?? [];
-            const buffer = bufferManager.createBuffer(args.name as string, content);
-            return {
-              success: true,
-              data: { name: buffer.name, id: buffer.id },
-              durationMs: Date.now() - startTime,
-            };
-          }
-
-          case 'buffer_commit': {
-            const version = bufferManager.commit(args.name as string, args.message as string);
-            return {
-              success: true,
-              data: { versionId: version.id, message: version.message },
-              durationMs: Date.now() - startTime,
-            };
-          }
-
-          case 'buffer_history': {
-            const limit = (args.limit as number) ?? 10;
-            const history = bufferManager.getHistory(args.name as string, limit);
-            return {
-              success: true,
-              data: history.map(v => ({ id: v.id, message: v.message, timestamp: v.timestamp })),
-              durationMs: Date.now() - startTime,
-            };
-          }
-
-          case 'buffer_branch_create': {
-            const branch = bufferManager.createBranch(
-              args.bufferName as string,
-              args.branchName as string
-            );
-            return {
-              success: true,
-              data: { branch: branch.name },
-              durationMs: Date.now() - startTime,
-            };
-          }
-
-          case 'buffer_branch_switch': {
-            bufferManager.switchBranch(args.bufferName as string, args.branchName as string);
-            return {
-              success: true,
-              data: { branch: args.branchName },
-              durationMs: Date.now() - startTime,
-            };
-          }
-
-          case 'bql': {
-            return await this.executeBql(args.pipeline as string);
-          }
-
-          default:
-            return { success: false, error: `Unknown tool: ${name}` };
-        }
+      try {
+        const result = await handler(args);
+        return result.durationMs === undefined
+          ? { ...result, durationMs: Date.now() - startTime }
+          : result;
       } catch (error) {
         return {
           success: false,
@@ -1076,6 +1254,8 @@ export function createToolExecutor(
       }
     },
   };
+
+  return executor;
 }
 
 // ═══════════════════════════════════════════════════════════════════════════
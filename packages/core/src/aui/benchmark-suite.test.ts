@@ -238,6 +238,27 @@ describe('BenchmarkRunner', () => {
       expect(drifts.some(d => d > 0)).toBe(true);
     });
 
+    it('should keep passage order when running concurrently', async () => {
+      let active = 0;
+      let peak = 0;
+      const invoker = async (input: string): Promise<string> => {
+        active++;
+        peak = Math.max(peak, active);
+        await new Promise(resolve => setTimeout(resolve, 2));
+        active--;
+        return input;
+      };
+
+      const concurrentRunner = new BenchmarkRunner({ concurrency: 3 });
+      const result = await concurrentRunner.run('test-model', invoker);
+
+      expect(result.passageResults.map(r => r.passageId)).toEqual(
+        DEFAULT_BENCHMARK_PASSAGES.map(p => p.id)
+      );
+      expect(peak).toBeLessThanOrEqual(3);
+      expect(peak).toBeGreaterThan(1);
+    });
+
     it('should calculate overall scores', async () => {
       const invoker = createMockInvoker({ '\\bdelve\\b': 'explore' });
 
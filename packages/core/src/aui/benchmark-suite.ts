@@ -471,6 +471,9 @@ export interface BenchmarkRunnerOptions {
 
   /** Timeout per passage in milliseconds */
   passageTimeoutMs?: number;
+
+  /** Maximum passages benchmarked at once (default: 4) */
+  concurrency?: number;
 }
 
 /**
@@ -496,6 +499,7 @@ export class BenchmarkRunner {
       skipSemanticDrift: options?.skipSemanticDrift ?? false,
       skipPerplexity: options?.skipPerplexity ?? true, // Default true as perplexity requires LM
       passageTimeoutMs: options?.passageTimeoutMs ?? 30000,
+      concurrency: Math.max(1, options?.concurrency ?? 4),
     };
   }
 
@@ -509,18 +513,24 @@ export class BenchmarkRunner {
     categories?: PassageCategory[]
   ): Promise<BenchmarkSuiteResult> {
     const startTime = Date.now();
-    const passageResults: PassageBenchmarkResult[] = [];
 
     // Filter passages by category if specified
     const passages = categories
       ? this.suite.passages.filter((p) => categories.includes(p.category))
       : this.suite.passages;
 
-    // Run each passage
-    for (const passage of passages) {
-      const result = await this.runPassage(passage, invoker, embedder);
-      passageResults.push(result);
-    }
+    // Passages are independent: run them on a small worker pool, keeping
+    // results in suite order
+    const passageResults: PassageBenchmarkResult[] = new Array(passages.length);
+    let next = 0;
+    const worker = async (): Promise<void> => {
+      while (next < passages.length) {
+        const index = next++;
+        passageResults[index] = await this.runPassage(passages[index], invoker, embedder);
+      }
+    };
+    const workerCount = Math.min(this.options.concurrency, passages.length);
+    await Promise.all(Array.from({ length: workerCount }, worker));
 
     // Calculate overall scores
     const scores = this.calculateScores(passageResults);
@@ -586,8 +596,10 @@ export class BenchmarkRunner {
     let semanticDrift = 0;
     if (embedder && !this.options.skipSemanticDrift) {
       try {
-        const inputEmbed = await embedder(passage.text);
-        const outputEmbed = await embedder(output);
+        const [inputEmbed, outputEmbed] = await Promise.all([
+          embedder(passage.text),
+          embedder(output),
+        ]);
         semanticDrift = this.cosineDist(inputEmbed, outputEmbed);
 
         if (semanticDrift > this.suite.metrics.semanticDriftThreshold) {
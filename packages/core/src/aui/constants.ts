@@ -383,3 +383,14 @@ export const MAX_TOOL_RESULT_SIZE = 10_000;
  * Maximum conversation history to include in reasoning context.
  */
 export const MAX_HISTORY_IN_CONTEXT = 10;
+
+/**
+ * Maximum number of cached tool results held by the tool registry.
+ */
+export const MAX_TOOL_CACHE_ENTRIES = 256;
+
+/**
+ * Maximum number of tool handlers the tool registry runs at once.
+ * Further calls wait in FIFO order for a free slot.
+ */
+export const MAX_CONCURRENT_TOOLS = 8;
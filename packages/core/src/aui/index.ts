@@ -152,6 +152,8 @@ export {
   DESTRUCTIVE_TOOLS,
   MAX_TOOL_RESULT_SIZE,
   MAX_HISTORY_IN_CONTEXT,
+  MAX_TOOL_CACHE_ENTRIES,
+  MAX_CONCURRENT_TOOLS,
 } from './constants.js';
 
 // ═══════════════════════════════════════════════════════════════════════════
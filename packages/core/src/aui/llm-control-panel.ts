@@ -14,13 +14,11 @@
  * @module aui/llm-control-panel
  */
 
-import { randomUUID } from 'crypto';
 import type {
   ModelRegistry,
   VettedModel,
   VettingStatus,
   BenchmarkResult,
-  PerformanceProfile,
   ModelCapability,
 } from '../models/model-registry.js';
 import { getModelRegistry } from '../models/default-model-registry.js';
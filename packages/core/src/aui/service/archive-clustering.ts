@@ -38,7 +38,6 @@ export function createArchiveMethods(deps: ServiceDependencies): ArchiveMethods
       }
 
       const storeStats = await store.getStats();
-      const nodesNeedingEmbeddings = await store.getNodesNeedingEmbeddings(1);
 
       return {
         totalNodes: storeStats.totalNodes,
@@ -83,20 +82,13 @@ export function createArchiveMethods(deps: ServiceDependencies): ArchiveMethods
           };
         }
 
+        // Word count is filtered in the database (stored word_count column)
         const limit = options?.limit || 100000;
-        const nodesNeedingEmbeddings = await store.getNodesNeedingEmbeddings(limit);
+        const minWordCount = options?.minWordCount ?? 7;
+        const nodesNeedingEmbeddings = await store.getNodesNeedingEmbeddings(limit, minWordCount);
 
         let nodesToEmbed: StoredNode[] = nodesNeedingEmbeddings;
 
-        // Filter by word count
-        const minWordCount = options?.minWordCount ?? 7;
-        if (minWordCount > 0) {
-          nodesToEmbed = nodesToEmbed.filter((node: StoredNode) => {
-            const wordCount = node.text?.split(/\s+/).filter(Boolean).length || 0;
-            return wordCount >= minWordCount;
-          });
-        }
-
         // Filter by source type
         if (options?.sourceTypes?.length) {
           nodesToEmbed = nodesToEmbed.filter((node: StoredNode) =>
@@ -242,8 +234,7 @@ export function createArchiveMethods(deps: ServiceDependencies): ArchiveMethods
           };
         }
 
-        const nodes = await Promise.all(nodeIds.map(id => store.getNode(id)));
-        const validNodes = nodes.filter(Boolean) as any[];
+        const validNodes = (await store.getNodes(nodeIds)) as any[];
 
         const results = await embeddingService.embedNodes(validNodes);
 
@@ -321,8 +312,10 @@ export function createClusteringMethods(deps: ServiceDependencies): ClusteringMe
           });
         }
 
+        // Word count is filtered in the database (stored word_count column)
         const sampleSize = options?.sampleSize || 500;
-        const randomNodeIds = await store.getRandomEmbeddedNodeIds(sampleSize);
+        const minWordCount = options?.minWordCount ?? 7;
+        const randomNodeIds = await store.getRandomEmbeddedNodeIds(sampleSize, minWordCount);
 
         if (randomNodeIds.length === 0) {
           return {
@@ -334,23 +327,10 @@ export function createClusteringMethods(deps: ServiceDependencies): ClusteringMe
           };
         }
 
-        const nodes: StoredNode[] = [];
-        for (const id of randomNodeIds) {
-          const node = await store.getNode(id);
-          if (node) nodes.push(node);
-        }
+        const nodes = await store.getNodes(randomNodeIds);
 
         let filteredNodes = nodes;
 
-        // Filter by word count
-        const minWordCount = options?.minWordCount ?? 7;
-        if (minWordCount > 0) {
-          filteredNodes = filteredNodes.filter(node => {
-            const wordCount = node.text?.split(/\s+/).filter(Boolean).length || 0;
-            return wordCount >= minWordCount;
-          });
-        }
-
         // Filter by exclude patterns
         if (options?.excludePatterns?.length) {
           const patterns = options.excludePatterns.map(p => new RegExp(p, 'i'));
@@ -389,12 +369,13 @@ export function createClusteringMethods(deps: ServiceDependencies): ClusteringMe
         const assigned = new Set<string>();
 
         const seedCandidates = filteredNodes.slice(0, Math.min(filteredNodes.length, 100));
+        const seedEmbeddings = await store.getEmbeddings(seedCandidates.map(n => n.id));
 
         for (const seedNode of seedCandidates) {
           if (assigned.has(seedNode.id)) continue;
           if (clusters.length >= maxClusters) break;
 
-          const seedEmbedding = await store.getEmbedding(seedNode.id);
+          const seedEmbedding = seedEmbeddings.get(seedNode.id);
           if (!seedEmbedding) continue;
 
           const similarResults = await store.searchByEmbedding(seedEmbedding, {
@@ -452,11 +433,16 @@ export function createClusteringMethods(deps: ServiceDependencies): ClusteringMe
             }
 
             // Date range
-            const dates = clusterPassages.filter(p => p.sourceCreatedAt).map(p => p.sourceCreatedAt!);
-            const earliest =
-              dates.length > 0 ? new Date(Math.min(...dates.map(d => d.getTime()))) : null;
-            const latest =
-              dates.length > 0 ? new Date(Math.max(...dates.map(d => d.getTime()))) : null;
+            let minTime = Infinity;
+            let maxTime = -Infinity;
+            for (const p of clusterPassages) {
+              if (!p.sourceCreatedAt) continue;
+              const time = p.sourceCreatedAt.getTime();
+              if (time < minTime) minTime = time;
+              if (time > maxTime) maxTime = time;
+            }
+            const earliest = minTime !== Infinity ? new Date(minTime) : null;
+            const latest = maxTime !== -Infinity ? new Date(maxTime) : null;
 
             const cluster: ContentCluster = {
               id: `cluster-${clusters.length + 1}`,
@@ -10,7 +10,7 @@
  * @module @humanizer/core/aui/service/archive-subset-service
  */
 
-import type { Pool, PoolClient } from 'pg';
+import type { Pool } from 'pg';
 import { randomUUID } from 'crypto';
 import type {
   ArchiveSubset,
@@ -20,13 +20,11 @@ import type {
   SubsetSharingMode,
   CloudDestination,
   SubsetEncryption,
-  SubsetNodeMapping,
   SubsetExportJob,
   ExportJobStatus,
   SensitivityLevel,
   SensitiveContentMarker,
   SensitiveContentType,
-  SensitivityDetectionConfig,
   SubsetStats,
 } from '../types/subset-types';
 import type { StoredNode, QueryOptions, AuthorRole } from '../../storage/types';
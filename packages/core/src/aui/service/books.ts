@@ -9,6 +9,7 @@
 import type {
   Book,
   BookChapter,
+  BookSummary,
   BookFromClusterOptions,
   HarvestOptions,
   HarvestResult,
@@ -20,7 +21,6 @@ import type {
   PersonaProfile,
   StyleProfile,
   AuiArtifact,
-  CreateArtifactOptions,
 } from '../../storage/aui-postgres-store.js';
 import type { ContentBuffer, ProvenanceChain, BufferOperation } from '../../buffer/types.js';
 import { getBuilderAgent, mergePersonaWithStyle, type PersonaProfileForRewrite } from '../../houses/builder.js';
@@ -48,6 +48,7 @@ export interface BookMethods {
   harvest(options: HarvestOptions): Promise<HarvestResult>;
   generateArc(options: GenerateArcOptions): Promise<NarrativeArc>;
   listBooks(options?: { userId?: string; limit?: number }): Promise<Book[]>;
+  listBookSummaries(options?: { userId?: string; limit?: number }): Promise<BookSummary[]>;
   getBook(bookId: string): Promise<Book | undefined>;
 }
 
@@ -686,6 +687,33 @@ export function createBookMethods(
       return Array.from(deps.getBooks().values());
     },
 
+    async listBookSummaries(options?: { userId?: string; limit?: number }): Promise<BookSummary[]> {
+      const store = deps.getStore();
+      if (store) {
+        try {
+          return await store.listBookSummaries(options);
+        } catch (error) {
+          console.warn('Failed to list book summaries from store:', error);
+        }
+      }
+
+      // Match the store: filter by user, newest first, default limit 100
+      return Array.from(deps.getBooks().values())
+        .filter((book) => !options?.userId || book.userId === options.userId)
+        .sort((a, b) => b.updatedAt.getTime() - a.updatedAt.getTime())
+        .slice(0, options?.limit ?? 100)
+        .map((book) => ({
+          id: book.id,
+          title: book.title,
+          description: book.description,
+          status: book.status,
+          chapterCount: book.chapters.length,
+          wordCount: book.chapters.reduce((sum, ch) => sum + ch.wordCount, 0),
+          createdAt: book.createdAt,
+          updatedAt: book.updatedAt,
+        }));
+    },
+
     async getBook(bookId: string): Promise<Book | undefined> {
       let book = deps.getBooks().get(bookId);
       if (book) return book;
@@ -106,6 +106,7 @@ function createMockBookMethods(): BookMethods {
     }),
     generateArc: vi.fn(),
     listBooks: vi.fn(),
+    listBookSummaries: vi.fn(),
     getBook: vi.fn(),
   } as unknown as BookMethods;
 }
@@ -14,7 +14,6 @@ import { randomUUID } from 'crypto';
 import * as fs from 'fs/promises';
 import * as path from 'path';
 import type {
-  DraftSource,
   AuiArchiveSource,
   AuiClusterSource,
   FilePathSource,
@@ -29,11 +28,9 @@ import type {
   NarratorPersona,
   ExportConfig,
   ExportedArtifact,
-  ExportFormat,
   StartDraftingOptions,
   GenerateDraftOptions,
   ReviseDraftOptions,
-  DraftingProgress,
   DraftingProgressCallback,
 } from '../types/drafting-types.js';
 import type { ServiceDependencies } from './types.js';
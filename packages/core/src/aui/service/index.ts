@@ -52,6 +52,7 @@ import type {
   NarrativeArc,
   Book,
   BookChapter,
+  BookSummary,
 } from '../types.js';
 import type { AgenticLoop } from '../agentic-loop.js';
 import type { AdminService } from '../admin-service.js';
@@ -68,7 +69,6 @@ import type {
   AuiArtifact,
   PersonaProfile,
   StyleProfile,
-  CreatePersonaProfileOptions,
   CreateStyleProfileOptions,
 } from '../../storage/aui-postgres-store.js';
 import type { BooksPostgresStore } from '../../storage/books-postgres-store.js';
@@ -599,6 +599,10 @@ export class UnifiedAuiService {
   listBooks = (options?: { userId?: string; limit?: number }): Promise<Book[]> =>
     this.bookMethods.listBooks(options);
 
+  listBookSummaries = (
+    options?: Parameters<BookMethods['listBookSummaries']>[0]
+  ): Promise<BookSummary[]> => this.bookMethods.listBookSummaries(options);
+
   getBook = (bookId: string): Promise<Book | undefined> => this.bookMethods.getBook(bookId);
 
   // ═══════════════════════════════════════════════════════════════════════════
@@ -140,7 +140,7 @@ export class PreferencesService {
       userId,
       tenant,
       JSON.stringify(mergedModelPrefs),
-      JSON.stringify(existing.promptCustomizations), // Don't modify prompts here
+      null, // Don't modify prompts here
       JSON.stringify(mergedTransformDefaults),
       JSON.stringify(mergedUiPrefs),
     ]);
@@ -221,10 +221,10 @@ export class PreferencesService {
     await this.pool.query(UPSERT_AUI_USER_PREFERENCES, [
       userId,
       tenant,
-      JSON.stringify(existing.modelPreferences),
+      null, // Only the prompts column changes
       JSON.stringify(updatedPrompts),
-      JSON.stringify(existing.transformationDefaults),
-      JSON.stringify(existing.uiPreferences),
+      null,
+      null,
     ]);
 
     return prompt;
@@ -265,10 +265,10 @@ export class PreferencesService {
     await this.pool.query(UPSERT_AUI_USER_PREFERENCES, [
       userId,
       tenant,
-      JSON.stringify(existing.modelPreferences),
+      null, // Only the prompts column changes
       JSON.stringify(updatedPrompts),
-      JSON.stringify(existing.transformationDefaults),
-      JSON.stringify(existing.uiPreferences),
+      null,
+      null,
     ]);
 
     return updated;
@@ -291,10 +291,10 @@ export class PreferencesService {
     await this.pool.query(UPSERT_AUI_USER_PREFERENCES, [
       userId,
       tenant,
-      JSON.stringify(existing.modelPreferences),
+      null, // Only the prompts column changes
       JSON.stringify(remainingPrompts),
-      JSON.stringify(existing.transformationDefaults),
-      JSON.stringify(existing.uiPreferences),
+      null,
+      null,
     ]);
 
     return true;
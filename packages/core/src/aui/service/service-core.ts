@@ -7,7 +7,6 @@
  * @module @humanizer/core/aui/service/service-core
  */
 
-import type { Pool } from 'pg';
 import type {
   UnifiedAuiSession,
   ProcessOptions,
@@ -28,7 +27,6 @@ import type {
   LimitCheckResult,
 } from '../types.js';
 import type {
-  AgenticSearchService,
   AgenticSearchOptions,
   AgenticSearchResponse,
   RefineOptions,
@@ -39,12 +37,9 @@ import type { PromptTemplate } from '../../config/types.js';
 import type { AuiPostgresStore } from '../../storage/aui-postgres-store.js';
 import type { BooksPostgresStore } from '../../storage/books-postgres-store.js';
 import type { PostgresContentStore } from '../../storage/postgres-content-store.js';
-import type { BufferService, ArchiveStoreAdapter, BooksStoreAdapter, AuiStoreAdapter } from '../../buffer/buffer-service.js';
+import type { ArchiveStoreAdapter, BooksStoreAdapter, AuiStoreAdapter } from '../../buffer/buffer-service.js';
 import type { ContentBuffer, ProvenanceChain } from '../../buffer/types.js';
-import { BufferServiceImpl } from '../../buffer/buffer-service-impl.js';
-import type { AuiSessionManager } from './session-manager.js';
 import type { ServiceDependencies } from './types.js';
-import type { BufferManager } from '../buffer-manager.js';
 import { getModelRegistry } from '../../models/index.js';
 
 // ═══════════════════════════════════════════════════════════════════════════
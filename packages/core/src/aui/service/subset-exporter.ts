@@ -16,17 +16,15 @@
  */
 
 import type { Pool } from 'pg';
-import { createWriteStream, promises as fs } from 'fs';
+import { promises as fs } from 'fs';
 import { join } from 'path';
-import { pipeline } from 'stream/promises';
-import { Readable } from 'stream';
 import { createGzip } from 'zlib';
 import type {
   ArchiveSubset,
   SubsetExportFormat,
   SubsetExportJob,
-  CloudDestination,
   SensitivityLevel,
+  SensitiveContentMarker,
 } from '../types/subset-types';
 import type { StoredNode } from '../../storage/types';
 import type { ArchiveSubsetService } from './archive-subset-service';
@@ -37,9 +35,7 @@ import type {
 } from '../../storage/r2-storage-adapter';
 import {
   generateSubsetExportKey,
-  generateSharedKey,
   createAccessPolicy,
-  generateAccessToken,
   calculateContentHash,
 } from '../../storage/r2-storage-adapter';
 
@@ -91,6 +87,23 @@ export interface FormatterOptions {
   prettyPrint?: boolean;
 }
 
+// ═══════════════════════════════════════════════════════════════════
+// CONSTANTS
+// ═══════════════════════════════════════════════════════════════════
+
+/** Stylesheet embedded in every HTML export */
+const HTML_EXPORT_STYLE = [
+  '<style>',
+  'body { font-family: system-ui, -apple-system, sans-serif; max-width: 800px; margin: 0 auto; padding: 20px; line-height: 1.6; }',
+  '.message { margin: 20px 0; padding: 15px; border-radius: 8px; }',
+  '.user { background: #e8f4f8; }',
+  '.assistant { background: #f5f5f5; }',
+  '.author { font-weight: bold; margin-bottom: 10px; }',
+  '.metadata { color: #666; font-size: 0.9em; margin-top: 10px; }',
+  'hr { border: none; border-top: 1px solid #ddd; margin: 30px 0; }',
+  '</style>',
+].join('\n');
+
 // ═══════════════════════════════════════════════════════════════════
 // SUBSET EXPORTER SERVICE
 // ═══════════════════════════════════════════════════════════════════
@@ -150,6 +163,7 @@ export class SubsetExporterService {
       const nodeIds = mappings
         .filter((m) => m.user_override !== 'exclude')
         .map((m) => m.node_id);
+      const mappingsByNode = new Map(mappings.map((m) => [m.node_id, m]));
 
       // Fetch nodes in batches
       const chunkSize = options?.chunkSize ?? 100;
@@ -162,10 +176,9 @@ export class SubsetExporterService {
 
         // Apply redaction if needed
         for (const node of batchNodes) {
-          const mapping = mappings.find((m) => m.node_id === node.id);
+          const mapping = mappingsByNode.get(node.id);
           if (mapping?.redacted && mapping.sensitivity_markers) {
-            const markers = JSON.parse(mapping.sensitivity_markers);
-            node.text = this.subsetService.redactText(node.text, markers);
+            node.text = this.subsetService.redactText(node.text, mapping.sensitivity_markers);
             redactedCount++;
           }
           nodes.push(node);
@@ -242,13 +255,13 @@ export class SubsetExporterService {
     node_id: string;
     sensitivity_level: SensitivityLevel;
     redacted: boolean;
-    sensitivity_markers: string | null;
+    sensitivity_markers: SensitiveContentMarker[] | null;
     user_override: string | null;
   }>> {
     const client = await this.pool.connect();
     try {
       const result = await client.query(
-        `SELECT node_id, sensitivity_level, redacted, sensitivity_markers::text, user_override
+        `SELECT node_id, sensitivity_level, redacted, sensitivity_markers, user_override
          FROM aui_subset_node_mappings
          WHERE subset_id = $1
          ORDER BY position ASC`,
@@ -336,22 +349,19 @@ export class SubsetExporterService {
    * Format as Markdown
    */
   private formatMarkdown(nodes: StoredNode[], options: FormatterOptions): Buffer {
-    const lines: string[] = [];
+    // Appended straight onto one string: V8 concatenation is cheap and the
+    // result is flattened once, where a line array held every fragment
+    // (six per node) until the final join
+    let md = '';
 
     // Header
-    lines.push(`# ${options.subset.name}`);
-    lines.push('');
+    md += `# ${options.subset.name}\n\n`;
     if (options.subset.description) {
-      lines.push(options.subset.description);
-      lines.push('');
+      md += `${options.subset.description}\n\n`;
     }
 
     if (options.includeMetadata) {
-      lines.push('---');
-      lines.push(`**Exported:** ${new Date().toISOString()}`);
-      lines.push(`**Nodes:** ${nodes.length}`);
-      lines.push('---');
-      lines.push('');
+      md += `---\n**Exported:** ${new Date().toISOString()}\n**Nodes:** ${nodes.length}\n---\n\n`;
     }
 
     // Group by thread if available
@@ -367,23 +377,18 @@ export class SubsetExporterService {
     // Output by thread
     for (const [threadId, threadNodes] of byThread) {
       if (threadId !== 'standalone' && threadNodes[0]?.title) {
-        lines.push(`## ${threadNodes[0].title}`);
-        lines.push('');
+        md += `## ${threadNodes[0].title}\n\n`;
       }
 
       for (const node of threadNodes) {
         // Author label
         const author = node.authorRole === 'assistant' ? '**Assistant:**' : '**User:**';
-        lines.push(author);
-        lines.push('');
-        lines.push(node.text);
-        lines.push('');
-        lines.push('---');
-        lines.push('');
+        md += `${author}\n\n${node.text}\n\n---\n\n`;
       }
     }
 
-    return Buffer.from(lines.join('\n'), 'utf-8');
+    // Every line above ends in a newline; the joined form had none after the last
+    return Buffer.from(md.slice(0, -1), 'utf-8');
   }
 
   /**
@@ -405,15 +410,7 @@ export class SubsetExporterService {
       '<meta charset="UTF-8">',
       '<meta name="viewport" content="width=device-width, initial-scale=1.0">',
       `<title>${escapeHtml(options.subset.name)}</title>`,
-      '<style>',
-      'body { font-family: system-ui, -apple-system, sans-serif; max-width: 800px; margin: 0 auto; padding: 20px; line-height: 1.6; }',
-      '.message { margin: 20px 0; padding: 15px; border-radius: 8px; }',
-      '.user { background: #e8f4f8; }',
-      '.assistant { background: #f5f5f5; }',
-      '.author { font-weight: bold; margin-bottom: 10px; }',
-      '.metadata { color: #666; font-size: 0.9em; margin-top: 10px; }',
-      'hr { border: none; border-top: 1px solid #ddd; margin: 30px 0; }',
-      '</style>',
+      HTML_EXPORT_STYLE,
       '</head>',
       '<body>',
       `<h1>${escapeHtml(options.subset.name)}</h1>`,
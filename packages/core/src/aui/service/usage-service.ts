@@ -21,6 +21,7 @@ import {
   GET_AUI_USER_USAGE_SNAPSHOT,
   UPSERT_AUI_USER_USAGE_SNAPSHOT,
   INCREMENT_AUI_USER_USAGE,
+  UPSERT_AUI_USER_USAGE_BREAKDOWNS,
   GET_AUI_USAGE_EVENTS_AGGREGATE,
   GET_AUI_TIER_DEFAULT,
   GET_AUI_USER_QUOTA_OVERRIDE,
@@ -448,10 +449,9 @@ export class UsageService {
         entry.requestId ?? null,
         entry.apiKeyId ?? null,
         billingPeriod,
-        new Date(),
       ]);
 
-      // 2. Update usage snapshot (atomic increment)
+      // 2. Update usage snapshot totals (atomic increment)
       const totalTokens = entry.tokensInput + entry.tokensOutput;
       const result = await client.query(INCREMENT_AUI_USER_USAGE, [
         entry.userId,
@@ -474,12 +474,20 @@ export class UsageService {
           tierDefaults.tokensPerMonth,
           tierDefaults.requestsPerMonth,
           tierDefaults.costCentsPerMonth * 1000, // Convert cents to millicents
-          JSON.stringify({ [entry.modelId]: { tokens: totalTokens, requests: 1, cost: userCharge } }),
-          JSON.stringify({ [entry.operationType]: { tokens: totalTokens, requests: 1, cost: userCharge } }),
-          new Date(),
         ]);
       }
 
+      // 3. Bump the per-model and per-operation breakdown rows
+      await client.query(UPSERT_AUI_USER_USAGE_BREAKDOWNS, [
+        entry.userId,
+        tenant,
+        billingPeriod,
+        entry.modelId,
+        entry.operationType,
+        totalTokens,
+        userCharge,
+      ]);
+
       await client.query('COMMIT');
 
       // Invalidate cache
@@ -1101,9 +1109,6 @@ export class UsageService {
       newSnapshot.tokensLimit,
       newSnapshot.requestsLimit,
       newSnapshot.costLimitMillicents,
-      '{}', // by_model
-      '{}', // by_operation
-      new Date(),
     ]);
 
     this.snapshotCache.set(cacheKey, {
@@ -426,6 +426,29 @@ describe('TaskEmbeddingService', () => {
         expect(threshold).toBeGreaterThanOrEqual(0.5);
         expect(threshold).toBeLessThanOrEqual(0.9);
       });
+
+      it('should only consider the most recent window of tasks', async () => {
+        service.setThresholdConfig({ recentTaskWindow: 10 });
+
+        // Older failures fall out of the window once newer successes arrive
+        for (let i = 0; i < 20; i++) {
+          const embedding = await service.embedTask(`task ${i}`);
+          await service.recordTaskCompletion(
+            `task-${i}`,
+            `task ${i}`,
+            embedding,
+            'builder',
+            { taskId: `task-${i}`, success: i >= 10 }
+          );
+        }
+
+        const threshold = await service.getAdaptiveThreshold({
+          baseThreshold: 0.7,
+          adaptFromHistory: true,
+        });
+
+        expect(threshold).toBeLessThan(0.7);
+      });
     });
   });
 
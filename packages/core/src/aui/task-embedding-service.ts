@@ -16,8 +16,6 @@
  * @module aui/task-embedding-service
  */
 
-import { randomUUID } from 'crypto';
-
 // ═══════════════════════════════════════════════════════════════════════════
 // TYPES
 // ═══════════════════════════════════════════════════════════════════════════
@@ -192,6 +190,10 @@ export class TaskEmbeddingService {
   private outcomes: Map<string, TaskOutcome> = new Map();
   private embedder?: Embedder;
 
+  /** Outcomes of the last recentTaskWindow completions, oldest first */
+  private recentWindow: TaskOutcome[] = [];
+  private recentWindowSuccesses = 0;
+
   private decayConfig: TemporalDecayConfig;
   private thresholdConfig: AdaptiveThresholdConfig;
   private options: Required<Omit<TaskEmbeddingServiceOptions, 'decay' | 'threshold'>>;
@@ -429,6 +431,7 @@ export class TaskEmbeddingService {
 
     // Store outcome
     this.outcomes.set(taskId, outcome);
+    this.pushRecentOutcome(outcome);
 
     return record;
   }
@@ -476,17 +479,14 @@ export class TaskEmbeddingService {
       return base;
     }
 
-    const recentOutcomes = await this.getRecentTaskOutcomes(
-      this.thresholdConfig.recentTaskWindow
-    );
-
-    if (recentOutcomes.length < 10) {
+    // The window and its success count are maintained as tasks complete,
+    // so routing never rescans and re-sorts the whole history
+    if (this.recentWindow.length < 10) {
       // Not enough data to adapt
       return base;
     }
 
-    const successRate =
-      recentOutcomes.filter((o) => o.success).length / recentOutcomes.length;
+    const successRate = this.recentWindowSuccesses / this.recentWindow.length;
 
     // Adjust threshold based on success rate vs target
     // If success rate is high, we can be more permissive (lower threshold)
@@ -502,6 +502,13 @@ export class TaskEmbeddingService {
    * Get recent task outcomes for threshold adaptation
    */
   async getRecentTaskOutcomes(limit: number): Promise<TaskOutcome[]> {
+    return this.collectRecentOutcomes(limit);
+  }
+
+  /**
+   * Collect the most recent outcomes across all agents, newest first
+   */
+  private collectRecentOutcomes(limit: number): TaskOutcome[] {
     // Collect all outcomes and sort by recency
     const allOutcomes: Array<{ outcome: TaskOutcome; timestamp: Date }> = [];
 
@@ -525,7 +532,34 @@ export class TaskEmbeddingService {
    * Update threshold configuration
    */
   setThresholdConfig(config: Partial<AdaptiveThresholdConfig>): void {
+    const previousWindow = this.thresholdConfig.recentTaskWindow;
     this.thresholdConfig = { ...this.thresholdConfig, ...config };
+
+    if (this.thresholdConfig.recentTaskWindow !== previousWindow) {
+      this.rebuildRecentWindow();
+    }
+  }
+
+  /**
+   * Append a completed task's outcome to the recent window, evicting the
+   * oldest once it exceeds recentTaskWindow
+   */
+  private pushRecentOutcome(outcome: TaskOutcome): void {
+    this.recentWindow.push(outcome);
+    if (outcome.success) this.recentWindowSuccesses++;
+
+    while (this.recentWindow.length > this.thresholdConfig.recentTaskWindow) {
+      const evicted = this.recentWindow.shift()!;
+      if (evicted.success) this.recentWindowSuccesses--;
+    }
+  }
+
+  /**
+   * Rebuild the recent window from history (after the window size changes)
+   */
+  private rebuildRecentWindow(): void {
+    this.recentWindow = this.collectRecentOutcomes(this.thresholdConfig.recentTaskWindow).reverse();
+    this.recentWindowSuccesses = this.recentWindow.filter((o) => o.success).length;
   }
 
   // ─────────────────────────────────────────────────────────────────────────
@@ -640,6 +674,8 @@ export class TaskEmbeddingService {
   clear(): void {
     this.history.clear();
     this.outcomes.clear();
+    this.recentWindow = [];
+    this.recentWindowSuccesses = 0;
   }
 
   /**
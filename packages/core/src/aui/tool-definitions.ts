@@ -21,11 +21,33 @@ function param(
   return { type, description, ...extra };
 }
 
+// ═══════════════════════════════════════════════════════════════════════════
+// HELPER: Freeze definitions
+// ═══════════════════════════════════════════════════════════════════════════
+
+/**
+ * Deep-freeze a list of tool definitions.
+ *
+ * Definitions are shared by the registry, the prompt builder's tool-list
+ * cache and the result cache, so none of them may change after load.
+ */
+function defineTools(tools: ToolDefinition[]): readonly ToolDefinition[] {
+  for (const tool of tools) {
+    for (const parameter of Object.values(tool.parameters)) {
+      Object.freeze(parameter);
+    }
+    Object.freeze(tool.parameters);
+    if (tool.required) Object.freeze(tool.required);
+    Object.freeze(tool);
+  }
+  return Object.freeze(tools);
+}
+
 // ═══════════════════════════════════════════════════════════════════════════
 // DRAFTING TOOLS
 // ═══════════════════════════════════════════════════════════════════════════
 
-export const DRAFTING_TOOLS: ToolDefinition[] = [
+export const DRAFTING_TOOLS: readonly ToolDefinition[] = defineTools([
   {
     name: 'draft_start',
     description: 'Start a new drafting session to create content from multiple sources. Sources can be AUI archives, clusters, file paths, URLs, or direct text.',
@@ -126,13 +148,13 @@ export const DRAFTING_TOOLS: ToolDefinition[] = [
     required: ['sessionId'],
     isDestructive: true,
   },
-];
+]);
 
 // ═══════════════════════════════════════════════════════════════════════════
 // SEARCH/ARCHIVE TOOLS
 // ═══════════════════════════════════════════════════════════════════════════
 
-export const SEARCH_TOOLS: ToolDefinition[] = [
+export const SEARCH_TOOLS: readonly ToolDefinition[] = defineTools([
   {
     name: 'search_archive',
     description: 'Semantic search across the AUI archive. Returns passages ranked by relevance.',
@@ -145,6 +167,7 @@ export const SEARCH_TOOLS: ToolDefinition[] = [
       authorRoles: param('array', 'Filter by author roles (user, assistant)'),
     },
     required: ['query'],
+    cacheTtlMs: 60_000,
   },
   {
     name: 'search_refine',
@@ -177,6 +200,7 @@ export const SEARCH_TOOLS: ToolDefinition[] = [
       limit: param('number', 'Maximum clusters to return'),
     },
     required: [],
+    cacheTtlMs: 60_000,
   },
   {
     name: 'cluster_get',
@@ -185,12 +209,14 @@ export const SEARCH_TOOLS: ToolDefinition[] = [
       clusterId: param('string', 'Cluster ID'),
     },
     required: ['clusterId'],
+    cacheTtlMs: 300_000,
   },
   {
     name: 'archive_stats',
     description: 'Get archive statistics including node counts, embedding coverage, and source distribution.',
     parameters: {},
     required: [],
+    cacheTtlMs: 60_000,
   },
   {
     name: 'archive_embed',
@@ -203,13 +229,13 @@ export const SEARCH_TOOLS: ToolDefinition[] = [
     },
     required: [],
   },
-];
+]);
 
 // ═══════════════════════════════════════════════════════════════════════════
 // MEDIA/TRANSCRIPTION TOOLS
 // ═══════════════════════════════════════════════════════════════════════════
 
-export const MEDIA_TOOLS: ToolDefinition[] = [
+export const MEDIA_TOOLS: readonly ToolDefinition[] = defineTools([
   {
     name: 'media_list',
     description: 'List media items in an archive (images, audio, video).',
@@ -220,6 +246,7 @@ export const MEDIA_TOOLS: ToolDefinition[] = [
       offset: param('number', 'Offset for pagination'),
     },
     required: ['archiveId'],
+    cacheTtlMs: 60_000,
   },
   {
     name: 'media_get',
@@ -228,6 +255,7 @@ export const MEDIA_TOOLS: ToolDefinition[] = [
       mediaId: param('string', 'Media item ID'),
     },
     required: ['mediaId'],
+    cacheTtlMs: 300_000,
   },
   {
     name: 'transcribe_start',
@@ -292,13 +320,13 @@ export const MEDIA_TOOLS: ToolDefinition[] = [
     required: ['versionId'],
     isDestructive: true,
   },
-];
+]);
 
 // ═══════════════════════════════════════════════════════════════════════════
 // BOOK TOOLS
 // ═══════════════════════════════════════════════════════════════════════════
 
-export const BOOK_TOOLS: ToolDefinition[] = [
+export const BOOK_TOOLS: readonly ToolDefinition[] = defineTools([
   {
     name: 'book_harvest',
     description: 'Harvest passages from the archive based on a query. Returns ranked passages for book creation.',
@@ -359,6 +387,7 @@ export const BOOK_TOOLS: ToolDefinition[] = [
       limit: param('number', 'Maximum books to return'),
     },
     required: [],
+    cacheTtlMs: 60_000,
   },
   {
     name: 'book_get',
@@ -367,6 +396,7 @@ export const BOOK_TOOLS: ToolDefinition[] = [
       bookId: param('string', 'Book ID'),
     },
     required: ['bookId'],
+    cacheTtlMs: 60_000,
   },
   {
     name: 'book_add_chapter',
@@ -418,34 +448,34 @@ export const BOOK_TOOLS: ToolDefinition[] = [
     required: ['bookId', 'chapterId'],
     isDestructive: true,
   },
-];
+]);
 
 // ═══════════════════════════════════════════════════════════════════════════
 // ALL TOOLS (Combined)
 // ═══════════════════════════════════════════════════════════════════════════
 
-export const ALL_TOOL_DEFINITIONS: ToolDefinition[] = [
+export const ALL_TOOL_DEFINITIONS: readonly ToolDefinition[] = Object.freeze([
   ...DRAFTING_TOOLS,
   ...SEARCH_TOOLS,
   ...MEDIA_TOOLS,
   ...BOOK_TOOLS,
-];
+]);
 
 // ═══════════════════════════════════════════════════════════════════════════
 // TOOL CATEGORIES
 // ═══════════════════════════════════════════════════════════════════════════
 
-export const TOOL_CATEGORIES = {
-  drafting: DRAFTING_TOOLS.map(t => t.name),
-  search: SEARCH_TOOLS.map(t => t.name),
-  media: MEDIA_TOOLS.map(t => t.name),
-  books: BOOK_TOOLS.map(t => t.name),
-} as const;
+export const TOOL_CATEGORIES = Object.freeze({
+  drafting: Object.freeze(DRAFTING_TOOLS.map(t => t.name)),
+  search: Object.freeze(SEARCH_TOOLS.map(t => t.name)),
+  media: Object.freeze(MEDIA_TOOLS.map(t => t.name)),
+  books: Object.freeze(BOOK_TOOLS.map(t => t.name)),
+});
 
 /**
  * Get tools by category
  */
-export function getToolsByCategory(category: keyof typeof TOOL_CATEGORIES): ToolDefinition[] {
+export function getToolsByCategory(category: keyof typeof TOOL_CATEGORIES): readonly ToolDefinition[] {
   switch (category) {
     case 'drafting':
       return DRAFTING_TOOLS;
@@ -460,11 +490,22 @@ export function getToolsByCategory(category: keyof typeof TOOL_CATEGORIES): Tool
   }
 }
 
+/**
+ * Tool definitions indexed by name (first definition wins)
+ */
+const TOOL_DEFINITIONS_BY_NAME: ReadonlyMap<string, ToolDefinition> = (() => {
+  const byName = new Map<string, ToolDefinition>();
+  for (const def of ALL_TOOL_DEFINITIONS) {
+    if (!byName.has(def.name)) byName.set(def.name, def);
+  }
+  return byName;
+})();
+
 /**
  * Get a tool definition by name
  */
 export function getToolDefinition(name: string): ToolDefinition | undefined {
-  return ALL_TOOL_DEFINITIONS.find(t => t.name === name);
+  return TOOL_DEFINITIONS_BY_NAME.get(name);
 }
 
 /**
@@ -0,0 +1,284 @@
+/**
+ * ToolRegistry Tests
+ *
+ * Unit tests for tool registration and execution:
+ * - Registration and discovery
+ * - Result caching for read-only tools
+ * - Concurrency limiting
+ *
+ * @module @humanizer/core/aui/tool-registry.test
+ */
+
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+import { ToolRegistry } from './tool-registry.js';
+import { ALL_TOOL_DEFINITIONS } from './tool-definitions.js';
+import { MAX_TOOL_CACHE_ENTRIES } from './constants.js';
+import { BufferManager, resetBufferManager } from './buffer-manager.js';
+import type { ToolResult } from './types.js';
+
+describe('ToolRegistry', () => {
+  let bufferManager: BufferManager;
+  let registry: ToolRegistry;
+
+  beforeEach(() => {
+    resetBufferManager();
+    bufferManager = new BufferManager({ verbose: false });
+    registry = new ToolRegistry({ bufferManager });
+  });
+
+  afterEach(() => {
+    bufferManager.clear();
+    resetBufferManager();
+  });
+
+  // ═══════════════════════════════════════════════════════════════════════════
+  // REGISTRATION
+  // ═══════════════════════════════════════════════════════════════════════════
+
+  describe('Registration', () => {
+    it('registers builtin buffer tools', () => {
+      expect(registry.hasTool('buffer_list')).toBe(true);
+      expect(registry.hasTool('bql')).toBe(true);
+    });
+
+    it('registers custom tools with known definitions', () => {
+      registry.registerCustom('book_list', async () => ({ success: true, data: [] }));
+
+      const def = registry.getTool('book_list');
+      expect(def?.description).toContain('List books');
+      expect(def?.cacheTtlMs).toBeGreaterThan(0);
+    });
+
+    it('exposes immutable tool definitions', () => {
+      const def = ALL_TOOL_DEFINITIONS[0];
+
+      expect(Object.isFrozen(ALL_TOOL_DEFINITIONS)).toBe(true);
+      expect(Object.isFrozen(def)).toBe(true);
+      expect(Object.isFrozen(def.parameters)).toBe(true);
+    });
+
+    it('returns an error for unknown tools', async () => {
+      const result = await registry.execute('nope', {});
+      expect(result.success).toBe(false);
+      expect(result.error).toContain('Unknown tool');
+    });
+  });
+
+  // ═══════════════════════════════════════════════════════════════════════════
+  // RESULT CACHE
+  // ═══════════════════════════════════════════════════════════════════════════
+
+  describe('Result Cache', () => {
+    let handler: ReturnType<typeof vi.fn>;
+
+    beforeEach(() => {
+      handler = vi.fn(async (args: Record<string, unknown>): Promise<ToolResult> => ({
+        success: true,
+        data: { args },
+      }));
+      registry.registerCustom('cached_read', handler, { cacheTtlMs: 60_000 });
+    });
+
+    it('serves repeated calls from cache', async () => {
+      const first = await registry.execute('cached_read', { a: 1, b: 2 });
+      const second = await registry.execute('cached_read', { a: 1, b: 2 });
+
+      expect(handler).toHaveBeenCalledTimes(1);
+      expect(second.data).toEqual(first.data);
+    });
+
+    it('ignores argument key order', async () => {
+      await registry.execute('cached_read', { a: 1, b: { x: 1, y: 2 } });
+      await registry.execute('cached_read', { b: { y: 2, x: 1 }, a: 1 });
+
+      expect(handler).toHaveBeenCalledTimes(1);
+    });
+
+    it('executes calls with cyclic arguments without caching them', async () => {
+      const args: Record<string, unknown> = { a: 1 };
+      args.self = args;
+
+      const first = await registry.execute('cached_read', args);
+      await registry.execute('cached_read', args);
+
+      expect(first.success).toBe(true);
+      expect(handler).toHaveBeenCalledTimes(2);
+    });
+
+    it('still caches arguments that share a nested object', async () => {
+      const shared = { x: 1 };
+      await registry.execute('cached_read', { a: shared, b: shared });
+      await registry.execute('cached_read', { b: { x: 1 }, a: { x: 1 } });
+
+      expect(handler).toHaveBeenCalledTimes(1);
+    });
+
+    it('executes again for different arguments', async () => {
+      await registry.execute('cached_read', { a: 1 });
+      await registry.execute('cached_read', { a: 2 });
+
+      expect(handler).toHaveBeenCalledTimes(2);
+    });
+
+    it('does not cache failures', async () => {
+      handler.mockResolvedValueOnce({ success: false, error: 'boom' });
+
+      await registry.execute('cached_read', { a: 1 });
+      const retry = await registry.execute('cached_read', { a: 1 });
+
+      expect(handler).toHaveBeenCalledTimes(2);
+      expect(retry.success).toBe(true);
+    });
+
+    it('expires entries after the TTL', async () => {
+      vi.useFakeTimers();
+      try {
+        await registry.execute('cached_read', { a: 1 });
+        vi.advanceTimersByTime(60_001);
+        await registry.execute('cached_read', { a: 1 });
+
+        expect(handler).toHaveBeenCalledTimes(2);
+      } finally {
+        vi.useRealTimers();
+      }
+    });
+
+    it('invalidates cached reads after an uncached tool succeeds', async () => {
+      await registry.execute('cached_read', { a: 1 });
+      await registry.execute('buffer_create', { name: 'scratch' });
+      await registry.execute('cached_read', { a: 1 });
+
+      expect(handler).toHaveBeenCalledTimes(2);
+    });
+
+    it('invalidates cached reads after a raw BQL pipeline succeeds', async () => {
+      registry = new ToolRegistry({
+        bufferManager,
+        bqlExecutor: async () => ({ data: { saved: 1 } }),
+      });
+      registry.registerCustom('cached_read', handler, { cacheTtlMs: 60_000 });
+
+      await registry.execute('cached_read', { a: 1 });
+      await registry.executeBql('harvest "x" | save "books"');
+      await registry.execute('cached_read', { a: 1 });
+
+      expect(handler).toHaveBeenCalledTimes(2);
+    });
+
+    it('does not cache a read that was in flight during a write', async () => {
+      let release!: () => void;
+      const gate = new Promise<void>(resolve => { release = resolve; });
+      const slow = vi.fn(async (): Promise<ToolResult> => {
+        await gate;
+        return { success: true, data: 'before write' };
+      });
+      registry.registerCustom('slow_read', slow, { cacheTtlMs: 60_000 });
+
+      const read = registry.execute('slow_read', { q: 'x' });
+      await registry.execute('buffer_create', { name: 'scratch' });
+      release();
+      await read;
+      await registry.execute('slow_read', { q: 'x' });
+
+      expect(slow).toHaveBeenCalledTimes(2);
+    });
+
+    it('shares one execution between identical concurrent calls', async () => {
+      let release!: () => void;
+      const gate = new Promise<void>(resolve => { release = resolve; });
+      const slow = vi.fn(async (): Promise<ToolResult> => {
+        await gate;
+        return { success: true, data: 'done' };
+      });
+      registry.registerCustom('slow_read', slow, { cacheTtlMs: 60_000 });
+
+      const pending = Promise.all([
+        registry.execute('slow_read', { q: 'x' }),
+        registry.execute('slow_read', { q: 'x' }),
+      ]);
+      release();
+      const [a, b] = await pending;
+
+      expect(slow).toHaveBeenCalledTimes(1);
+      expect(a.data).toBe('done');
+      expect(b.data).toBe('done');
+    });
+
+    it('keeps recently read entries when the cache is full', async () => {
+      await registry.execute('cached_read', { n: 0 });
+      for (let i = 1; i <= MAX_TOOL_CACHE_ENTRIES; i++) {
+        // Touch entry 0 partway through so it is not the eviction candidate
+        if (i === 2) await registry.execute('cached_read', { n: 0 });
+        await registry.execute('cached_read', { n: i });
+      }
+      handler.mockClear();
+
+      await registry.execute('cached_read', { n: 0 });
+      expect(handler).not.toHaveBeenCalled();
+
+      await registry.execute('cached_read', { n: 1 });
+      expect(handler).toHaveBeenCalledTimes(1);
+    });
+
+    it('never caches tools without a TTL', async () => {
+      const uncached = vi.fn(async (): Promise<ToolResult> => ({ success: true }));
+      registry.registerCustom('plain', uncached);
+
+      await registry.execute('plain', {});
+      await registry.execute('plain', {});
+
+      expect(uncached).toHaveBeenCalledTimes(2);
+    });
+  });
+
+  // ═══════════════════════════════════════════════════════════════════════════
+  // CONCURRENCY
+  // ═══════════════════════════════════════════════════════════════════════════
+
+  describe('Concurrency', () => {
+    it('limits concurrent handler executions', async () => {
+      const limited = new ToolRegistry({ bufferManager, maxConcurrentTools: 2 });
+      let active = 0;
+      let peak = 0;
+      limited.registerCustom('slow', async () => {
+        active++;
+        peak = Math.max(peak, active);
+        await new Promise(resolve => setTimeout(resolve, 5));
+        active--;
+        return { success: true };
+      });
+
+      const results = await Promise.all(
+        Array.from({ length: 6 }, () => limited.execute('slow', {}))
+      );
+
+      expect(results.every(r => r.success)).toBe(true);
+      expect(peak).toBe(2);
+    });
+
+    it('releases slots when a handler throws', async () => {
+      const limited = new ToolRegistry({ bufferManager, maxConcurrentTools: 1 });
+      limited.registerCustom('boom', async () => {
+        throw new Error('boom');
+      });
+      limited.registerCustom('ok', async () => ({ success: true }));
+
+      expect((await limited.execute('boom', {})).success).toBe(false);
+      expect((await limited.execute('ok', {})).success).toBe(true);
+    });
+
+    it('runs the bql tool inside its own slot', async () => {
+      const limited = new ToolRegistry({
+        bufferManager,
+        maxConcurrentTools: 1,
+        bqlExecutor: async (pipeline) => ({ data: { pipeline } }),
+      });
+
+      const result = await limited.execute('bql', { pipeline: 'harvest "x"' });
+
+      expect(result.success).toBe(true);
+      expect(result.data).toEqual({ pipeline: 'harvest "x"' });
+      expect((await limited.executeBql('harvest "y"')).success).toBe(true);
+    });
+  });
+});
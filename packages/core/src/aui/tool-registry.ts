@@ -13,7 +13,8 @@ import type { DraftingMethods } from './service/drafting.js';
 import type { BookMethods, ArtifactMethods } from './service/books.js';
 import type { ClusteringMethods, ArchiveMethods } from './service/archive-clustering.js';
 import type { TranscriptionMethods } from './service/transcription.js';
-import { ALL_TOOL_DEFINITIONS, isDestructiveTool } from './tool-definitions.js';
+import { getToolDefinition, isDestructiveTool } from './tool-definitions.js';
+import { MAX_TOOL_CACHE_ENTRIES, MAX_CONCURRENT_TOOLS } from './constants.js';
 import { createDraftingToolHandlers } from './tools/drafting-tools.js';
 import { createSearchToolHandlers } from './tools/search-tools.js';
 import { createMediaToolHandlers } from './tools/media-tools.js';
@@ -49,6 +50,64 @@ export interface ToolRegistryDependencies {
   archiveMethods?: ArchiveMethods;
   transcriptionMethods?: TranscriptionMethods;
   bqlExecutor?: (pipeline: string) => Promise<{ data?: unknown; error?: string }>;
+  /** Maximum concurrent tool executions (default: MAX_CONCURRENT_TOOLS) */
+  maxConcurrentTools?: number;
+}
+
+// ═══════════════════════════════════════════════════════════════════════════
+// HELPERS
+// ═══════════════════════════════════════════════════════════════════════════
+
+/**
+ * Serialize a value as JSON with object keys sorted, so equal arguments
+ * produce the same string regardless of key order.
+ *
+ * Passing the sorted key list as the replacer array makes JSON.stringify
+ * emit keys in that order at every depth while staying on V8's native
+ * serializer (a replacer function forces the slow path and a copy of
+ * every object).
+ *
+ * Returns undefined for values JSON cannot represent (cycles, BigInt).
+ */
+function canonicalJson(value: unknown): string | undefined {
+  const keys = new Set<string>();
+  const seen = new Set<object>();
+  const stack: unknown[] = [value];
+  while (stack.length > 0) {
+    const node = stack.pop();
+    if (node && typeof node === 'object' && !seen.has(node)) {
+      seen.add(node);
+      if (Array.isArray(node)) {
+        stack.push(...node);
+      } else {
+        for (const key of Object.keys(node)) {
+          keys.add(key);
+          stack.push((node as Record<string, unknown>)[key]);
+        }
+      }
+    }
+  }
+  try {
+    return JSON.stringify(value, Array.from(keys).sort());
+  } catch {
+    return undefined;
+  }
+}
+
+/**
+ * Build the result-cache key for a tool call.
+ *
+ * The canonical JSON is used directly rather than digested: the cache is an
+ * in-process Map, which already hashes string keys natively, and a full-key
+ * compare can never return another call's result on a collision. Arguments
+ * are small and the cache is bounded by MAX_TOOL_CACHE_ENTRIES.
+ *
+ * Returns undefined when the arguments cannot be serialized; such calls are
+ * executed without the cache.
+ */
+function toolCacheKey(name: string, args: Record<string, unknown>): string | undefined {
+  const json = canonicalJson(args);
+  return json === undefined ? undefined : `${name}\0${json}`;
 }
 
 // ═══════════════════════════════════════════════════════════════════════════
@@ -63,6 +122,20 @@ export class ToolRegistry {
   private tools = new Map<string, ToolRegistration>();
   private deps: ToolRegistryDependencies;
 
+  // Results of read-only tools (definition.cacheTtlMs), least recently used first
+  private resultCache = new Map<string, { result: ToolResult; expiresAt: number }>();
+
+  // In-flight read-only calls, so identical concurrent calls share one execution
+  private pendingReads = new Map<string, Promise<ToolResult>>();
+
+  // Bumped by clearResultCache; a read that started in an earlier epoch may
+  // have seen state from before a write, so its result is not cached
+  private cacheEpoch = 0;
+
+  // Concurrency gate for handler execution
+  private activeExecutions = 0;
+  private slotWaiters: Array<() => void> = [];
+
   constructor(deps: ToolRegistryDependencies) {
     this.deps = deps;
     this.registerBuiltinTools();
@@ -97,7 +170,7 @@ export class ToolRegistry {
     handler: ToolHandler,
     definition?: Partial<ToolDefinition>
   ): void {
-    const existingDef = ALL_TOOL_DEFINITIONS.find(d => d.name === name);
+    const existingDef = getToolDefinition(name);
     this.register({
       definition: {
         name,
@@ -105,6 +178,7 @@ export class ToolRegistry {
         parameters: definition?.parameters ?? existingDef?.parameters ?? {},
         required: definition?.required ?? existingDef?.required,
         isDestructive: definition?.isDestructive ?? existingDef?.isDestructive,
+        cacheTtlMs: definition?.cacheTtlMs ?? existingDef?.cacheTtlMs,
       },
       handler,
       category: 'custom',
@@ -172,8 +246,69 @@ export class ToolRegistry {
       };
     }
 
+    const ttlMs = registration.definition.cacheTtlMs;
+    if (!ttlMs) {
+      return this.runHandler(registration, args, startTime);
+    }
+
+    const cacheKey = toolCacheKey(name, args);
+    if (cacheKey === undefined) {
+      return this.runHandler(registration, args, startTime, { ttlMs });
+    }
+
+    const cached = this.resultCache.get(cacheKey);
+    if (cached) {
+      this.resultCache.delete(cacheKey);
+      if (cached.expiresAt > Date.now()) {
+        // Re-insert to mark as most recently used
+        this.resultCache.set(cacheKey, cached);
+        return { ...cached.result, durationMs: Date.now() - startTime };
+      }
+    }
+
+    const pending = this.pendingReads.get(cacheKey);
+    if (pending) {
+      const shared = await pending;
+      return { ...shared, durationMs: Date.now() - startTime };
+    }
+
+    const run = this.runHandler(registration, args, startTime, { key: cacheKey, ttlMs });
+    this.pendingReads.set(cacheKey, run);
+    try {
+      return await run;
+    } finally {
+      if (this.pendingReads.get(cacheKey) === run) {
+        this.pendingReads.delete(cacheKey);
+      }
+    }
+  }
+
+  /**
+   * Run a tool handler under the concurrency gate, caching successful
+   * read-only results and invalidating the cache after other tools succeed
+   */
+  private async runHandler(
+    registration: ToolRegistration,
+    args: Record<string, unknown>,
+    startTime: number,
+    cache?: { key?: string; ttlMs: number }
+  ): Promise<ToolResult> {
+    const epoch = this.cacheEpoch;
+    await this.acquireSlot();
     try {
       const result = await registration.handler(args);
+
+      if (result.success) {
+        if (cache) {
+          if (cache.key !== undefined && epoch === this.cacheEpoch) {
+            this.cacheResult(cache.key, result, cache.ttlMs);
+          }
+        } else {
+          // Any other tool may have written state that cached reads depend on
+          this.clearResultCache();
+        }
+      }
+
       return {
         ...result,
         durationMs: result.durationMs ?? Date.now() - startTime,
@@ -184,13 +319,35 @@ export class ToolRegistry {
         error: error instanceof Error ? error.message : String(error),
         durationMs: Date.now() - startTime,
       };
+    } finally {
+      this.releaseSlot();
     }
   }
 
   /**
    * Execute a BQL pipeline
+   *
+   * A pipeline may write (save), so success invalidates cached reads just as
+   * the bql tool does through execute().
    */
   async executeBql(pipeline: string): Promise<ToolResult> {
+    await this.acquireSlot();
+    try {
+      const result = await this.runBql(pipeline);
+      if (result.success) {
+        this.clearResultCache();
+      }
+      return result;
+    } finally {
+      this.releaseSlot();
+    }
+  }
+
+  /**
+   * Run a BQL pipeline without taking an execution slot; the bql tool
+   * handler already holds one from execute()
+   */
+  private async runBql(pipeline: string): Promise<ToolResult> {
     const startTime = Date.now();
 
     if (!this.deps.bqlExecutor) {
@@ -224,6 +381,49 @@ export class ToolRegistry {
     }
   }
 
+  /**
+   * Drop all cached tool results
+   */
+  clearResultCache(): void {
+    this.cacheEpoch++;
+    this.resultCache.clear();
+    this.pendingReads.clear();
+  }
+
+  /**
+   * Wait for a free execution slot. Bursts of tool calls queue here instead
+   * of all hitting downstream services (API, embeddings, DB pool) at once.
+   */
+  private acquireSlot(): Promise<void> {
+    const limit = this.deps.maxConcurrentTools ?? MAX_CONCURRENT_TOOLS;
+    if (this.activeExecutions < limit) {
+      this.activeExecutions++;
+      return Promise.resolve();
+    }
+    return new Promise(resolve => this.slotWaiters.push(resolve));
+  }
+
+  /**
+   * Release a slot, handing it directly to the next waiter if any.
+   */
+  private releaseSlot(): void {
+    const next = this.slotWaiters.shift();
+    if (next) {
+      next();
+    } else {
+      this.activeExecutions--;
+    }
+  }
+
+  private cacheResult(key: string, result: ToolResult, ttlMs: number): void {
+    this.resultCache.delete(key);
+    this.resultCache.set(key, { result, expiresAt: Date.now() + ttlMs });
+    if (this.resultCache.size > MAX_TOOL_CACHE_ENTRIES) {
+      const oldest = this.resultCache.keys().next().value;
+      if (oldest !== undefined) this.resultCache.delete(oldest);
+    }
+  }
+
   // ─────────────────────────────────────────────────────────────────────────
   // PRIVATE: BUILTIN BUFFER TOOLS
   // ─────────────────────────────────────────────────────────────────────────
@@ -378,7 +578,7 @@ export class ToolRegistry {
         required: ['pipeline'],
       },
       handler: async (args) => {
-        return this.executeBql(args.pipeline as string);
+        return this.runBql(args.pipeline as string);
       },
       category: 'buffer',
     });
@@ -7,7 +7,6 @@
  * @module @humanizer/core/aui/tools/book-tools
  */
 
-import type { ToolResult } from '../types.js';
 import type { ToolRegistration, ToolHandler } from '../tool-registry.js';
 import type { BookMethods, ArtifactMethods } from '../service/books.js';
 import { BOOK_TOOLS } from '../tool-definitions.js';
@@ -158,7 +157,7 @@ export function createBookToolHandlers(
     // ─────────────────────────────────────────────────────────────────────────
 
     book_list: async (args) => {
-      const bookList = await books.listBooks({
+      const bookList = await books.listBookSummaries({
         userId: args.userId as string | undefined,
         limit: args.limit as number | undefined,
       });
@@ -168,11 +167,11 @@ export function createBookToolHandlers(
         data: bookList.map(b => ({
           id: b.id,
           title: b.title,
-          chapterCount: b.chapters.length,
+          chapterCount: b.chapterCount,
           status: b.status,
           createdAt: b.createdAt,
           updatedAt: b.updatedAt,
-          totalWordCount: b.metadata?.totalWordCount,
+          totalWordCount: b.wordCount,
         })),
       };
     },
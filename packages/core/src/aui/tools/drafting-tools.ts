@@ -7,7 +7,6 @@
  * @module @humanizer/core/aui/tools/drafting-tools
  */
 
-import type { ToolResult } from '../types.js';
 import type { ToolRegistration, ToolHandler } from '../tool-registry.js';
 import type { DraftingMethods } from '../service/drafting.js';
 import { DRAFTING_TOOLS } from '../tool-definitions.js';
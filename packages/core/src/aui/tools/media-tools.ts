@@ -7,7 +7,6 @@
  * @module @humanizer/core/aui/tools/media-tools
  */
 
-import type { ToolResult } from '../types.js';
 import type { ToolRegistration, ToolHandler } from '../tool-registry.js';
 import type { TranscriptionMethods } from '../service/transcription.js';
 import { MEDIA_TOOLS } from '../tool-definitions.js';
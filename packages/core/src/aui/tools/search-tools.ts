@@ -7,7 +7,6 @@
  * @module @humanizer/core/aui/tools/search-tools
  */
 
-import type { ToolResult } from '../types.js';
 import type { ToolRegistration, ToolHandler } from '../tool-registry.js';
 import type { ClusteringMethods, ArchiveMethods } from '../service/archive-clustering.js';
 import { SEARCH_TOOLS } from '../tool-definitions.js';
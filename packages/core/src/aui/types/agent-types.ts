@@ -256,6 +256,9 @@ export interface ReasoningResult {
   /** Tool call (if nextAction is 'tool') */
   toolCall?: ToolCall;
 
+  /** All calls of a batch of independent tool calls (toolCall is the first) */
+  toolCalls?: ToolCall[];
+
   /** Answer (if nextAction is 'complete') */
   answer?: string;
 
@@ -288,6 +291,13 @@ export interface ToolDefinition {
   /** Whether this is a destructive action */
   isDestructive?: boolean;
 
+  /**
+   * Cache successful results for this long (ms). Only set for read-only
+   * tools whose state changes only through other tool calls (which
+   * invalidate the cache); omit for anything background jobs update.
+   */
+  cacheTtlMs?: number;
+
   /** Examples of usage */
   examples?: ToolExample[];
 }
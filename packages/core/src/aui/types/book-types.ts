@@ -242,6 +242,35 @@ export interface Book {
   metadata: Record<string, unknown>;
 }
 
+/**
+ * A book listing entry, without arc or chapter content.
+ */
+export interface BookSummary {
+  /** Book ID */
+  id: string;
+
+  /** Book title */
+  title: string;
+
+  /** Book description */
+  description: string;
+
+  /** Status */
+  status: Book['status'];
+
+  /** Number of chapters */
+  chapterCount: number;
+
+  /** Total words across all chapters */
+  wordCount: number;
+
+  /** Creation date */
+  createdAt: Date;
+
+  /** Last updated date */
+  updatedAt: Date;
+}
+
 /**
  * A chapter in a book.
  */
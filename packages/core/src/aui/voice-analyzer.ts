@@ -7,7 +7,7 @@
  * @module @humanizer/core/aui/voice-analyzer
  */
 
-import type { VoiceFingerprint, StyleGuide } from '../storage/aui-postgres-store.js';
+import type { VoiceFingerprint } from '../storage/aui-postgres-store.js';
 
 // ═══════════════════════════════════════════════════════════════════
 // TYPES
@@ -452,21 +452,16 @@ export class ProvenanceTracker {
    * Find all buffers derived from a root buffer.
    */
   findDerived(rootBufferId: string): string[] {
-    const derived: string[] = [];
+    // A set from the start: each chain contributes its current buffer once
+    const derived = new Set<string>();
 
     for (const chain of this.chains.values()) {
       if (chain.rootBufferId === rootBufferId || this.isDescendant(chain.id, rootBufferId)) {
-        // Add all buffers in this chain
-        derived.push(chain.currentBufferId);
-        for (const op of chain.operations) {
-          if (op.hashes.afterHash) {
-            derived.push(chain.currentBufferId);
-          }
-        }
+        derived.add(chain.currentBufferId);
       }
     }
 
-    return [...new Set(derived)]; // Deduplicate
+    return [...derived];
   }
 
   /**
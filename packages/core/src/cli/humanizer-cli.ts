@@ -41,17 +41,18 @@ function hasLatexContent(content: string): boolean {
   return /\$[^$]+\$|\$\$[\s\S]+?\$\$|\\\[[\s\S]+?\\\]|\\\([\s\S]+?\\\)/.test(content);
 }
 
+/** Unescaped \[...\] or \(...\), matched in a single pass */
+const LATEX_DELIMITERS = /(?<!\\)\\\[([\s\S]*?)(?<!\\)\\\]|(?<!\\)\\\(([\s\S]*?)(?<!\\)\\\)/g;
+
 /**
  * Convert ChatGPT-style LaTeX delimiters to standard $ delimiters
  * - \[...\] → $$...$$ (display math)
  * - \(...\) → $...$ (inline math)
  */
 function fixLatexDelimiters(content: string): string {
-  // Convert display math \[...\] → $$...$$
-  let result = content.replace(/(?<!\\)\\\[([\s\S]*?)(?<!\\)\\\]/g, '$$$$1$$');
-  // Convert inline math \(...\) → $...$
-  result = result.replace(/(?<!\\)\\\(([\s\S]*?)(?<!\\)\\\)/g, '$$$1$');
-  return result;
+  return content.replace(LATEX_DELIMITERS, (_match, display?: string, inline?: string) =>
+    display !== undefined ? `$$${display}$$` : `$${inline}$`
+  );
 }
 
 /**
@@ -61,6 +62,91 @@ const KATEX_CSS_CDN = 'https://cdn.jsdelivr.net/npm/katex@0.16.9/dist/katex.min.
 const KATEX_JS_CDN = 'https://cdn.jsdelivr.net/npm/katex@0.16.9/dist/katex.min.js';
 const KATEX_AUTO_RENDER_CDN = 'https://cdn.jsdelivr.net/npm/katex@0.16.9/dist/contrib/auto-render.min.js';
 
+/**
+ * KaTeX stylesheet, scripts and auto-render hook for the PDF export page
+ */
+const KATEX_INCLUDES = `
+  <link rel="stylesheet" href="${KATEX_CSS_CDN}">
+  <script defer src="${KATEX_JS_CDN}"></script>
+  <script defer src="${KATEX_AUTO_RENDER_CDN}"></script>
+  <script>
+    document.addEventListener("DOMContentLoaded", function() {
+      renderMathInElement(document.body, {
+        delimiters: [
+          {left: '$$', right: '$$', display: true},
+          {left: '$', right: '$', display: false}
+        ],
+        throwOnError: false
+      });
+    });
+  </script>`;
+
+/**
+ * Stylesheet for the PDF export page
+ */
+const PDF_EXPORT_STYLE = `  <style>
+    body {
+      font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
+      max-width: 800px;
+      margin: 40px auto;
+      padding: 0 20px;
+      line-height: 1.6;
+      color: #333;
+    }
+    h1 {
+      color: #2c3e50;
+      border-bottom: 2px solid #3498db;
+      padding-bottom: 10px;
+    }
+    h2 {
+      color: #34495e;
+      margin-top: 30px;
+    }
+    code {
+      background: #f4f4f4;
+      padding: 2px 6px;
+      border-radius: 3px;
+      font-family: 'Monaco', 'Menlo', monospace;
+      font-size: 0.9em;
+    }
+    pre {
+      background: #f8f8f8;
+      padding: 15px;
+      border-radius: 5px;
+      overflow-x: auto;
+      border: 1px solid #e0e0e0;
+    }
+    pre code {
+      background: none;
+      padding: 0;
+    }
+    hr {
+      border: none;
+      border-top: 1px solid #ddd;
+      margin: 30px 0;
+    }
+    ul {
+      padding-left: 25px;
+    }
+    li {
+      margin: 5px 0;
+    }
+    p strong {
+      color: #555;
+    }
+    blockquote {
+      border-left: 3px solid #3498db;
+      margin: 20px 0;
+      padding-left: 15px;
+      color: #666;
+    }
+    /* KaTeX display math styling */
+    .katex-display {
+      margin: 1.5em 0;
+      overflow-x: auto;
+    }
+  </style>`;
+
 // ═══════════════════════════════════════════════════════════════════════════
 // TYPES
 // ═══════════════════════════════════════════════════════════════════════════
@@ -749,90 +835,12 @@ ${processedText}
     // Convert markdown to HTML
     const htmlContent = await marked.parse(md);
 
-    // Build KaTeX includes (only if needed)
-    const katexIncludes = needsLatex ? `
-  <link rel="stylesheet" href="${KATEX_CSS_CDN}">
-  <script defer src="${KATEX_JS_CDN}"></script>
-  <script defer src="${KATEX_AUTO_RENDER_CDN}"></script>
-  <script>
-    document.addEventListener("DOMContentLoaded", function() {
-      renderMathInElement(document.body, {
-        delimiters: [
-          {left: '$$', right: '$$', display: true},
-          {left: '$', right: '$', display: false}
-        ],
-        throwOnError: false
-      });
-    });
-  </script>` : '';
-
     // Wrap in styled HTML document
     const html = `<!DOCTYPE html>
 <html>
 <head>
-  <meta charset="UTF-8">${katexIncludes}
-  <style>
-    body {
-      font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
-      max-width: 800px;
-      margin: 40px auto;
-      padding: 0 20px;
-      line-height: 1.6;
-      color: #333;
-    }
-    h1 {
-      color: #2c3e50;
-      border-bottom: 2px solid #3498db;
-      padding-bottom: 10px;
-    }
-    h2 {
-      color: #34495e;
-      margin-top: 30px;
-    }
-    code {
-      background: #f4f4f4;
-      padding: 2px 6px;
-      border-radius: 3px;
-      font-family: 'Monaco', 'Menlo', monospace;
-      font-size: 0.9em;
-    }
-    pre {
-      background: #f8f8f8;
-      padding: 15px;
-      border-radius: 5px;
-      overflow-x: auto;
-      border: 1px solid #e0e0e0;
-    }
-    pre code {
-      background: none;
-      padding: 0;
-    }
-    hr {
-      border: none;
-      border-top: 1px solid #ddd;
-      margin: 30px 0;
-    }
-    ul {
-      padding-left: 25px;
-    }
-    li {
-      margin: 5px 0;
-    }
-    p strong {
-      color: #555;
-    }
-    blockquote {
-      border-left: 3px solid #3498db;
-      margin: 20px 0;
-      padding-left: 15px;
-      color: #666;
-    }
-    /* KaTeX display math styling */
-    .katex-display {
-      margin: 1.5em 0;
-      overflow-x: auto;
-    }
-  </style>
+  <meta charset="UTF-8">${needsLatex ? KATEX_INCLUDES : ''}
+${PDF_EXPORT_STYLE}
 </head>
 <body>
 ${htmlContent}
@@ -996,14 +1004,14 @@ ${this.state.activeBuffer.text}
   // ═══════════════════════════════════════════════════════════════════════════
 
   private async listBooks(): Promise<void> {
-    const books = await this.service.listBooks();
+    const books = await this.service.listBookSummaries();
     if (books.length === 0) {
       this.print('No books', 'dim');
       return;
     }
     this.print(`Books (${books.length}):`, 'cyan');
     for (const b of books) {
-      this.print(`  ${b.id.slice(0, 8)} - ${b.title} (${b.chapters.length} chapters)`);
+      this.print(`  ${b.id.slice(0, 8)} - ${b.title} (${b.chapterCount} chapters)`);
     }
   }
 
@@ -10,6 +10,8 @@ import {
   manhattanDistance,
   computeDistanceMatrix,
   computeKNN,
+  computeCoreDistances,
+  computeCoreDistancesFromMatrix,
 
   // HDBSCAN
   HDBSCAN,
@@ -216,6 +218,18 @@ describe('Matrix Computation', () => {
       expect(matrix[0][0]).toBe(0);
       expect(matrix[1][1]).toBe(0);
     });
+
+    it('matches pairwise cosineDistance', () => {
+      const embeddings = [randomEmbedding(16), randomEmbedding(16), new Array(16).fill(0)];
+      const matrix = computeDistanceMatrix(embeddings);
+
+      for (let i = 0; i < embeddings.length; i++) {
+        for (let j = 0; j < embeddings.length; j++) {
+          if (i === j) continue;
+          expect(matrix[i][j]).toBeCloseTo(cosineDistance(embeddings[i], embeddings[j]), 5);
+        }
+      }
+    });
   });
 
   describe('computeKNN', () => {
@@ -246,6 +260,37 @@ describe('Matrix Computation', () => {
         expect(neighbors.distances.length).toBe(2);
       }
     });
+
+    it('matches a full sort of all distances', () => {
+      const embeddings = Array.from({ length: 12 }, () => randomEmbedding(8));
+      const knn = computeKNN(embeddings, 4);
+
+      for (let i = 0; i < embeddings.length; i++) {
+        const expected = embeddings
+          .map((e, j) => ({ j, d: cosineDistance(embeddings[i], e) }))
+          .filter(({ j }) => j !== i)
+          .sort((a, b) => a.d - b.d)
+          .slice(0, 4);
+
+        expect(knn[i].indices).toEqual(expected.map(e => e.j));
+        expect(knn[i].distances).toEqual(expected.map(e => e.d));
+      }
+    });
+  });
+
+  describe('computeCoreDistancesFromMatrix', () => {
+    it('matches core distances computed from embeddings', () => {
+      const embeddings = Array.from({ length: 10 }, () => randomEmbedding(8));
+      const matrix = computeDistanceMatrix(embeddings);
+
+      for (const minSamples of [1, 3, 20]) {
+        const fromMatrix = computeCoreDistancesFromMatrix(matrix, minSamples);
+        const fromEmbeddings = computeCoreDistances(embeddings, minSamples);
+        for (let i = 0; i < embeddings.length; i++) {
+          expect(fromMatrix[i]).toBeCloseTo(fromEmbeddings[i], 5);
+        }
+      }
+    });
   });
 });
 
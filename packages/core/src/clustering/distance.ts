@@ -5,7 +5,7 @@
  * All functions work with embedding vectors (number arrays).
  */
 
-import type { DistanceMetric, DistanceFunction } from './types.js';
+import type { DistanceMetric, DistanceFunction, DistanceMatrix } from './types.js';
 
 // ═══════════════════════════════════════════════════════════════════
 // DISTANCE FUNCTIONS
@@ -34,14 +34,7 @@ export function cosineDistance(a: number[], b: number[]): number {
     normB += b[i] * b[i];
   }
 
-  const magnitude = Math.sqrt(normA) * Math.sqrt(normB);
-  if (magnitude === 0) return 1; // Max distance for zero vectors
-
-  const similarity = dotProduct / magnitude;
-  // Clamp to [-1, 1] to handle floating point errors
-  const clampedSimilarity = Math.max(-1, Math.min(1, similarity));
-
-  return 1 - clampedSimilarity;
+  return cosineDistanceFromDot(dotProduct, Math.sqrt(normA), Math.sqrt(normB));
 }
 
 /**
@@ -85,6 +78,68 @@ export function manhattanDistance(a: number[], b: number[]): number {
   return sum;
 }
 
+/**
+ * Cosine distance from a dot product and precomputed vector norms
+ *
+ * Same result as cosineDistance, for hot loops that see each vector many
+ * times: only the dot product is computed per pair.
+ */
+function cosineDistanceFromDot(dotProduct: number, normA: number, normB: number): number {
+  const magnitude = normA * normB;
+  if (magnitude === 0) return 1; // Max distance for zero vectors
+
+  const similarity = dotProduct / magnitude;
+  // Clamp to [-1, 1] to handle floating point errors
+  return 1 - Math.max(-1, Math.min(1, similarity));
+}
+
+/**
+ * Euclidean norm of each vector
+ */
+function computeNorms(embeddings: number[][]): Float64Array {
+  const norms = new Float64Array(embeddings.length);
+  for (let i = 0; i < embeddings.length; i++) {
+    const v = embeddings[i];
+    let sum = 0;
+    for (let d = 0; d < v.length; d++) {
+      sum += v[d] * v[d];
+    }
+    norms[i] = Math.sqrt(sum);
+  }
+  return norms;
+}
+
+/**
+ * Build a pairwise distance function over a fixed set of embeddings
+ *
+ * Cosine precomputes every norm once, so each pair costs one dot product
+ * instead of a dot product plus two norms. Other metrics use the plain
+ * distance function.
+ */
+function pairwiseDistance(
+  embeddings: number[][],
+  metric: DistanceMetric
+): (i: number, j: number) => number {
+  if (metric !== 'cosine') {
+    const distFn = getDistanceFunction(metric);
+    return (i, j) => distFn(embeddings[i], embeddings[j]);
+  }
+
+  const norms = computeNorms(embeddings);
+  return (i, j) => {
+    const a = embeddings[i];
+    const b = embeddings[j];
+    if (a.length !== b.length) {
+      throw new Error(`Vector dimension mismatch: ${a.length} vs ${b.length}`);
+    }
+    let dotProduct = 0;
+    for (let d = 0; d < a.length; d++) {
+      dotProduct += a[d] * b[d];
+    }
+    return cosineDistanceFromDot(dotProduct, norms[i], norms[j]);
+  };
+}
+
 /**
  * Get distance function by metric name
  */
@@ -142,6 +197,21 @@ export function similarityToDistance(similarity: number, maxDistance = 2): numbe
 // DISTANCE MATRIX COMPUTATION
 // ═══════════════════════════════════════════════════════════════════
 
+/**
+ * Allocate a zeroed n x n matrix backed by one Float32Array.
+ *
+ * Single precision halves memory and bandwidth versus boxed number rows;
+ * cosine distances only need a few significant digits for clustering.
+ */
+function allocateDistanceMatrix(n: number): DistanceMatrix {
+  const buffer = new Float32Array(n * n);
+  const matrix: DistanceMatrix = new Array(n);
+  for (let i = 0; i < n; i++) {
+    matrix[i] = buffer.subarray(i * n, (i + 1) * n);
+  }
+  return matrix;
+}
+
 /**
  * Compute pairwise distance matrix
  *
@@ -152,20 +222,15 @@ export function similarityToDistance(similarity: number, maxDistance = 2): numbe
 export function computeDistanceMatrix(
   embeddings: number[][],
   metric: DistanceMetric = 'cosine'
-): number[][] {
+): DistanceMatrix {
   const n = embeddings.length;
-  const distFn = getDistanceFunction(metric);
-
-  // Initialize all rows first
-  const matrix: number[][] = new Array(n);
-  for (let i = 0; i < n; i++) {
-    matrix[i] = new Array(n).fill(0);
-  }
+  const distance = pairwiseDistance(embeddings, metric);
+  const matrix = allocateDistanceMatrix(n);
 
   // Fill in distances
   for (let i = 0; i < n; i++) {
     for (let j = i + 1; j < n; j++) {
-      const dist = distFn(embeddings[i], embeddings[j]);
+      const dist = distance(i, j);
       matrix[i][j] = dist;
       matrix[j][i] = dist; // Symmetric
     }
@@ -188,35 +253,53 @@ export function computeKNN(
   metric: DistanceMetric = 'cosine'
 ): Array<{ indices: number[]; distances: number[] }> {
   const n = embeddings.length;
-  const distFn = getDistanceFunction(metric);
+  const distance = pairwiseDistance(embeddings, metric);
   const result: Array<{ indices: number[]; distances: number[] }> = new Array(n);
 
   for (let i = 0; i < n; i++) {
-    // Compute distances to all other points
-    const distances: Array<{ idx: number; dist: number }> = [];
+    const indices: number[] = [];
+    const distances: number[] = [];
 
     for (let j = 0; j < n; j++) {
       if (i !== j) {
-        distances.push({
-          idx: j,
-          dist: distFn(embeddings[i], embeddings[j]),
-        });
+        insertNeighbor(indices, distances, k, j, distance(i, j));
       }
     }
 
-    // Sort by distance and take top k
-    distances.sort((a, b) => a.dist - b.dist);
-    const topK = distances.slice(0, k);
-
-    result[i] = {
-      indices: topK.map((d) => d.idx),
-      distances: topK.map((d) => d.dist),
-    };
+    result[i] = { indices, distances };
   }
 
   return result;
 }
 
+/**
+ * Insert a candidate into a bounded, ascending k-nearest list.
+ *
+ * Keeps parallel index/distance arrays of at most k entries, so selecting
+ * the k nearest of n points costs O(n·k) instead of sorting all n. Ties
+ * keep the earlier candidate first, matching a stable sort.
+ */
+function insertNeighbor(
+  indices: number[],
+  distances: number[],
+  k: number,
+  idx: number,
+  dist: number
+): void {
+  if (k <= 0) return;
+  if (distances.length === k && !(dist < distances[k - 1])) return;
+
+  let pos = distances.length;
+  while (pos > 0 && distances[pos - 1] > dist) pos--;
+
+  indices.splice(pos, 0, idx);
+  distances.splice(pos, 0, dist);
+  if (distances.length > k) {
+    indices.pop();
+    distances.pop();
+  }
+}
+
 // ═══════════════════════════════════════════════════════════════════
 // CORE DISTANCE (for HDBSCAN)
 // ═══════════════════════════════════════════════════════════════════
@@ -245,6 +328,39 @@ export function computeCoreDistances(
   });
 }
 
+/**
+ * Compute core distances from an existing pairwise distance matrix
+ *
+ * Same result as computeCoreDistances, but reads distances already in the
+ * matrix instead of recomputing all n² pairs from the embeddings.
+ *
+ * @param distanceMatrix Pairwise distance matrix
+ * @param minSamples Number of samples for core distance
+ * @returns Core distance for each point
+ */
+export function computeCoreDistancesFromMatrix(
+  distanceMatrix: ArrayLike<number>[],
+  minSamples: number
+): number[] {
+  const n = distanceMatrix.length;
+  const coreDistances: number[] = new Array(n);
+  const indices: number[] = [];
+  const distances: number[] = [];
+
+  for (let i = 0; i < n; i++) {
+    indices.length = 0;
+    distances.length = 0;
+    const row = distanceMatrix[i];
+    for (let j = 0; j < n; j++) {
+      if (i !== j) insertNeighbor(indices, distances, minSamples, j, row[j]);
+    }
+    const lastIdx = Math.min(minSamples - 1, distances.length - 1);
+    coreDistances[i] = distances[lastIdx] ?? Infinity;
+  }
+
+  return coreDistances;
+}
+
 /**
  * Compute mutual reachability distance
  *
@@ -259,15 +375,10 @@ export function computeCoreDistances(
  */
 export function computeMutualReachabilityMatrix(
   coreDistances: number[],
-  distanceMatrix: number[][]
-): number[][] {
+  distanceMatrix: ArrayLike<number>[]
+): DistanceMatrix {
   const n = coreDistances.length;
-
-  // Initialize all rows first
-  const mrdMatrix: number[][] = new Array(n);
-  for (let i = 0; i < n; i++) {
-    mrdMatrix[i] = new Array(n).fill(0);
-  }
+  const mrdMatrix = allocateDistanceMatrix(n);
 
   // Fill in mutual reachability distances
   for (let i = 0; i < n; i++) {
@@ -21,11 +21,11 @@ import type {
   HierarchyNode,
   CondensedNode,
   DistanceMetric,
+  DistanceMatrix,
 } from './types.js';
 import {
   computeDistanceMatrix,
-  computeCoreDistances,
-  computeMutualReachabilityMatrix,
+  computeCoreDistancesFromMatrix,
 } from './distance.js';
 import { DEFAULT_HDBSCAN_CONFIG } from './constants.js';
 
@@ -67,18 +67,15 @@ export class HDBSCAN {
     // Step 1: Compute distance matrix
     const distanceMatrix = computeDistanceMatrix(embeddings, this.config.metric);
 
-    // Step 2: Compute core distances
-    const coreDistances = computeCoreDistances(
-      embeddings,
-      this.config.minSamples,
-      this.config.metric
+    // Step 2: Compute core distances (from the matrix, not the embeddings)
+    const coreDistances = computeCoreDistancesFromMatrix(
+      distanceMatrix,
+      this.config.minSamples
     );
 
-    // Step 3: Build mutual reachability matrix
-    const mrdMatrix = computeMutualReachabilityMatrix(coreDistances, distanceMatrix);
-
-    // Step 4: Build MST
-    const mst = this.buildMST(mrdMatrix);
+    // Steps 3-4: Build MST over mutual reachability distances, computed
+    // per edge rather than materialized as a second n x n matrix
+    const mst = this.buildMST(distanceMatrix, coreDistances);
 
     // Step 5: Build hierarchy
     const hierarchy = this.buildHierarchy(mst, n);
@@ -94,8 +91,11 @@ export class HDBSCAN {
 
   /**
    * Build minimum spanning tree using Prim's algorithm
+   *
+   * Edge weights are mutual reachability distances:
+   * MRD(a, b) = max(core_a, core_b, distance(a, b))
    */
-  private buildMST(distanceMatrix: number[][]): MSTEdge[] {
+  private buildMST(distanceMatrix: DistanceMatrix, coreDistances: number[]): MSTEdge[] {
     const n = distanceMatrix.length;
     const mst: MSTEdge[] = [];
     const inTree = new Array(n).fill(false);
@@ -126,9 +126,13 @@ export class HDBSCAN {
       }
 
       // Update distances for adjacent nodes
+      const row = distanceMatrix[u];
+      const coreU = coreDistances[u];
       for (let v = 0; v < n; v++) {
-        if (!inTree[v] && distanceMatrix[u][v] < minDist[v]) {
-          minDist[v] = distanceMatrix[u][v];
+        if (inTree[v]) continue;
+        const mrd = Math.max(coreU, coreDistances[v], row[v]);
+        if (mrd < minDist[v]) {
+          minDist[v] = mrd;
           minEdge[v] = u;
         }
       }
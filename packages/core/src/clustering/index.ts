@@ -53,6 +53,7 @@ export type {
   // Distance
   DistanceMetric,
   DistanceFunction,
+  DistanceMatrix,
 
   // Input/Output
   ClusterPoint,
@@ -133,6 +134,7 @@ export {
 
   // HDBSCAN helpers
   computeCoreDistances,
+  computeCoreDistancesFromMatrix,
   computeMutualReachabilityMatrix,
 
   // Centroid (computeCentroid exported from retrieval module)
@@ -68,6 +68,12 @@ export type DistanceMetric = 'cosine' | 'euclidean' | 'manhattan';
  */
 export type DistanceFunction = (a: number[], b: number[]) => number;
 
+/**
+ * Pairwise n x n distance matrix.
+ * Single-precision rows, each a view into one contiguous buffer.
+ */
+export type DistanceMatrix = Float32Array[];
+
 // ═══════════════════════════════════════════════════════════════════
 // CLUSTERING INPUT/OUTPUT
 // ═══════════════════════════════════════════════════════════════════
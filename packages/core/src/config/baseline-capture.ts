@@ -255,10 +255,16 @@ function calculateStats(values: number[]): { avg: number; std: number } {
     return { avg: 0, std: 0 };
   }
 
-  const avg = values.reduce((a, b) => a + b, 0) / values.length;
-  const squaredDiffs = values.map(v => Math.pow(v - avg, 2));
-  const variance = squaredDiffs.reduce((a, b) => a + b, 0) / values.length;
-  const std = Math.sqrt(variance);
+  let sum = 0;
+  for (let i = 0; i < values.length; i++) sum += values[i];
+  const avg = sum / values.length;
+
+  let squaredDiffs = 0;
+  for (let i = 0; i < values.length; i++) {
+    const diff = values[i] - avg;
+    squaredDiffs += diff * diff;
+  }
+  const std = Math.sqrt(squaredDiffs / values.length);
 
   return { avg, std };
 }
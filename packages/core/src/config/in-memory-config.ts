@@ -269,11 +269,10 @@ export class InMemoryConfigManager implements ConfigManager {
       ...variables,
     };
 
-    // Substitute variables
-    let text = template.template;
-    for (const [varName, varValue] of Object.entries(allVariables)) {
-      text = text.replace(new RegExp(`\\{\\{${varName}\\}\\}`, 'g'), varValue);
-    }
+    // Substitute variables in one pass over the template
+    const text = template.template.replace(/\{\{([^{}]+)\}\}/g, (match, varName: string) =>
+      Object.prototype.hasOwnProperty.call(allVariables, varName) ? allVariables[varName] : match
+    );
 
     return {
       templateId: id,
@@ -143,6 +143,24 @@ export interface CouncilOrchestrator {
   getStats(): OrchestratorStats;
 }
 
+// ═══════════════════════════════════════════════════════════════════
+// SIGNOFF REVIEWERS
+// ═══════════════════════════════════════════════════════════════════
+
+/**
+ * Agents that review each change type (anything unlisted goes to 'reviewer')
+ */
+const REVIEWERS_BY_CHANGE_TYPE: Readonly<Record<string, readonly string[]>> = {
+  'chapter-draft': ['reviewer', 'curator'],
+  'passage-harvest': ['curator'],
+  'style-change': ['reviewer'],
+  'pyramid-rebuild': ['builder'],
+  'content-delete': ['reviewer', 'curator'],
+  'phase-advance': ['project-manager', 'reviewer'],
+};
+
+const DEFAULT_REVIEWERS: readonly string[] = ['reviewer'];
+
 // ═══════════════════════════════════════════════════════════════════
 // IMPLEMENTATION
 // ═══════════════════════════════════════════════════════════════════
@@ -486,24 +504,15 @@ export class DefaultCouncilOrchestrator implements CouncilOrchestrator {
   }
 
   private determineRequiredAgents(changeType: string, config?: StoredProjectCouncilConfig): string[] {
-    // Map change types to reviewing agents
-    const reviewerMap: Record<string, string[]> = {
-      'chapter-draft': ['reviewer', 'curator'],
-      'passage-harvest': ['curator'],
-      'style-change': ['reviewer'],
-      'pyramid-rebuild': ['builder'],
-      'content-delete': ['reviewer', 'curator'],
-      'phase-advance': ['project-manager', 'reviewer'],
-    };
-
-    let agents = reviewerMap[changeType] || ['reviewer'];
+    const agents = REVIEWERS_BY_CHANGE_TYPE[changeType] ?? DEFAULT_REVIEWERS;
 
-    // Filter by enabled agents in project config
+    // Filter by enabled agents in project config, keeping the canonical order
     if (config?.enabledAgents) {
-      agents = agents.filter(a => config.enabledAgents.includes(a));
+      const enabled = new Set(config.enabledAgents);
+      return agents.filter(a => enabled.has(a));
     }
 
-    return agents;
+    return [...agents];
   }
 
   private buildSignoffResult(signoff: StoredSignoff): SignoffResult {
@@ -339,24 +339,45 @@ export class EmbeddingService {
    */
   async embedBatch(texts: string[]): Promise<EmbeddingBatchResult> {
     const startTime = Date.now();
-    const embeddings: number[][] = [];
+
+    // Archives repeat a lot of text verbatim (short replies, regenerated
+    // responses); embed each distinct text once and fan the result out
+    const uniqueTexts: string[] = [];
+    const uniqueIndex = new Map<string, number>();
+    const slots = texts.map((text) => {
+      let slot = uniqueIndex.get(text);
+      if (slot === undefined) {
+        slot = uniqueTexts.length;
+        uniqueIndex.set(text, slot);
+        uniqueTexts.push(text);
+      }
+      return slot;
+    });
+
+    const uniqueEmbeddings: number[][] = [];
 
     // Process in batches to avoid overwhelming Ollama
-    for (let i = 0; i < texts.length; i += this.config.batchSize) {
-      const batch = texts.slice(i, i + this.config.batchSize);
+    for (let i = 0; i < uniqueTexts.length; i += this.config.batchSize) {
+      const batch = uniqueTexts.slice(i, i + this.config.batchSize);
 
       // Embed each text in the batch (Ollama doesn't support true batch embedding)
       const batchEmbeddings = await Promise.all(
         batch.map((text) => this.embed(text))
       );
 
-      embeddings.push(...batchEmbeddings);
+      uniqueEmbeddings.push(...batchEmbeddings);
 
-      if (this.config.verbose && texts.length > this.config.batchSize) {
-        console.log(`  Embedded ${Math.min(i + this.config.batchSize, texts.length)}/${texts.length} texts...`);
+      if (this.config.verbose && uniqueTexts.length > this.config.batchSize) {
+        console.log(`  Embedded ${Math.min(i + this.config.batchSize, uniqueTexts.length)}/${uniqueTexts.length} texts...`);
       }
     }
 
+    if (this.config.verbose && uniqueTexts.length < texts.length) {
+      console.log(`  Reused embeddings for ${texts.length - uniqueTexts.length} duplicate texts`);
+    }
+
+    const embeddings = slots.map((slot) => uniqueEmbeddings[slot]);
+
     // Get dimensions from actual embeddings or fallback to registry/default
     const dimensions = embeddings[0]?.length ?? await this.getEmbedDimensionsAsync();
 
@@ -873,42 +894,56 @@ export class EmbeddingService {
 
     const results: Array<{ nodeId: string; embedding: number[] }> = [];
 
-    for (const node of nodes) {
-      // Use enriched content if available
-      const enriched = enrichedContent?.get(node.id);
-      const text = enriched?.combined || node.text || '';
+    // Nodes are independent; embed a batch of them concurrently, as
+    // embedBatch does, instead of waiting on Ollama one node at a time
+    for (let i = 0; i < nodes.length; i += this.config.batchSize) {
+      const batch = nodes.slice(i, i + this.config.batchSize);
+      const embeddings = await Promise.all(
+        batch.map((node) => this.embedNodeText(node, enrichedContent))
+      );
+      batch.forEach((node, j) => results.push({ nodeId: node.id, embedding: embeddings[j] }));
+    }
 
-      // Detect content type and get appropriate limit
-      const contentType = detectContentType(text);
-      const maxChars = getMaxCharsForContentType(contentType);
+    return results;
+  }
 
-      if (text.length <= maxChars) {
-        // Content fits in single embedding
-        const embedding = await this.embedSingleText(text);
-        results.push({ nodeId: node.id, embedding });
-      } else {
-        // Content needs to be chunked - embed ALL chunks
-        const chunks = this.chunkLongText(text, maxChars);
+  /**
+   * Embed one node's text, chunking and averaging if it is too long.
+   */
+  private async embedNodeText(
+    node: StoredNode,
+    enrichedContent?: Map<string, EnrichedContent>
+  ): Promise<number[]> {
+    // Use enriched content if available
+    const enriched = enrichedContent?.get(node.id);
+    const text = enriched?.combined || node.text || '';
 
-        if (this.config.verbose) {
-          console.log(`    Node ${node.id.slice(0, 8)}... (${contentType}) chunked into ${chunks.length} parts for embedding`);
-        }
+    // Detect content type and get appropriate limit
+    const contentType = detectContentType(text);
+    const maxChars = getMaxCharsForContentType(contentType);
 
-        // Embed all chunks
-        const chunkEmbeddings: number[][] = [];
-        for (const chunk of chunks) {
-          const embedding = await this.embedSingleText(chunk);
-          chunkEmbeddings.push(embedding);
-        }
+    if (text.length <= maxChars) {
+      // Content fits in single embedding
+      return this.embedSingleText(text);
+    }
 
-        // Create centroid embedding (average of all chunks)
-        // This ensures the full content is represented
-        const centroid = this.computeCentroidEmbedding(chunkEmbeddings);
-        results.push({ nodeId: node.id, embedding: centroid });
-      }
+    // Content needs to be chunked - embed ALL chunks
+    const chunks = this.chunkLongText(text, maxChars);
+
+    if (this.config.verbose) {
+      console.log(`    Node ${node.id.slice(0, 8)}... (${contentType}) chunked into ${chunks.length} parts for embedding`);
     }
 
-    return results;
+    // Embed all chunks
+    const chunkEmbeddings: number[][] = [];
+    for (const chunk of chunks) {
+      const embedding = await this.embedSingleText(chunk);
+      chunkEmbeddings.push(embedding);
+    }
+
+    // Create centroid embedding (average of all chunks)
+    // This ensures the full content is represented
+    return this.computeCentroidEmbedding(chunkEmbeddings);
   }
 
   /**
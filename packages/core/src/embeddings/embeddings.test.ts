@@ -206,6 +206,22 @@ describe('EmbeddingService', () => {
       expect(mockFetch).toHaveBeenCalledTimes(5);
     });
 
+    it('embeds duplicate texts once', async () => {
+      const first = createMockEmbeddingResponse();
+      const second = createMockEmbeddingResponse();
+      mockFetch
+        .mockResolvedValueOnce({ ok: true, json: async () => first })
+        .mockResolvedValueOnce({ ok: true, json: async () => second });
+
+      const result = await service.embedBatch(['thanks', 'Text 2', 'thanks']);
+
+      expect(mockFetch).toHaveBeenCalledTimes(2);
+      expect(result.count).toBe(3);
+      expect(result.embeddings[0]).toEqual(first.embeddings[0]);
+      expect(result.embeddings[1]).toEqual(second.embeddings[0]);
+      expect(result.embeddings[2]).toEqual(first.embeddings[0]);
+    });
+
     it('returns empty result for empty input', async () => {
       const result = await service.embedBatch([]);
 
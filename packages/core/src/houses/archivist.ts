@@ -819,11 +819,15 @@ Output 1-2 sentences.`,
     categoryData.expressionCount = expressions.length;
 
     if (expressions.length > 0) {
-      categoryData.avgScore = expressions.reduce((sum, e) => sum + e.excellenceScore, 0) / expressions.length;
-
-      // Find canonical (highest scored)
-      const sorted = [...expressions].sort((a, b) => b.excellenceScore - a.excellenceScore);
-      categoryData.canonicalId = sorted[0].id;
+      // Average and canonical (highest scored, first on ties) in one pass
+      let scoreSum = 0;
+      let canonical = expressions[0];
+      for (const e of expressions) {
+        scoreSum += e.excellenceScore;
+        if (e.excellenceScore > canonical.excellenceScore) canonical = e;
+      }
+      categoryData.avgScore = scoreSum / expressions.length;
+      categoryData.canonicalId = canonical.id;
 
       // Calculate centroid embedding
       const embeddings = expressions.filter(e => e.embedding && e.embedding.length > 0).map(e => e.embedding!);
@@ -17,6 +17,50 @@ import type {
   ReviewResult,
 } from '../types.js';
 
+// ═══════════════════════════════════════════════════════════════════
+// ICONS
+// ═══════════════════════════════════════════════════════════════════
+
+const SEVERITY_ICONS: Record<Severity, string> = {
+  info: 'ℹ️',
+  warning: '⚠️',
+  error: '❌',
+  critical: '🚨',
+};
+
+/** Shared by recommendation priority and security risk level */
+const LEVEL_COLORS: Record<string, string> = {
+  low: '🟢',
+  medium: '🟡',
+  high: '🟠',
+  critical: '🔴',
+};
+
+const COMPLIANCE_ICONS: Record<string, string> = {
+  'A': '🥉',
+  'AA': '🥈',
+  'AAA': '🥇',
+  'non-compliant': '❌',
+};
+
+const SARIF_LEVELS: Record<Severity, string> = {
+  info: 'note',
+  warning: 'warning',
+  error: 'error',
+  critical: 'error',
+};
+
+/** Section order for issue lists, most severe first */
+const SEVERITY_ORDER: readonly Severity[] = ['critical', 'error', 'warning', 'info'];
+
+const ISSUE_SEPARATOR = '---\n\n';
+
+/** Progress bars for 0-10 filled segments, indexed by filled count */
+const SCORE_BARS: readonly string[] = Array.from(
+  { length: 11 },
+  (_, filled) => '█'.repeat(filled) + '░'.repeat(10 - filled)
+);
+
 // ═══════════════════════════════════════════════════════════════════
 // MARKDOWN FORMATTERS
 // ═══════════════════════════════════════════════════════════════════
@@ -25,13 +69,7 @@ import type {
  * Format severity with emoji
  */
 export function formatSeverity(severity: Severity): string {
-  const icons: Record<Severity, string> = {
-    info: 'ℹ️',
-    warning: '⚠️',
-    error: '❌',
-    critical: '🚨',
-  };
-  return `${icons[severity]} ${severity.toUpperCase()}`;
+  return `${SEVERITY_ICONS[severity]} ${severity.toUpperCase()}`;
 }
 
 /**
@@ -74,34 +112,28 @@ export function formatIssuesList(issues: CodeIssue[]): string {
   }
 
   const grouped = groupBySeverity(issues);
-  let md = '';
+  const sections: string[] = [];
 
-  for (const severity of ['critical', 'error', 'warning', 'info'] as Severity[]) {
+  // Each section's issue entries are joined once rather than appended one by one
+  for (const severity of SEVERITY_ORDER) {
     const severityIssues = grouped[severity];
     if (severityIssues.length > 0) {
-      md += `## ${formatSeverity(severity)} (${severityIssues.length})\n\n`;
-      for (const issue of severityIssues) {
-        md += formatIssue(issue);
-        md += '---\n\n';
-      }
+      sections.push(
+        `## ${formatSeverity(severity)} (${severityIssues.length})\n\n`,
+        severityIssues.map(formatIssue).join(ISSUE_SEPARATOR),
+        ISSUE_SEPARATOR
+      );
     }
   }
 
-  return md;
+  return sections.join('');
 }
 
 /**
  * Format recommendation as markdown
  */
 export function formatRecommendation(rec: Recommendation): string {
-  const priorityIcons: Record<string, string> = {
-    low: '🟢',
-    medium: '🟡',
-    high: '🟠',
-    critical: '🔴',
-  };
-
-  let md = `### ${priorityIcons[rec.priority]} ${rec.title}\n\n`;
+  let md = `### ${LEVEL_COLORS[rec.priority]} ${rec.title}\n\n`;
   md += `${rec.description}\n\n`;
   md += `| Aspect | Value |\n|--------|-------|\n`;
   md += `| Priority | ${rec.priority} |\n`;
@@ -131,8 +163,7 @@ ${meta.projectId ? `- Project: ${meta.projectId}` : ''}
  */
 export function formatScore(score: number, label: string = 'Score'): string {
   const filled = Math.round(score / 10);
-  const empty = 10 - filled;
-  const bar = '█'.repeat(filled) + '░'.repeat(empty);
+  const bar = SCORE_BARS[filled] ?? '█'.repeat(filled) + '░'.repeat(10 - filled);
 
   let color = '🔴';
   if (score >= 80) color = '🟢';
@@ -250,15 +281,8 @@ export function formatSecurityReport(report: SecurityReport): string {
   let md = '# 🔒 Security Report\n\n';
   md += formatMetadata(report.metadata);
 
-  const riskColors: Record<string, string> = {
-    low: '🟢',
-    medium: '🟡',
-    high: '🟠',
-    critical: '🔴',
-  };
-
   md += '## Overall Risk Assessment\n\n';
-  md += `${riskColors[report.overallRisk]} **Risk Level:** ${report.overallRisk.toUpperCase()}\n\n`;
+  md += `${LEVEL_COLORS[report.overallRisk]} **Risk Level:** ${report.overallRisk.toUpperCase()}\n\n`;
   md += formatScore(100 - report.riskScore, 'Security Score') + '\n\n';
 
   if (report.secretsFound.length > 0) {
@@ -274,7 +298,7 @@ export function formatSecurityReport(report: SecurityReport): string {
   if (report.vulnerabilities.length > 0) {
     md += '## Vulnerabilities\n\n';
     for (const vuln of report.vulnerabilities) {
-      md += `### ${riskColors[vuln.severity]} ${vuln.title}\n`;
+      md += `### ${LEVEL_COLORS[vuln.severity]} ${vuln.title}\n`;
       md += `- Type: ${vuln.type}\n`;
       md += `- File: \`${vuln.file}${vuln.line ? `:${vuln.line}` : ''}\`\n`;
       if (vuln.cwe) md += `- CWE: ${vuln.cwe}\n`;
@@ -312,15 +336,8 @@ export function formatA11yReport(report: A11yReport): string {
   let md = '# ♿ Accessibility Report\n\n';
   md += formatMetadata(report.metadata);
 
-  const levelIcons: Record<string, string> = {
-    'A': '🥉',
-    'AA': '🥈',
-    'AAA': '🥇',
-    'non-compliant': '❌',
-  };
-
   md += '## Compliance Status\n\n';
-  md += `${levelIcons[report.complianceLevel]} **Compliance Level:** ${report.complianceLevel}\n\n`;
+  md += `${COMPLIANCE_ICONS[report.complianceLevel]} **Compliance Level:** ${report.complianceLevel}\n\n`;
   md += `**Target Standard:** ${report.targetStandard}\n\n`;
   md += formatScore(report.overallScore, 'Accessibility Score') + '\n\n';
 
@@ -454,13 +471,7 @@ export function formatAsSarif(
 }
 
 function severityToSarifLevel(severity: Severity): string {
-  const map: Record<Severity, string> = {
-    info: 'note',
-    warning: 'warning',
-    error: 'error',
-    critical: 'error',
-  };
-  return map[severity];
+  return SARIF_LEVELS[severity];
 }
 
 // ═══════════════════════════════════════════════════════════════════
@@ -468,10 +479,14 @@ function severityToSarifLevel(severity: Severity): string {
 // ═══════════════════════════════════════════════════════════════════
 
 function groupBySeverity(issues: CodeIssue[]): Record<Severity, CodeIssue[]> {
-  return {
-    info: issues.filter(i => i.severity === 'info'),
-    warning: issues.filter(i => i.severity === 'warning'),
-    error: issues.filter(i => i.severity === 'error'),
-    critical: issues.filter(i => i.severity === 'critical'),
+  const grouped: Record<Severity, CodeIssue[]> = {
+    info: [],
+    warning: [],
+    error: [],
+    critical: [],
   };
+  for (const issue of issues) {
+    grouped[issue.severity]?.push(issue);
+  }
+  return grouped;
 }
@@ -518,10 +518,13 @@ export class HarvesterAgent extends AgentBase {
         limit: 20,
         excludeIds: existingPassages.map(p => p.id),
         sourceFilter: {
-          conversationIds: existingPassages
-            .filter(p => p.source !== dominantSource)
-            .map(p => p.source)
-            .filter((v, i, a): v is string => v !== undefined && a.indexOf(v) === i),
+          conversationIds: [
+            ...new Set(
+              existingPassages
+                .map(p => p.source)
+                .filter((v): v is string => v !== undefined && v !== dominantSource)
+            ),
+          ],
         },
       });
 
@@ -0,0 +1,261 @@
+/**
+ * Anthropic Provider Tests
+ *
+ * Unit tests for request body construction (prompt-cache breakpoints) and
+ * the Message Batches request/response mapping.
+ *
+ * @module llm-providers/anthropic-provider.test
+ */
+
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+import { AnthropicProvider } from './anthropic-provider.js';
+import type { ChatMessage } from './types.js';
+
+// ═══════════════════════════════════════════════════════════════════════════
+// MOCKS
+// ═══════════════════════════════════════════════════════════════════════════
+
+const mockFetch = vi.fn();
+global.fetch = mockFetch;
+
+function jsonResponse(body: unknown) {
+  return {
+    ok: true,
+    status: 200,
+    json: async () => body,
+    text: async () => JSON.stringify(body),
+  };
+}
+
+function textResponse(text: string, status = 200) {
+  return {
+    ok: status < 400,
+    status,
+    json: async () => JSON.parse(text),
+    text: async () => text,
+  };
+}
+
+function message(text: string, usage: Record<string, number> = {}) {
+  return {
+    content: [{ type: 'text', text }],
+    stop_reason: 'end_turn',
+    usage: { input_tokens: 10, output_tokens: 5, ...usage },
+  };
+}
+
+/** Parsed JSON body of the nth fetch call */
+function sentBody(call = 0): Record<string, any> {
+  return JSON.parse(mockFetch.mock.calls[call][1].body);
+}
+
+const conversation: ChatMessage[] = [
+  { role: 'system', content: 'You are terse.' },
+  { role: 'user', content: 'one' },
+  { role: 'assistant', content: 'two' },
+  { role: 'user', content: 'three' },
+  { role: 'assistant', content: 'four' },
+  { role: 'user', content: 'five' },
+];
+
+// ═══════════════════════════════════════════════════════════════════════════
+// TESTS
+// ═══════════════════════════════════════════════════════════════════════════
+
+describe('AnthropicProvider', () => {
+  beforeEach(() => {
+    mockFetch.mockReset();
+  });
+
+  afterEach(() => {
+    mockFetch.mockReset();
+  });
+
+  describe('prompt caching', () => {
+    it('sends plain system and messages when caching is off', async () => {
+      const provider = new AnthropicProvider({ apiKey: 'test-key' });
+      mockFetch.mockResolvedValueOnce(jsonResponse(message('ok')));
+
+      await provider.chat({ modelId: 'claude-test', messages: conversation });
+
+      const body = sentBody();
+      expect(body.system).toBe('You are terse.');
+      expect(body.messages).toEqual(conversation.slice(1));
+      expect(JSON.stringify(body)).not.toContain('cache_control');
+    });
+
+    it('marks the system prompt and the previous turn when caching is on', async () => {
+      const provider = new AnthropicProvider({ apiKey: 'test-key', enableCaching: true });
+      mockFetch.mockResolvedValueOnce(jsonResponse(message('ok')));
+
+      await provider.chat({ modelId: 'claude-test', messages: conversation });
+
+      const body = sentBody();
+      expect(body.system).toEqual([
+        { type: 'text', text: 'You are terse.', cache_control: { type: 'ephemeral' } },
+      ]);
+      expect(body.messages).toEqual([
+        { role: 'user', content: 'one' },
+        { role: 'assistant', content: 'two' },
+        { role: 'user', content: 'three' },
+        {
+          role: 'assistant',
+          content: [{ type: 'text', text: 'four', cache_control: { type: 'ephemeral' } }],
+        },
+        { role: 'user', content: 'five' },
+      ]);
+    });
+
+    it('skips the history breakpoint for short conversations', async () => {
+      const provider = new AnthropicProvider({ apiKey: 'test-key', enableCaching: true });
+      mockFetch.mockResolvedValueOnce(jsonResponse(message('ok')));
+
+      await provider.chat({ modelId: 'claude-test', messages: conversation.slice(0, 4) });
+
+      const body = sentBody();
+      expect(body.system[0].cache_control).toEqual({ type: 'ephemeral' });
+      expect(body.messages).toEqual(conversation.slice(1, 4));
+    });
+
+    it('does not mutate the caller\'s messages', async () => {
+      const provider = new AnthropicProvider({ apiKey: 'test-key', enableCaching: true });
+      mockFetch.mockResolvedValueOnce(jsonResponse(message('ok')));
+      const messages = conversation.map((m) => ({ ...m }));
+
+      await provider.chat({ modelId: 'claude-test', messages });
+
+      expect(messages).toEqual(conversation);
+    });
+
+    it('reports cache token usage', async () => {
+      const provider = new AnthropicProvider({ apiKey: 'test-key', enableCaching: true });
+      mockFetch.mockResolvedValueOnce(
+        jsonResponse(
+          message('ok', { cache_creation_input_tokens: 100, cache_read_input_tokens: 200 })
+        )
+      );
+
+      const response = await provider.chat({ modelId: 'claude-test', messages: conversation });
+
+      expect(response.usage).toEqual({
+        promptTokens: 10,
+        completionTokens: 5,
+        totalTokens: 15,
+        cacheCreationTokens: 100,
+        cacheReadTokens: 200,
+      });
+    });
+  });
+
+  describe('batch', () => {
+    it('sends one params entry per request, keyed by index', async () => {
+      const provider = new AnthropicProvider({ apiKey: 'test-key', enableCaching: true });
+      mockFetch
+        .mockResolvedValueOnce(
+          jsonResponse({ id: 'batch-1', processing_status: 'ended', results_url: 'https://results/1' })
+        )
+        .mockResolvedValueOnce(textResponse(''));
+
+      await provider.batch([
+        { modelId: 'claude-a', messages: conversation, maxTokens: 100 },
+        { modelId: 'claude-b', messages: [{ role: 'user', content: 'hi' }], temperature: 0 },
+      ]);
+
+      expect(mockFetch.mock.calls[0][0]).toBe('https://api.anthropic.com/v1/messages/batches');
+      const { requests } = sentBody();
+      expect(requests.map((r: any) => r.custom_id)).toEqual(['0', '1']);
+      expect(requests[0].params.model).toBe('claude-a');
+      expect(requests[0].params.max_tokens).toBe(100);
+      expect(requests[0].params.system[0].cache_control).toEqual({ type: 'ephemeral' });
+      expect(requests[0].params.messages[3].content[0].cache_control).toEqual({ type: 'ephemeral' });
+      expect(requests[1].params).toEqual({
+        model: 'claude-b',
+        messages: [{ role: 'user', content: 'hi' }],
+        max_tokens: 4096,
+        stream: false,
+        temperature: 0,
+      });
+      expect(mockFetch.mock.calls[1][0]).toBe('https://results/1');
+    });
+
+    it('maps results back to request order, with failed entries as errors', async () => {
+      const provider = new AnthropicProvider({ apiKey: 'test-key' });
+      const results = [
+        { custom_id: '2', result: { type: 'succeeded', message: message('third') } },
+        {
+          custom_id: '1',
+          result: { type: 'errored', error: { type: 'invalid_request_error', message: 'bad' } },
+        },
+        {
+          custom_id: '0',
+          result: {
+            type: 'succeeded',
+            message: { ...message('first', { cache_read_input_tokens: 7 }), stop_reason: 'max_tokens' },
+          },
+        },
+        { custom_id: '3', result: { type: 'expired' } },
+      ];
+      mockFetch
+        .mockResolvedValueOnce(
+          jsonResponse({ id: 'batch-1', processing_status: 'ended', results_url: 'https://results/1' })
+        )
+        .mockResolvedValueOnce(textResponse(results.map((r) => JSON.stringify(r)).join('\n') + '\n'));
+
+      const responses = await provider.batch(
+        ['a', 'b', 'c', 'd'].map((id) => ({
+          modelId: `claude-${id}`,
+          messages: [{ role: 'user' as const, content: id }],
+        }))
+      );
+
+      expect(responses.map((r) => [r.modelId, r.content, r.finishReason])).toEqual([
+        ['claude-a', 'first', 'length'],
+        ['claude-b', '', 'error'],
+        ['claude-c', 'third', 'stop'],
+        ['claude-d', '', 'error'],
+      ]);
+      expect(responses[0].usage.cacheReadTokens).toBe(7);
+      expect(responses[1].usage).toEqual({ promptTokens: 0, completionTokens: 0, totalTokens: 0 });
+    });
+
+    it('throws when the batch cannot be created', async () => {
+      const provider = new AnthropicProvider({ apiKey: 'test-key' });
+      mockFetch.mockResolvedValueOnce(textResponse('overloaded', 529));
+
+      await expect(
+        provider.batch([{ modelId: 'claude-a', messages: [{ role: 'user', content: 'hi' }] }])
+      ).rejects.toThrow('HTTP 529: overloaded');
+    });
+
+    it('cancels the batch on the server when it does not finish in time', async () => {
+      const provider = new AnthropicProvider({ apiKey: 'test-key' });
+      mockFetch
+        .mockResolvedValueOnce(jsonResponse({ id: 'batch-1', processing_status: 'in_progress' }))
+        .mockResolvedValueOnce(jsonResponse({ id: 'batch-1', processing_status: 'canceling' }));
+      const now = vi.spyOn(Date, 'now');
+      // Start of the batch, then a clock past the 24h batch lifetime
+      now.mockReturnValueOnce(0).mockReturnValue(25 * 60 * 60 * 1000);
+
+      try {
+        await expect(
+          provider.batch([{ modelId: 'claude-a', messages: [{ role: 'user', content: 'hi' }] }])
+        ).rejects.toThrow('Batch batch-1 did not finish in time');
+      } finally {
+        now.mockRestore();
+      }
+
+      expect(mockFetch).toHaveBeenCalledTimes(2);
+      expect(mockFetch.mock.calls[1][0]).toBe(
+        'https://api.anthropic.com/v1/messages/batches/batch-1/cancel'
+      );
+      expect(mockFetch.mock.calls[1][1].method).toBe('POST');
+    });
+
+    it('returns no responses for an empty batch without calling the API', async () => {
+      const provider = new AnthropicProvider({ apiKey: 'test-key' });
+
+      expect(await provider.batch([])).toEqual([]);
+      expect(mockFetch).not.toHaveBeenCalled();
+    });
+  });
+});
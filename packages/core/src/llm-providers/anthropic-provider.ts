@@ -15,12 +15,25 @@ import type {
   EmbedResponse,
   ProviderStatus,
 } from './types.js';
-import { ProviderError, ProviderUnavailableError } from './types.js';
+import { ProviderError, ProviderUnavailableError, splitSystemMessage } from './types.js';
 
 const DEFAULT_URL = 'https://api.anthropic.com/v1';
 const DEFAULT_TIMEOUT = 120000; // Anthropic can be slower for long responses
 const API_VERSION = '2023-06-01';
 
+/**
+ * Minimum conversation length before a cache breakpoint is placed on the
+ * history. Shorter conversations are below Anthropic's cacheable prefix size.
+ */
+const CACHE_HISTORY_MIN_MESSAGES = 4;
+
+const EPHEMERAL_CACHE = { type: 'ephemeral' } as const;
+
+/** Message Batches polling: initial delay, backoff cap, and overall deadline */
+const BATCH_POLL_INITIAL_MS = 1000;
+const BATCH_POLL_MAX_MS = 60000;
+const BATCH_TIMEOUT_MS = 24 * 60 * 60 * 1000; // Anthropic expires batches after 24h
+
 /**
  * Anthropic provider configuration
  */
@@ -28,6 +41,31 @@ export interface AnthropicProviderConfig {
   apiKey?: string;
   baseUrl?: string;
   timeoutMs?: number;
+  /** Mark the system prompt and rolling history with prompt-cache breakpoints */
+  enableCaching?: boolean;
+}
+
+/**
+ * Messages API response body
+ */
+interface AnthropicMessage {
+  content: Array<{ type: string; text: string }>;
+  stop_reason: string;
+  usage: {
+    input_tokens: number;
+    output_tokens: number;
+    cache_creation_input_tokens?: number;
+    cache_read_input_tokens?: number;
+  };
+}
+
+/**
+ * Message Batches API batch object
+ */
+interface AnthropicBatch {
+  id: string;
+  processing_status: 'in_progress' | 'canceling' | 'ended';
+  results_url: string | null;
 }
 
 /**
@@ -39,12 +77,14 @@ export class AnthropicProvider implements LlmProvider {
   private apiKey: string | undefined;
   private baseUrl: string;
   private timeoutMs: number;
+  private enableCaching: boolean;
   private lastStatus: ProviderStatus | null = null;
 
   constructor(config: AnthropicProviderConfig = {}) {
     this.apiKey = config.apiKey || process.env.ANTHROPIC_API_KEY;
     this.baseUrl = config.baseUrl || DEFAULT_URL;
     this.timeoutMs = config.timeoutMs || DEFAULT_TIMEOUT;
+    this.enableCaching = config.enableCaching ?? false;
   }
 
   async chat(request: LlmRequest): Promise<LlmResponse> {
@@ -56,39 +96,11 @@ export class AnthropicProvider implements LlmProvider {
     const timeout = request.timeoutMs || this.timeoutMs;
 
     try {
-      // Extract system message
-      const systemMessage = request.messages.find(m => m.role === 'system');
-      const otherMessages = request.messages.filter(m => m.role !== 'system');
-
-      const body: Record<string, unknown> = {
-        model: request.modelId,
-        messages: otherMessages.map(m => ({
-          role: m.role,
-          content: m.content,
-        })),
-        max_tokens: request.maxTokens ?? 4096,
-        stream: false,
-      };
-
-      if (systemMessage) {
-        body.system = systemMessage.content;
-      }
-
-      if (request.temperature !== undefined) {
-        body.temperature = request.temperature;
-      }
-
-      if (request.stop) {
-        body.stop_sequences = request.stop;
-      }
+      const body = this.buildMessagesBody(request);
 
       const response = await fetch(`${this.baseUrl}/messages`, {
         method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-          'x-api-key': this.apiKey,
-          'anthropic-version': API_VERSION,
-        },
+        headers: this.headers(),
         body: JSON.stringify(body),
         signal: AbortSignal.timeout(timeout),
       });
@@ -98,41 +110,218 @@ export class AnthropicProvider implements LlmProvider {
         throw new ProviderError(this.name, request.modelId, `HTTP ${response.status}: ${error}`);
       }
 
-      const data = (await response.json()) as {
-        content: Array<{ type: string; text: string }>;
-        stop_reason: string;
-        usage: {
-          input_tokens: number;
-          output_tokens: number;
-        };
-      };
+      const data = (await response.json()) as AnthropicMessage;
 
-      const latencyMs = Date.now() - startTime;
+      return this.toLlmResponse(data, request.modelId, Date.now() - startTime);
+    } catch (error) {
+      if (error instanceof ProviderError) throw error;
+      const cause = error instanceof Error ? error : new Error(String(error));
+      throw new ProviderError(this.name, request.modelId, cause.message, cause);
+    }
+  }
+
+  /**
+   * Execute many independent requests through the Message Batches API.
+   *
+   * Batches are billed at half price and are not rate limited like the
+   * interactive endpoint, at the cost of minutes of turnaround. Use for
+   * bulk, non-interactive work. Results are returned in request order;
+   * requests that fail inside the batch get finishReason 'error'.
+   */
+  async batch(requests: LlmRequest[]): Promise<LlmResponse[]> {
+    if (!this.apiKey) {
+      throw new ProviderUnavailableError(this.name);
+    }
+    if (requests.length === 0) return [];
 
-      // Extract text content
-      const textContent = data.content
-        .filter(c => c.type === 'text')
-        .map(c => c.text)
-        .join('');
+    const startTime = Date.now();
+    const modelId = requests[0].modelId;
+
+    try {
+      const createResponse = await fetch(`${this.baseUrl}/messages/batches`, {
+        method: 'POST',
+        headers: this.headers(),
+        body: JSON.stringify({
+          requests: requests.map((request, i) => ({
+            custom_id: String(i),
+            params: this.buildMessagesBody(request),
+          })),
+        }),
+        signal: AbortSignal.timeout(this.timeoutMs),
+      });
+
+      if (!createResponse.ok) {
+        const error = await createResponse.text();
+        throw new ProviderError(this.name, modelId, `HTTP ${createResponse.status}: ${error}`);
+      }
+
+      let batch = (await createResponse.json()) as AnthropicBatch;
+
+      // Poll with exponential backoff until processing ends
+      let delayMs = BATCH_POLL_INITIAL_MS;
+      while (batch.processing_status !== 'ended') {
+        if (Date.now() - startTime > BATCH_TIMEOUT_MS) {
+          // Stop the server from processing (and billing) work nobody will collect
+          await this.cancelBatch(batch.id);
+          throw new ProviderError(this.name, modelId, `Batch ${batch.id} did not finish in time`);
+        }
+        await new Promise(resolve => setTimeout(resolve, delayMs));
+        delayMs = Math.min(delayMs * 2, BATCH_POLL_MAX_MS);
+
+        const pollResponse = await fetch(`${this.baseUrl}/messages/batches/${batch.id}`, {
+          headers: this.headers(),
+          signal: AbortSignal.timeout(this.timeoutMs),
+        });
+        if (!pollResponse.ok) {
+          const error = await pollResponse.text();
+          throw new ProviderError(this.name, modelId, `HTTP ${pollResponse.status}: ${error}`);
+        }
+        batch = (await pollResponse.json()) as AnthropicBatch;
+      }
 
-      return {
-        content: textContent,
+      if (!batch.results_url) {
+        throw new ProviderError(this.name, modelId, `Batch ${batch.id} has no results`);
+      }
+
+      const resultsResponse = await fetch(batch.results_url, {
+        headers: this.headers(),
+        signal: AbortSignal.timeout(this.timeoutMs),
+      });
+      if (!resultsResponse.ok) {
+        const error = await resultsResponse.text();
+        throw new ProviderError(this.name, modelId, `HTTP ${resultsResponse.status}: ${error}`);
+      }
+
+      // Results are JSONL in arbitrary order, keyed by custom_id
+      const latencyMs = Date.now() - startTime;
+      const responses: LlmResponse[] = requests.map(request => ({
+        content: '',
         modelId: request.modelId,
-        usage: {
-          promptTokens: data.usage.input_tokens,
-          completionTokens: data.usage.output_tokens,
-          totalTokens: data.usage.input_tokens + data.usage.output_tokens,
-        },
+        usage: { promptTokens: 0, completionTokens: 0, totalTokens: 0 },
         latencyMs,
-        finishReason: this.mapStopReason(data.stop_reason),
-      };
+        finishReason: 'error' as const,
+      }));
+
+      for (const line of (await resultsResponse.text()).split('\n')) {
+        if (!line.trim()) continue;
+        const entry = JSON.parse(line) as {
+          custom_id: string;
+          result: { type: string; message?: AnthropicMessage };
+        };
+        const index = Number(entry.custom_id);
+        if (entry.result.type === 'succeeded' && entry.result.message) {
+          responses[index] = this.toLlmResponse(
+            entry.result.message,
+            requests[index].modelId,
+            latencyMs
+          );
+        }
+      }
+
+      return responses;
     } catch (error) {
       if (error instanceof ProviderError) throw error;
       const cause = error instanceof Error ? error : new Error(String(error));
-      throw new ProviderError(this.name, request.modelId, cause.message, cause);
+      throw new ProviderError(this.name, modelId, cause.message, cause);
     }
   }
 
+  /**
+   * Ask the server to cancel a batch. Best effort: a failure is logged, and
+   * the batch still expires on its own.
+   */
+  private async cancelBatch(batchId: string): Promise<void> {
+    try {
+      const response = await fetch(`${this.baseUrl}/messages/batches/${batchId}/cancel`, {
+        method: 'POST',
+        headers: this.headers(),
+        signal: AbortSignal.timeout(this.timeoutMs),
+      });
+      if (!response.ok) {
+        console.warn(`Could not cancel batch ${batchId}: HTTP ${response.status}`);
+      }
+    } catch (error) {
+      console.warn(`Could not cancel batch ${batchId}:`, error);
+    }
+  }
+
+  /**
+   * Build the Messages API request body
+   */
+  private buildMessagesBody(request: LlmRequest): Record<string, unknown> {
+    const { system, messages: turns } = splitSystemMessage(request.messages);
+
+    // Messages already have the API's { role, content } shape, so they are
+    // sent as-is; only the cache breakpoint below needs a new object.
+    let messages: ReadonlyArray<{ role: string; content: unknown }> = turns;
+
+    // Cache the history up to the previous turn so only the newest
+    // message is re-tokenized (Anthropic allows up to 4 breakpoints)
+    if (this.enableCaching && turns.length >= CACHE_HISTORY_MIN_MESSAGES) {
+      const prevIndex = turns.length - 2;
+      const prev = turns[prevIndex];
+      const withBreakpoint: Array<{ role: string; content: unknown }> = turns.slice();
+      withBreakpoint[prevIndex] = {
+        role: prev.role,
+        content: [{ type: 'text', text: prev.content, cache_control: EPHEMERAL_CACHE }],
+      };
+      messages = withBreakpoint;
+    }
+
+    const body: Record<string, unknown> = {
+      model: request.modelId,
+      messages,
+      max_tokens: request.maxTokens ?? 4096,
+      stream: false,
+    };
+
+    if (system !== undefined) {
+      body.system = this.enableCaching
+        ? [{ type: 'text', text: system, cache_control: EPHEMERAL_CACHE }]
+        : system;
+    }
+
+    if (request.temperature !== undefined) {
+      body.temperature = request.temperature;
+    }
+
+    if (request.stop) {
+      body.stop_sequences = request.stop;
+    }
+
+    return body;
+  }
+
+  private headers(): Record<string, string> {
+    return {
+      'Content-Type': 'application/json',
+      'x-api-key': this.apiKey!,
+      'anthropic-version': API_VERSION,
+    };
+  }
+
+  private toLlmResponse(data: AnthropicMessage, modelId: string, latencyMs: number): LlmResponse {
+    // Extract text content
+    const textContent = data.content
+      .filter(c => c.type === 'text')
+      .map(c => c.text)
+      .join('');
+
+    return {
+      content: textContent,
+      modelId,
+      usage: {
+        promptTokens: data.usage.input_tokens,
+        completionTokens: data.usage.output_tokens,
+        totalTokens: data.usage.input_tokens + data.usage.output_tokens,
+        cacheCreationTokens: data.usage.cache_creation_input_tokens,
+        cacheReadTokens: data.usage.cache_read_input_tokens,
+      },
+      latencyMs,
+      finishReason: this.mapStopReason(data.stop_reason),
+    };
+  }
+
   private mapStopReason(reason: string): LlmResponse['finishReason'] {
     switch (reason) {
       case 'end_turn':
@@ -22,6 +22,7 @@ export type {
 export {
   ProviderError,
   ProviderUnavailableError,
+  splitSystemMessage,
 } from './types.js';
 
 // Providers
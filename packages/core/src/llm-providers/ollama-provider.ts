@@ -15,7 +15,7 @@ import type {
   EmbedResponse,
   ProviderStatus,
 } from './types.js';
-import { ProviderError, ProviderUnavailableError } from './types.js';
+import { ProviderError, splitSystemMessage } from './types.js';
 
 const DEFAULT_URL = 'http://localhost:11434';
 const DEFAULT_TIMEOUT = 60000;
@@ -49,12 +49,11 @@ export class OllamaProvider implements LlmProvider {
 
     try {
       // Convert messages to Ollama format
-      const systemMessage = request.messages.find(m => m.role === 'system');
-      const userMessages = request.messages.filter(m => m.role !== 'system');
+      const { system, messages } = splitSystemMessage(request.messages);
 
       // Build the prompt from messages
       let prompt = '';
-      for (const msg of userMessages) {
+      for (const msg of messages) {
         if (msg.role === 'user') {
           prompt += `User: ${msg.content}\n`;
         } else if (msg.role === 'assistant') {
@@ -69,7 +68,7 @@ export class OllamaProvider implements LlmProvider {
         body: JSON.stringify({
           model: request.modelId,
           prompt,
-          system: systemMessage?.content,
+          system,
           stream: false,
           options: {
             temperature: request.temperature ?? 0.7,
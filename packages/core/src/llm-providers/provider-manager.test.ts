@@ -0,0 +1,77 @@
+/**
+ * Provider Manager Tests
+ *
+ * @module llm-providers/provider-manager.test
+ */
+
+import { describe, it, expect, beforeEach } from 'vitest';
+import { ProviderManager } from './provider-manager.js';
+import type { LlmProvider } from './types.js';
+
+function customOllama(): LlmProvider {
+  return {
+    name: 'ollama',
+    chat: async () => {
+      throw new Error('not used');
+    },
+    embed: async () => {
+      throw new Error('not used');
+    },
+    isAvailable: async () => true,
+    getStatus: async () => ({ available: true, lastCheck: new Date() }),
+  };
+}
+
+describe('ProviderManager', () => {
+  let manager: ProviderManager;
+
+  beforeEach(() => {
+    manager = new ProviderManager();
+  });
+
+  it('constructs the built-in provider on first use', async () => {
+    await manager.initialize();
+
+    const provider = manager.get('ollama');
+
+    expect(provider.name).toBe('ollama');
+    expect(manager.get('ollama')).toBe(provider);
+  });
+
+  it('keeps a custom provider registered after initialize', async () => {
+    await manager.initialize();
+    const custom = customOllama();
+
+    manager.register(custom);
+
+    expect(manager.get('ollama')).toBe(custom);
+  });
+
+  it('keeps a custom provider registered before initialize', async () => {
+    const custom = customOllama();
+
+    manager.register(custom);
+    await manager.initialize();
+
+    expect(manager.get('ollama')).toBe(custom);
+    expect(manager.getRegistered()).toEqual(expect.arrayContaining(['ollama']));
+  });
+
+  it('keeps a custom provider registered before auto-initialization', () => {
+    const custom = customOllama();
+
+    manager.register(custom);
+
+    expect(manager.get('ollama')).toBe(custom);
+  });
+
+  it('drops custom providers on reset', async () => {
+    const custom = customOllama();
+    manager.register(custom);
+
+    manager.reset();
+    await manager.initialize();
+
+    expect(manager.get('ollama')).not.toBe(custom);
+  });
+});
@@ -8,17 +8,30 @@
  */
 
 import type { ModelProvider } from '../models/model-registry.js';
-import type { LlmProvider, ProviderConfig, ProviderStatus } from './types.js';
+import type {
+  LlmProvider,
+  LlmRequest,
+  LlmResponse,
+  ProviderConfig,
+  ProviderStatus,
+} from './types.js';
 import { ProviderUnavailableError } from './types.js';
 import { OllamaProvider } from './ollama-provider.js';
 import { OpenAIProvider } from './openai-provider.js';
 import { AnthropicProvider } from './anthropic-provider.js';
 
 /**
- * Provider manager handles provider lifecycle and selection
+ * Provider manager handles provider lifecycle and selection.
+ *
+ * Providers are registered as factories and constructed on first use, so
+ * a process that only ever talks to Ollama never builds the cloud clients.
  */
 export class ProviderManager {
+  // Registered providers (insertion order) and the instances built so far
+  private factories: Map<ModelProvider, () => LlmProvider> = new Map();
   private providers: Map<ModelProvider, LlmProvider> = new Map();
+  // Instances passed to register(); these win over the built-in defaults
+  private overrides: Map<ModelProvider, LlmProvider> = new Map();
   private initialized = false;
 
   /**
@@ -28,14 +41,14 @@ export class ProviderManager {
     if (this.initialized) return;
 
     // Always register Ollama (local, free)
-    this.providers.set('ollama', new OllamaProvider({
+    this.setDefault('ollama', () => new OllamaProvider({
       baseUrl: config.ollamaUrl,
       timeoutMs: config.defaultTimeoutMs,
     }));
 
     // Register OpenAI if key available
     if (config.openaiApiKey || process.env.OPENAI_API_KEY) {
-      this.providers.set('openai', new OpenAIProvider({
+      this.setDefault('openai', () => new OpenAIProvider({
         apiKey: config.openaiApiKey,
         timeoutMs: config.defaultTimeoutMs,
       }));
@@ -43,9 +56,10 @@ export class ProviderManager {
 
     // Register Anthropic if key available
     if (config.anthropicApiKey || process.env.ANTHROPIC_API_KEY) {
-      this.providers.set('anthropic', new AnthropicProvider({
+      this.setDefault('anthropic', () => new AnthropicProvider({
         apiKey: config.anthropicApiKey,
         timeoutMs: config.defaultTimeoutMs,
+        enableCaching: config.anthropicPromptCaching,
       }));
     }
 
@@ -60,19 +74,32 @@ export class ProviderManager {
   get(providerName: ModelProvider): LlmProvider {
     this.ensureInitialized();
 
-    const provider = this.providers.get(providerName);
+    const provider = this.resolve(providerName);
     if (!provider) {
       throw new ProviderUnavailableError(providerName);
     }
     return provider;
   }
 
+  /**
+   * Execute many independent chat requests on a provider.
+   * Uses the provider's bulk API when it has one (Anthropic Message Batches),
+   * otherwise issues the chat() calls concurrently.
+   */
+  async batch(providerName: ModelProvider, requests: LlmRequest[]): Promise<LlmResponse[]> {
+    const provider = this.get(providerName);
+    if (provider.batch) {
+      return provider.batch(requests);
+    }
+    return Promise.all(requests.map(request => provider.chat(request)));
+  }
+
   /**
    * Check if a provider is registered
    */
   has(providerName: ModelProvider): boolean {
     this.ensureInitialized();
-    return this.providers.has(providerName);
+    return this.factories.has(providerName);
   }
 
   /**
@@ -81,7 +108,7 @@ export class ProviderManager {
   async isAvailable(providerName: ModelProvider): Promise<boolean> {
     this.ensureInitialized();
 
-    const provider = this.providers.get(providerName);
+    const provider = this.resolve(providerName);
     if (!provider) return false;
 
     return provider.isAvailable();
@@ -94,8 +121,8 @@ export class ProviderManager {
     this.ensureInitialized();
 
     const statuses = new Map<ModelProvider, ProviderStatus>();
-    for (const [name, provider] of this.providers) {
-      statuses.set(name, await provider.getStatus());
+    for (const name of this.getRegistered()) {
+      statuses.set(name, await this.resolve(name)!.getStatus());
     }
     return statuses;
   }
@@ -107,8 +134,8 @@ export class ProviderManager {
     this.ensureInitialized();
 
     const available: ModelProvider[] = [];
-    for (const [name, provider] of this.providers) {
-      if (await provider.isAvailable()) {
+    for (const name of this.getRegistered()) {
+      if (await this.resolve(name)!.isAvailable()) {
         available.push(name);
       }
     }
@@ -120,13 +147,18 @@ export class ProviderManager {
    */
   getRegistered(): ModelProvider[] {
     this.ensureInitialized();
-    return Array.from(this.providers.keys());
+    return Array.from(this.factories.keys());
   }
 
   /**
    * Register a custom provider
+   *
+   * Takes precedence over the built-in provider of the same name, whether
+   * registered before or after initialization.
    */
   register(provider: LlmProvider): void {
+    this.overrides.set(provider.name, provider);
+    this.factories.set(provider.name, () => provider);
     this.providers.set(provider.name, provider);
   }
 
@@ -135,20 +167,46 @@ export class ProviderManager {
    */
   reset(): void {
     this.providers.clear();
+    this.factories.clear();
+    this.overrides.clear();
     this.initialized = false;
   }
 
+  /**
+   * Register a built-in provider factory unless a custom provider was
+   * registered under that name
+   */
+  private setDefault(providerName: ModelProvider, factory: () => LlmProvider): void {
+    if (this.overrides.has(providerName)) return;
+    this.factories.set(providerName, factory);
+    this.providers.delete(providerName);
+  }
+
+  /**
+   * Get a provider instance, constructing it from its factory on first use
+   */
+  private resolve(providerName: ModelProvider): LlmProvider | undefined {
+    let provider = this.providers.get(providerName);
+    if (!provider) {
+      const factory = this.factories.get(providerName);
+      if (!factory) return undefined;
+      provider = factory();
+      this.providers.set(providerName, provider);
+    }
+    return provider;
+  }
+
   private ensureInitialized(): void {
     if (!this.initialized) {
       // Auto-initialize with defaults
-      this.providers.set('ollama', new OllamaProvider());
+      this.setDefault('ollama', () => new OllamaProvider());
 
       if (process.env.OPENAI_API_KEY) {
-        this.providers.set('openai', new OpenAIProvider());
+        this.setDefault('openai', () => new OpenAIProvider());
       }
 
       if (process.env.ANTHROPIC_API_KEY) {
-        this.providers.set('anthropic', new AnthropicProvider());
+        this.setDefault('anthropic', () => new AnthropicProvider());
       }
 
       this.initialized = true;
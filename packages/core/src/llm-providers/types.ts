@@ -18,6 +18,42 @@ export interface ChatMessage {
   content: string;
 }
 
+/**
+ * Separate the system prompt from the conversation turns.
+ *
+ * Providers that take the system prompt as a separate field call this on
+ * every request, so it avoids copying the history: when there is no system
+ * message the input array is returned as-is, and a single leading system
+ * message is dropped with one slice. Callers must not mutate the returned
+ * array or its messages.
+ */
+export function splitSystemMessage(messages: readonly ChatMessage[]): {
+  system?: string;
+  messages: readonly ChatMessage[];
+} {
+  let first = -1;
+  let count = 0;
+  for (let i = 0; i < messages.length; i++) {
+    if (messages[i].role === 'system') {
+      if (first === -1) first = i;
+      count++;
+    }
+  }
+
+  if (first === -1) return { messages };
+
+  const system = messages[first].content;
+  if (count === 1) {
+    return {
+      system,
+      messages: first === 0
+        ? messages.slice(1)
+        : [...messages.slice(0, first), ...messages.slice(first + 1)],
+    };
+  }
+  return { system, messages: messages.filter(m => m.role !== 'system') };
+}
+
 /**
  * Request to an LLM provider
  */
@@ -62,6 +98,10 @@ export interface LlmResponse {
     promptTokens: number;
     completionTokens: number;
     totalTokens: number;
+    /** Prompt tokens written to the provider's prompt cache */
+    cacheCreationTokens?: number;
+    /** Prompt tokens served from the provider's prompt cache */
+    cacheReadTokens?: number;
   };
 
   /** Response latency in ms */
@@ -131,6 +171,12 @@ export interface LlmProvider {
    */
   chat(request: LlmRequest): Promise<LlmResponse>;
 
+  /**
+   * Execute many independent chat requests as one bulk job.
+   * Optional - callers fall back to concurrent chat() calls.
+   */
+  batch?(requests: LlmRequest[]): Promise<LlmResponse[]>;
+
   /**
    * Generate embeddings
    */
@@ -165,6 +211,9 @@ export interface ProviderConfig {
   /** Anthropic API key */
   anthropicApiKey?: string;
 
+  /** Enable Anthropic prompt caching breakpoints */
+  anthropicPromptCaching?: boolean;
+
   /** Default timeout in ms */
   defaultTimeoutMs?: number;
 }
@@ -153,6 +153,36 @@ export function wrapWithUsageRecording(
       return response!;
     },
 
+    batch: provider.batch
+      ? async (requests: LlmRequestWithMeta[]): Promise<LlmResponse[]> => {
+          const startTime = Date.now();
+          const responses = await provider.batch!(requests);
+
+          // Record usage per request (async, don't await)
+          const latencyMs = Date.now() - startTime;
+          responses.forEach((response, i) => {
+            const metadata = requests[i].metadata;
+            if (metadata?.userId && !skipModels.has(requests[i].modelId)) {
+              recordUsageAsync(recorder, {
+                userId: metadata.userId,
+                tenantId: metadata.tenantId,
+                operationType: metadata.operationType ?? defaultOpType,
+                modelId: requests[i].modelId,
+                modelProvider: provider.name,
+                tokensInput: response.usage.promptTokens,
+                tokensOutput: response.usage.completionTokens,
+                latencyMs,
+                status: response.finishReason === 'error' ? 'failed' : 'completed',
+                sessionId: metadata.sessionId,
+                requestId: metadata.requestId,
+              }, failSilent);
+            }
+          });
+
+          return responses;
+        }
+      : undefined,
+
     async embed(request: EmbedRequest & { metadata?: UsageMetadata }): Promise<EmbedResponse> {
       const startTime = Date.now();
       let response: EmbedResponse;
@@ -10,6 +10,7 @@
 
 import type { MCPResult, HandlerContext } from '../types.js';
 import { getContentStore } from '../../storage/index.js';
+import { getEmbedder } from './ollama-connection.js';
 import { AgenticSearchService } from '../../agentic-search/agentic-search-service.js';
 import { UnifiedStore, StubBooksStore } from '../../agentic-search/unified-store.js';
 import {
@@ -28,34 +29,8 @@ import type {
 // LAZY-LOADED DEPENDENCIES
 // ═══════════════════════════════════════════════════════════════════
 
-let OllamaAdapter: typeof import('@humanizer/npe').OllamaAdapter | null = null;
-let adapter: InstanceType<typeof import('@humanizer/npe').OllamaAdapter> | null = null;
 let searchService: AgenticSearchService | null = null;
 
-async function ensureNpeLoaded(): Promise<void> {
-  if (!OllamaAdapter) {
-    const npe = await import('@humanizer/npe');
-    OllamaAdapter = npe.OllamaAdapter;
-  }
-}
-
-async function getEmbedder(): Promise<(text: string) => Promise<number[]>> {
-  await ensureNpeLoaded();
-
-  if (!adapter) {
-    adapter = new OllamaAdapter!();
-    const isAvailable = await adapter.isAvailable();
-    if (!isAvailable) {
-      throw new Error('Ollama is not available. Please ensure Ollama is running on localhost:11434');
-    }
-  }
-
-  return async (text: string) => {
-    const result = await adapter!.embed(text);
-    return result.embedding;
-  };
-}
-
 async function getSearchService(): Promise<AgenticSearchService> {
   if (!searchService) {
     const store = getContentStore();
@@ -16,10 +16,10 @@
 
 import type { MCPResult } from '../types.js';
 import { getContentStore } from '../../storage/index.js';
+import { getOllamaAdapter } from './ollama-connection.js';
 
 // Lazy-loaded NPE components
 let BqlCli: typeof import('@humanizer/npe').BqlCli | null = null;
-let OllamaAdapter: typeof import('@humanizer/npe').OllamaAdapter | null = null;
 let createStorageBridge: typeof import('@humanizer/npe').createStorageBridge | null = null;
 let parseBql: typeof import('@humanizer/npe').parseBql | null = null;
 let BQL_HELP: string | null = null;
@@ -27,7 +27,6 @@ let BUILTIN_PERSONAS: typeof import('@humanizer/npe').BUILTIN_PERSONAS | null =
 let BUILTIN_STYLES: typeof import('@humanizer/npe').BUILTIN_STYLES | null = null;
 
 // Singleton instances
-let adapter: InstanceType<typeof import('@humanizer/npe').OllamaAdapter> | null = null;
 let cli: InstanceType<typeof import('@humanizer/npe').BqlCli> | null = null;
 let storageConnected = false;
 
@@ -39,7 +38,6 @@ async function ensureNpeLoaded(): Promise<void> {
   if (!BqlCli) {
     const npe = await import('@humanizer/npe');
     BqlCli = npe.BqlCli;
-    OllamaAdapter = npe.OllamaAdapter;
     createStorageBridge = npe.createStorageBridge;
     parseBql = npe.parseBql;
     BQL_HELP = npe.BQL_HELP;
@@ -52,12 +50,7 @@ async function getCli(): Promise<InstanceType<typeof import('@humanizer/npe').Bq
   await ensureNpeLoaded();
 
   if (!cli) {
-    adapter = new OllamaAdapter!();
-
-    const isAvailable = await adapter.isAvailable();
-    if (!isAvailable) {
-      throw new Error('Ollama is not available. Please ensure Ollama is running on localhost:11434');
-    }
+    const adapter = await getOllamaAdapter();
 
     // Try to connect to PostgresContentStore for archive access
     let storage: import('@humanizer/npe').StorageBridge | undefined;
@@ -68,7 +61,7 @@ async function getCli(): Promise<InstanceType<typeof import('@humanizer/npe').Bq
 
       // Create embedding function using Ollama
       const embedFn = async (text: string) => {
-        const result = await adapter!.embed(text);
+        const result = await adapter.embed(text);
         return result.embedding;
       };
 
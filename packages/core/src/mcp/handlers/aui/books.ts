@@ -126,12 +126,12 @@ export async function handleBookGenerateArc(args: {
 export async function handleBookList(): Promise<MCPResult> {
   try {
     const service = getService();
-    const books = await service.listBooks();
+    const books = await service.listBookSummaries();
     return jsonResult({
       books: books.map(b => ({
         id: b.id,
         title: b.title,
-        chapterCount: b.chapters.length,
+        chapterCount: b.chapterCount,
         status: b.status,
         createdAt: b.createdAt.toISOString(),
       })),
@@ -13,15 +13,14 @@ import type {
   FindLoadBearingSentencesInput,
 } from '../types.js';
 import { AVAILABLE_PERSONAS, AVAILABLE_STYLES } from '../tools/book-agent.js';
+import { getOllamaAdapter } from './ollama-connection.js';
 
 // Lazy imports to avoid loading heavy dependencies at startup
 let BookAgent: typeof import('@humanizer/npe').BookAgent | null = null;
-let OllamaAdapter: typeof import('@humanizer/npe').OllamaAdapter | null = null;
 let BUILTIN_PERSONAS: typeof import('@humanizer/npe').BUILTIN_PERSONAS | null = null;
 let BUILTIN_STYLES: typeof import('@humanizer/npe').BUILTIN_STYLES | null = null;
 
 // Singleton instances (lazy initialized)
-let adapter: InstanceType<typeof import('@humanizer/npe').OllamaAdapter> | null = null;
 let agent: InstanceType<typeof import('@humanizer/npe').BookAgent> | null = null;
 
 // ═══════════════════════════════════════════════════════════════════
@@ -49,7 +48,6 @@ async function ensureNpeLoaded(): Promise<void> {
   if (!BookAgent) {
     const npe = await import('@humanizer/npe');
     BookAgent = npe.BookAgent;
-    OllamaAdapter = npe.OllamaAdapter;
     BUILTIN_PERSONAS = npe.BUILTIN_PERSONAS;
     BUILTIN_STYLES = npe.BUILTIN_STYLES;
   }
@@ -59,16 +57,10 @@ async function getAgent(): Promise<InstanceType<typeof import('@humanizer/npe').
   await ensureNpeLoaded();
 
   if (!agent) {
-    adapter = new OllamaAdapter!();
-
-    // Check if Ollama is available
-    const isAvailable = await adapter.isAvailable();
-    if (!isAvailable) {
-      throw new Error('Ollama is not available. Please ensure Ollama is running on localhost:11434');
-    }
+    const adapter = await getOllamaAdapter();
 
     const embedder = async (text: string) => {
-      const result = await adapter!.embed(text);
+      const result = await adapter.embed(text);
       return result.embedding;
     };
 
@@ -14,6 +14,7 @@
 
 import type { MCPResult, HandlerContext } from '../types.js';
 import { getContentStore } from '../../storage/index.js';
+import { getEmbedder } from './ollama-connection.js';
 import type { SearchResult } from '../../storage/types.js';
 import { ClusteringService } from '../../clustering/clustering-service.js';
 import type { ClusterPoint } from '../../clustering/types.js';
@@ -50,37 +51,6 @@ export function isStorageConnected(): boolean {
   return storageConnected;
 }
 
-// ═══════════════════════════════════════════════════════════════════
-// LAZY-LOADED NPE ADAPTER
-// ═══════════════════════════════════════════════════════════════════
-
-let OllamaAdapter: typeof import('@humanizer/npe').OllamaAdapter | null = null;
-let adapter: InstanceType<typeof import('@humanizer/npe').OllamaAdapter> | null = null;
-
-async function ensureNpeLoaded(): Promise<void> {
-  if (!OllamaAdapter) {
-    const npe = await import('@humanizer/npe');
-    OllamaAdapter = npe.OllamaAdapter;
-  }
-}
-
-async function getEmbedder(): Promise<(text: string) => Promise<number[]>> {
-  await ensureNpeLoaded();
-
-  if (!adapter) {
-    adapter = new OllamaAdapter!();
-    const isAvailable = await adapter.isAvailable();
-    if (!isAvailable) {
-      throw new Error('Ollama is not available. Please ensure Ollama is running on localhost:11434');
-    }
-  }
-
-  return async (text: string) => {
-    const result = await adapter!.embed(text);
-    return result.embedding;
-  };
-}
-
 // ═══════════════════════════════════════════════════════════════════
 // RESULT HELPERS
 // ═══════════════════════════════════════════════════════════════════
@@ -959,8 +929,6 @@ export async function handleComposeChapter(args: ComposeChapterInput): Promise<M
       return errorResult('Title, theme, and passages are required');
     }
 
-    await ensureNpeLoaded();
-
     // Create outline first
     const outlineResult = await handleCreateOutline({
       theme: args.theme,
@@ -0,0 +1,56 @@
+/**
+ * Shared Ollama Connection
+ *
+ * A single lazily-opened OllamaAdapter shared by every MCP handler module.
+ * The server keeps one warm client for its lifetime instead of each handler
+ * family constructing and availability-probing its own.
+ *
+ * @module @humanizer/core/mcp/handlers/ollama-connection
+ */
+
+type OllamaAdapterInstance = InstanceType<typeof import('@humanizer/npe').OllamaAdapter>;
+
+let connecting: Promise<OllamaAdapterInstance> | null = null;
+
+/**
+ * Get the shared Ollama adapter, connecting on first use.
+ *
+ * Concurrent first calls share one connection attempt. A failed attempt is
+ * forgotten so the next call retries once Ollama is up.
+ */
+export function getOllamaAdapter(): Promise<OllamaAdapterInstance> {
+  if (!connecting) {
+    const attempt = (async () => {
+      const { OllamaAdapter } = await import('@humanizer/npe');
+      const adapter = new OllamaAdapter();
+      const isAvailable = await adapter.isAvailable();
+      if (!isAvailable) {
+        throw new Error('Ollama is not available. Please ensure Ollama is running on localhost:11434');
+      }
+      return adapter;
+    })();
+    attempt.catch(() => {
+      if (connecting === attempt) connecting = null;
+    });
+    connecting = attempt;
+  }
+  return connecting;
+}
+
+/**
+ * Get an embedding function backed by the shared adapter
+ */
+export async function getEmbedder(): Promise<(text: string) => Promise<number[]>> {
+  const adapter = await getOllamaAdapter();
+  return async (text: string) => {
+    const result = await adapter.embed(text);
+    return result.embedding;
+  };
+}
+
+/**
+ * Drop the shared adapter (server shutdown, tests)
+ */
+export function resetOllamaAdapter(): void {
+  connecting = null;
+}
@@ -8,6 +8,7 @@
 
 import type { MCPResult, HandlerContext } from '../types.js';
 import { getContentStore } from '../../storage/index.js';
+import { getEmbedder } from './ollama-connection.js';
 import { PatternSystem } from '../../agentic-search/pattern-discovery-system.js';
 import { PatternStore, initPatternStore, getPatternStore } from '../../storage/pattern-store.js';
 
@@ -15,35 +16,9 @@ import { PatternStore, initPatternStore, getPatternStore } from '../../storage/p
 // LAZY-LOADED DEPENDENCIES
 // ═══════════════════════════════════════════════════════════════════
 
-let OllamaAdapter: typeof import('@humanizer/npe').OllamaAdapter | null = null;
-let adapter: InstanceType<typeof import('@humanizer/npe').OllamaAdapter> | null = null;
 let patternSystem: PatternSystem | null = null;
 let patternStore: PatternStore | null = null;
 
-async function ensureNpeLoaded(): Promise<void> {
-  if (!OllamaAdapter) {
-    const npe = await import('@humanizer/npe');
-    OllamaAdapter = npe.OllamaAdapter;
-  }
-}
-
-async function getEmbedder(): Promise<(text: string) => Promise<number[]>> {
-  await ensureNpeLoaded();
-
-  if (!adapter) {
-    adapter = new OllamaAdapter!();
-    const isAvailable = await adapter.isAvailable();
-    if (!isAvailable) {
-      throw new Error('Ollama is not available. Please ensure Ollama is running on localhost:11434');
-    }
-  }
-
-  return async (text: string) => {
-    const result = await adapter!.embed(text);
-    return result.embedding;
-  };
-}
-
 async function getPatternStoreInstance(): Promise<PatternStore> {
   if (!patternStore) {
     const store = getContentStore();
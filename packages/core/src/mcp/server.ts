@@ -26,6 +26,7 @@ import { ALL_TOOLS, getToolDefinition } from './tools/definitions.js';
 import { getHandler } from './handlers/index.js';
 import { initializeDevelopmentAgents, shutdownDevelopmentAgents } from '../houses/codeguard/index.js';
 import { getAuiSessionState, getBufferContents } from './handlers/aui.js';
+import { resetOllamaAdapter } from './handlers/ollama-connection.js';
 
 // ═══════════════════════════════════════════════════════════════════
 // MCP SERVER CLASS
@@ -106,6 +107,7 @@ export class HumanizerMCPServer {
     
     await shutdownDevelopmentAgents();
     await this.server.close();
+    resetOllamaAdapter();
     
     this.log('info', 'Server shutdown complete');
   }
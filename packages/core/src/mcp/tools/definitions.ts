@@ -602,9 +602,20 @@ export function getToolsByCategory(category: 'codeguard' | 'hooks' | 'system' |
   return ALL_TOOLS.filter(tool => tool.category === category);
 }
 
+/**
+ * Tool definitions indexed by name (first definition wins)
+ */
+const TOOLS_BY_NAME: ReadonlyMap<string, MCPToolDefinition> = (() => {
+  const byName = new Map<string, MCPToolDefinition>();
+  for (const tool of ALL_TOOLS) {
+    if (!byName.has(tool.name)) byName.set(tool.name, tool);
+  }
+  return byName;
+})();
+
 /**
  * Get a tool definition by name
  */
 export function getToolDefinition(name: string): MCPToolDefinition | undefined {
-  return ALL_TOOLS.find(tool => tool.name === name);
+  return TOOLS_BY_NAME.get(name);
 }
@@ -796,11 +796,22 @@ export const UNIFIED_AUI_TOOLS: McpToolDefinition[] = [
   ...adminTierTools,
 ];
 
+/**
+ * Unified tools indexed by name (first definition wins).
+ */
+const AUI_TOOLS_BY_NAME: ReadonlyMap<string, McpToolDefinition> = (() => {
+  const byName = new Map<string, McpToolDefinition>();
+  for (const tool of UNIFIED_AUI_TOOLS) {
+    if (!byName.has(tool.name)) byName.set(tool.name, tool);
+  }
+  return byName;
+})();
+
 /**
  * Get tool by name.
  */
 export function getAuiTool(name: string): McpToolDefinition | undefined {
-  return UNIFIED_AUI_TOOLS.find(t => t.name === name);
+  return AUI_TOOLS_BY_NAME.get(name);
 }
 
 /**
@@ -42,18 +42,80 @@ export function cosineSimilarity(a: number[], b: number[]): number {
   return dotProduct / denominator;
 }
 
+/**
+ * Per-set constants, computed once per filtering call and reused for
+ * every result vector scored against the set
+ */
+interface SetSummary {
+  /** L2 norm of each vector */
+  norms: number[];
+  /** Sum of the unit-normalized vectors (zero vectors contribute nothing) */
+  unitSum: number[] | null;
+}
+
+function summarizeSet(set: number[][]): SetSummary {
+  return { norms: set.map(vectorNorm), unitSum: null };
+}
+
+function getUnitSum(set: number[][], summary: SetSummary): number[] {
+  if (!summary.unitSum) {
+    const dim = set[0].length;
+    const unitSum = new Array<number>(dim).fill(0);
+    for (let j = 0; j < set.length; j++) {
+      const v = set[j];
+      if (v.length !== dim) {
+        throw new Error(`Vector dimensions must match: ${dim} vs ${v.length}`);
+      }
+      const norm = summary.norms[j];
+      if (norm === 0) continue;
+      for (let i = 0; i < dim; i++) unitSum[i] += v[i] / norm;
+    }
+    summary.unitSum = unitSum;
+  }
+  return summary.unitSum;
+}
+
+function vectorNorm(vector: number[]): number {
+  let norm = 0;
+  for (let i = 0; i < vector.length; i++) norm += vector[i] * vector[i];
+  return Math.sqrt(norm);
+}
+
 /**
  * Compute maximum similarity to any vector in a set
  */
 export function maxSimilarityToSet(
   vector: number[],
   set: number[][]
+): { maxSimilarity: number; closestIndex: number } {
+  return maxSimilarityToSummarized(vector, set, summarizeSet(set));
+}
+
+function maxSimilarityToSummarized(
+  vector: number[],
+  set: number[][],
+  summary: SetSummary
 ): { maxSimilarity: number; closestIndex: number } {
   let maxSimilarity = -1;
   let closestIndex = -1;
 
+  const { norms } = summary;
+  const vectorNormValue = vectorNorm(vector);
+
   for (let i = 0; i < set.length; i++) {
-    const similarity = cosineSimilarity(vector, set[i]);
+    const other = set[i];
+    if (other.length !== vector.length) {
+      throw new Error(`Vector dimensions must match: ${vector.length} vs ${other.length}`);
+    }
+
+    const denominator = vectorNormValue * norms[i];
+    let similarity = 0;
+    if (denominator !== 0) {
+      let dotProduct = 0;
+      for (let d = 0; d < vector.length; d++) dotProduct += vector[d] * other[d];
+      similarity = dotProduct / denominator;
+    }
+
     if (similarity > maxSimilarity) {
       maxSimilarity = similarity;
       closestIndex = i;
@@ -68,13 +130,31 @@ export function maxSimilarityToSet(
  */
 export function avgSimilarityToSet(vector: number[], set: number[][]): number {
   if (set.length === 0) return 0;
+  return avgSimilarityToSummarized(vector, set, summarizeSet(set));
+}
 
-  let sum = 0;
-  for (const v of set) {
-    sum += cosineSimilarity(vector, v);
+/**
+ * The mean of cosine similarities equals one dot product against the sum
+ * of the set's unit vectors, so with a shared summary each call is O(dim)
+ * rather than O(dim × set size).
+ */
+function avgSimilarityToSummarized(
+  vector: number[],
+  set: number[][],
+  summary: SetSummary
+): number {
+  const unitSum = getUnitSum(set, summary);
+  if (unitSum.length !== vector.length) {
+    throw new Error(`Vector dimensions must match: ${vector.length} vs ${unitSum.length}`);
   }
 
-  return sum / set.length;
+  const vectorNormValue = vectorNorm(vector);
+  if (vectorNormValue === 0) return 0;
+
+  let dotProduct = 0;
+  for (let i = 0; i < vector.length; i++) dotProduct += vector[i] * unitSum[i];
+
+  return dotProduct / vectorNormValue / set.length;
 }
 
 // ═══════════════════════════════════════════════════════════════════
@@ -99,6 +179,7 @@ export function filterByNegativeEmbeddings(
 
   const filtered: FusedResult[] = [];
   let removedCount = 0;
+  let negativeSummary: SetSummary | undefined;
 
   for (const result of results) {
     // We need the node's embedding to compare
@@ -116,7 +197,12 @@ export function filterByNegativeEmbeddings(
       continue;
     }
 
-    const { maxSimilarity } = maxSimilarityToSet(nodeEmbedding, negativeEmbeddings);
+    negativeSummary ??= summarizeSet(negativeEmbeddings);
+    const { maxSimilarity } = maxSimilarityToSummarized(
+      nodeEmbedding,
+      negativeEmbeddings,
+      negativeSummary
+    );
 
     if (mode === 'exclude') {
       // Exclude if too similar to any negative
@@ -166,6 +252,7 @@ export function filterWithEmbeddings(
 
   const filtered: FusedResult[] = [];
   let removedCount = 0;
+  let negativeSummary: SetSummary | undefined;
 
   for (const result of results) {
     const nodeEmbedding = embeddings.get(result.node.id);
@@ -176,7 +263,12 @@ export function filterWithEmbeddings(
       continue;
     }
 
-    const { maxSimilarity } = maxSimilarityToSet(nodeEmbedding, negativeEmbeddings);
+    negativeSummary ??= summarizeSet(negativeEmbeddings);
+    const { maxSimilarity } = maxSimilarityToSummarized(
+      nodeEmbedding,
+      negativeEmbeddings,
+      negativeSummary
+    );
 
     if (mode === 'exclude') {
       if (maxSimilarity >= threshold) {
@@ -212,6 +304,9 @@ export function adjustScoresByEmbeddings(
     return results;
   }
 
+  const positiveSummary = summarizeSet(positiveEmbeddings);
+  const negativeSummary = summarizeSet(negativeEmbeddings);
+
   return results.map((result) => {
     const nodeEmbedding = embeddings.get(result.node.id);
 
@@ -222,12 +317,12 @@ export function adjustScoresByEmbeddings(
     let adjustment = 0;
 
     if (positiveEmbeddings.length > 0) {
-      const posAvg = avgSimilarityToSet(nodeEmbedding, positiveEmbeddings);
+      const posAvg = avgSimilarityToSummarized(nodeEmbedding, positiveEmbeddings, positiveSummary);
       adjustment += posAvg * positiveWeight;
     }
 
     if (negativeEmbeddings.length > 0) {
-      const negAvg = avgSimilarityToSet(nodeEmbedding, negativeEmbeddings);
+      const negAvg = avgSimilarityToSummarized(nodeEmbedding, negativeEmbeddings, negativeSummary);
       adjustment -= negAvg * negativeWeight;
     }
 
@@ -236,6 +236,34 @@ describe('Negative Filtering', () => {
 
       expect(avg).toBeCloseTo(0.5, 5);
     });
+
+    it('matches the mean of pairwise similarities across repeated calls', () => {
+      const set = [[0.2, 0.9, 0.1], [0.7, 0.1, 0.3], [0, 0, 0]];
+      const vectors = [[1, 2, 3], [-1, 0.5, 2], [0.3, 0.3, 0.3]];
+
+      for (const vec of vectors) {
+        const expected = set.reduce((sum, v) => sum + cosineSimilarity(vec, v), 0) / set.length;
+        expect(avgSimilarityToSet(vec, set)).toBeCloseTo(expected, 10);
+      }
+    });
+
+    it('picks up vectors appended to a set', () => {
+      const set = [[1, 0]];
+      expect(avgSimilarityToSet([1, 0], set)).toBeCloseTo(1, 5);
+
+      set.push([0, 1]);
+      expect(avgSimilarityToSet([1, 0], set)).toBeCloseTo(0.5, 5);
+    });
+
+    it('picks up vectors replaced in place', () => {
+      const set = [[1, 0], [1, 0]];
+      expect(avgSimilarityToSet([1, 0], set)).toBeCloseTo(1, 5);
+      expect(maxSimilarityToSet([0, 1], set).maxSimilarity).toBeCloseTo(0, 5);
+
+      set[1] = [0, 1];
+      expect(avgSimilarityToSet([1, 0], set)).toBeCloseTo(0.5, 5);
+      expect(maxSimilarityToSet([0, 1], set)).toEqual({ maxSimilarity: 1, closestIndex: 1 });
+    });
   });
 
   describe('filterWithEmbeddings', () => {
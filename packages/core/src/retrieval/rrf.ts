@@ -172,8 +172,14 @@ export function computeOverlapStats(
 export function normalizeScores(results: FusedResult[]): FusedResult[] {
   if (results.length === 0) return results;
 
-  const maxScore = Math.max(...results.map((r) => r.fusedScore));
-  const minScore = Math.min(...results.map((r) => r.fusedScore));
+  // One pass for both bounds; spreading into Math.max/min copies the
+  // scores twice and overflows the argument limit on very large lists
+  let minScore = Infinity;
+  let maxScore = -Infinity;
+  for (const r of results) {
+    if (r.fusedScore < minScore) minScore = r.fusedScore;
+    if (r.fusedScore > maxScore) maxScore = r.fusedScore;
+  }
   const range = maxScore - minScore;
 
   if (range === 0) {
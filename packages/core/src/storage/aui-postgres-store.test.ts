@@ -272,6 +272,76 @@ describe('AuiPostgresStore', () => {
       expect(book.title).toBe('My Book');
       expect(book.status).toBe('draft');
     });
+
+    it('lists books with their chapters in one chapter query', async () => {
+      const bookRow = (id: string) => ({
+        id,
+        user_id: 'user-123',
+        title: `Book ${id}`,
+        description: null,
+        arc: null,
+        status: 'draft',
+        source_cluster_id: null,
+        metadata: {},
+        chapter_count: 0,
+        word_count: 0,
+        created_at: new Date(),
+        updated_at: new Date(),
+      });
+      const chapterRow = (id: string, bookId: string, position: number) => ({
+        id,
+        book_id: bookId,
+        title: `Chapter ${id}`,
+        content: '',
+        position,
+        word_count: 10,
+        passage_ids: [],
+        metadata: {},
+        created_at: new Date(),
+        updated_at: new Date(),
+      });
+
+      (mockPool.query as any)
+        .mockResolvedValueOnce({ rows: [bookRow('b1'), bookRow('b2'), bookRow('b3')] })
+        .mockResolvedValueOnce({
+          rows: [chapterRow('c1', 'b1', 0), chapterRow('c2', 'b1', 1), chapterRow('c3', 'b3', 0)],
+        });
+
+      const books = await store.listBooks();
+
+      expect(mockPool.query).toHaveBeenCalledTimes(2);
+      expect((mockPool.query as any).mock.calls[1][1]).toEqual([['b1', 'b2', 'b3']]);
+      expect(books.map((b) => b.chapters.map((c) => c.id))).toEqual([['c1', 'c2'], [], ['c3']]);
+    });
+
+    it('lists book summaries from the stored chapter stats', async () => {
+      (mockPool.query as any).mockResolvedValueOnce({
+        rows: [
+          {
+            id: 'b1',
+            user_id: 'user-123',
+            title: 'Long Book',
+            description: null,
+            status: 'published',
+            chapter_count: 12,
+            word_count: 48000,
+            created_at: new Date(),
+            updated_at: new Date(),
+          },
+        ],
+      });
+
+      const summaries = await store.listBookSummaries();
+
+      expect(mockPool.query).toHaveBeenCalledTimes(1);
+      expect((mockPool.query as any).mock.calls[0][1]).toEqual([null, 100, 0]);
+      expect(summaries[0]).toMatchObject({
+        id: 'b1',
+        description: '',
+        chapterCount: 12,
+        wordCount: 48000,
+      });
+    });
   });
 
   describe('Cluster Operations', () => {
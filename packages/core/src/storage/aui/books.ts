@@ -8,20 +8,22 @@
 
 import { randomUUID } from 'crypto';
 import type { Pool } from 'pg';
-import type { Book, BookChapter, NarrativeArc } from '../../aui/types.js';
+import type { Book, BookChapter, BookSummary, NarrativeArc } from '../../aui/types.js';
 import {
   INSERT_AUI_BOOK,
   GET_AUI_BOOK,
   UPDATE_AUI_BOOK,
   DELETE_AUI_BOOK,
   LIST_AUI_BOOKS,
+  LIST_AUI_BOOK_SUMMARIES,
   INSERT_AUI_CHAPTER,
   GET_AUI_CHAPTERS,
+  GET_AUI_CHAPTERS_FOR_BOOKS,
   UPDATE_AUI_CHAPTER,
   DELETE_AUI_CHAPTER,
 } from '../schema-aui.js';
-import type { DbBookRow, DbChapterRow } from './row-types.js';
-import { rowToBook, rowToChapter } from './converters.js';
+import type { DbBookRow, DbBookSummaryRow, DbChapterRow } from './row-types.js';
+import { rowToBook, rowToBookSummary, rowToChapter } from './converters.js';
 
 export interface BookStoreMethods {
   // Book methods
@@ -43,6 +45,11 @@ export interface BookStoreMethods {
     limit?: number;
     offset?: number;
   }): Promise<Book[]>;
+  listBookSummaries(options?: {
+    userId?: string;
+    limit?: number;
+    offset?: number;
+  }): Promise<BookSummary[]>;
 
   // Chapter methods
   createChapter(bookId: string, chapter: BookChapter): Promise<BookChapter>;
@@ -143,12 +150,36 @@ export function createBookMethods(pool: Pool): BookStoreMethods {
         options?.offset ?? 0,
       ]);
 
-      const books: Book[] = [];
-      for (const row of result.rows) {
-        const chapters = await methods.getChapters((row as DbBookRow).id);
-        books.push(rowToBook(row as DbBookRow, chapters));
+      const rows = result.rows as DbBookRow[];
+      if (rows.length === 0) return [];
+
+      // Load chapters for the whole page in one query rather than per book
+      const chapterResult = await pool.query(GET_AUI_CHAPTERS_FOR_BOOKS, [
+        rows.map((row) => row.id),
+      ]);
+      const chaptersByBook = new Map<string, BookChapter[]>();
+      for (const chapterRow of chapterResult.rows as DbChapterRow[]) {
+        const chapters = chaptersByBook.get(chapterRow.book_id);
+        const chapter = rowToChapter(chapterRow);
+        if (chapters) chapters.push(chapter);
+        else chaptersByBook.set(chapterRow.book_id, [chapter]);
       }
-      return books;
+
+      return rows.map((row) => rowToBook(row, chaptersByBook.get(row.id) ?? []));
+    },
+
+    async listBookSummaries(options?: {
+      userId?: string;
+      limit?: number;
+      offset?: number;
+    }): Promise<BookSummary[]> {
+      // Chapter stats are stored on the book row, so this never touches chapters
+      const result = await pool.query(LIST_AUI_BOOK_SUMMARIES, [
+        options?.userId ?? null,
+        options?.limit ?? 100,
+        options?.offset ?? 0,
+      ]);
+      return result.rows.map((row) => rowToBookSummary(row as DbBookSummaryRow));
     },
 
     // ═══════════════════════════════════════════════════════════════════
@@ -15,6 +15,7 @@ import type {
   AgentTask,
   Book,
   BookChapter,
+  BookSummary,
   ContentCluster,
 } from '../../aui/types.js';
 import type {
@@ -34,6 +35,7 @@ import type {
   DbVersionRow,
   DbTaskRow,
   DbBookRow,
+  DbBookSummaryRow,
   DbChapterRow,
   DbClusterRow,
   DbArtifactRow,
@@ -163,6 +165,19 @@ export function rowToBook(row: DbBookRow, chapters: BookChapter[]): Book {
   };
 }
 
+export function rowToBookSummary(row: DbBookSummaryRow): BookSummary {
+  return {
+    id: row.id,
+    title: row.title,
+    description: row.description ?? '',
+    status: row.status as Book['status'],
+    chapterCount: row.chapter_count,
+    wordCount: row.word_count,
+    createdAt: row.created_at,
+    updatedAt: row.updated_at,
+  };
+}
+
 export function rowToChapter(row: DbChapterRow): BookChapter {
   return {
     id: row.id,
@@ -198,6 +198,8 @@ export class AuiPostgresStore
     this.bookMethods.deleteBook(...args);
   listBooks: BookStoreMethods['listBooks'] = (...args) =>
     this.bookMethods.listBooks(...args);
+  listBookSummaries: BookStoreMethods['listBookSummaries'] = (...args) =>
+    this.bookMethods.listBookSummaries(...args);
   createChapter: BookStoreMethods['createChapter'] = (...args) =>
     this.bookMethods.createChapter(...args);
   getChapters: BookStoreMethods['getChapters'] = (...args) =>
@@ -90,10 +90,25 @@ export interface DbBookRow {
   status: string;
   source_cluster_id: string | null;
   metadata: Record<string, unknown>;
+  chapter_count: number;
+  word_count: number;
   created_at: Date;
   updated_at: Date;
 }
 
+export type DbBookSummaryRow = Pick<
+  DbBookRow,
+  | 'id'
+  | 'user_id'
+  | 'title'
+  | 'description'
+  | 'status'
+  | 'chapter_count'
+  | 'word_count'
+  | 'created_at'
+  | 'updated_at'
+>;
+
 export interface DbChapterRow {
   id: string;
   book_id: string;
@@ -22,15 +22,25 @@ import {
   PostgresStorageConfig,
   DEFAULT_POSTGRES_CONFIG,
   INSERT_CONTENT_NODE,
+  INSERT_CONTENT_NODE_IF_NEW,
   UPDATE_EMBEDDING,
   INSERT_LINK,
   INSERT_JOB,
   VECTOR_SEARCH,
   GET_RANDOM_EMBEDDED_NODES,
+  GET_EMBEDDED_NODES_AT_KEYS,
+  ESTIMATE_NODE_COUNT,
+  ESTIMATE_EMBEDDED_NODE_COUNT,
   FTS_SEARCH,
+  CONTENT_NODE_COLUMNS,
   GET_NODE_BY_ID,
+  GET_NODES_BY_IDS,
   GET_NODE_BY_URI,
   GET_NODE_BY_HASH,
+  GET_NODE_IDS_BY_URIS,
+  GET_EXISTING_CONTENT_HASHES,
+  GET_IMPORTED_SOURCE_UPDATED_AT,
+  REFRESH_IMPORTED_SOURCE_UPDATED_AT,
   DELETE_NODE,
   GET_LINKS_FROM,
   GET_LINKS_TO,
@@ -38,9 +48,8 @@ import {
   GET_JOBS,
   GET_NODES_NEEDING_EMBEDDINGS,
   GET_EMBEDDING,
+  GET_EMBEDDINGS_BY_IDS,
   GET_STATS,
-  GET_NODES_BY_SOURCE_TYPE,
-  GET_NODES_BY_ADAPTER,
   // Fine-grained deduplication
   FIND_NODES_BY_PARAGRAPH_HASH,
   FIND_NODES_BY_LINE_HASH,
@@ -89,6 +98,19 @@ import type { ImportedNode, ContentLink } from '../adapters/types.js';
 import type { ParagraphHash, LineHash } from '../chunking/content-hasher.js';
 import type { MediaTextAssociation, MediaTextStats, PasteSegmentRecord, PasteStats } from './types.js';
 
+// ═══════════════════════════════════════════════════════════════════
+// SAMPLING
+// ═══════════════════════════════════════════════════════════════════
+
+/** Below this many embedded rows, ORDER BY RANDOM() is cheap enough */
+const KEY_SAMPLE_MIN_ROWS = 10_000;
+
+/** Pivots per requested row on successive attempts (duplicates, key-space tail) */
+const KEY_SAMPLE_OVERSAMPLE = [2, 5];
+
+/** Above this many rows, an unfiltered queryNodes reports the planner estimate as its total */
+const COUNT_ESTIMATE_MIN_ROWS = 100_000;
+
 // ═══════════════════════════════════════════════════════════════════
 // DATABASE ROW TYPES
 // ═══════════════════════════════════════════════════════════════════
@@ -335,12 +357,6 @@ export class PostgresContentStore {
   async storeNode(node: ImportedNode, jobId?: string): Promise<StoredNode> {
     this.ensureInitialized();
 
-    // Check for duplicate by content hash
-    const existing = await this.getNodeByHash(node.contentHash);
-    if (existing) {
-      return existing;
-    }
-
     const now = new Date();
     const id = node.id || randomUUID();
 
@@ -399,8 +415,14 @@ export class PostgresContentStore {
       now,
     ];
 
-    const result = await this.pool!.query(INSERT_CONTENT_NODE, params);
-    const row = result.rows[0] as DbRow;
+    // Dedup by content hash happens inside the insert
+    const result = await this.pool!.query(INSERT_CONTENT_NODE_IF_NEW, params);
+    const row = result.rows[0] as DbRow | undefined;
+    if (!row) {
+      const existing = await this.getNodeByHash(node.contentHash);
+      if (existing) return existing;
+      throw new Error(`Node with content hash ${node.contentHash} vanished during store`);
+    }
 
     // Store links
     if (node.links) {
@@ -430,15 +452,39 @@ export class PostgresContentStore {
     try {
       await client.query('BEGIN');
 
+      // Resolve duplicates and parent/thread URIs for the whole batch up
+      // front, instead of two or three lookups per node
+      const hashResult = await client.query(GET_EXISTING_CONTENT_HASHES, [
+        nodes.map((n) => n.contentHash),
+      ]);
+      const seenHashes = new Set<string>(
+        hashResult.rows.map((r: DbRow) => r.content_hash as string)
+      );
+
+      const refUris = new Set<string>();
+      for (const node of nodes) {
+        if (node.parentUri) refUris.add(node.parentUri);
+        if (node.threadRootUri) refUris.add(node.threadRootUri);
+      }
+      const uriIds = new Map<string, string>();
+      if (refUris.size > 0) {
+        const uriResult = await client.query(GET_NODE_IDS_BY_URIS, [[...refUris]]);
+        for (const row of uriResult.rows as DbRow[]) {
+          if (!uriIds.has(row.uri as string)) uriIds.set(row.uri as string, row.id as string);
+        }
+      }
+
       for (const node of nodes) {
         try {
-          const existing = await this.getNodeByHashWithClient(client, node.contentHash);
-          if (existing) {
+          if (seenHashes.has(node.contentHash)) {
             result.skipped++;
             continue;
           }
 
-          await this.storeNodeWithClient(client, node, jobId);
+          const stored = await this.storeNodeWithClient(client, node, jobId, uriIds);
+          seenHashes.add(node.contentHash);
+          // Later nodes in the batch may reference this one as parent
+          if (!uriIds.has(stored.uri)) uriIds.set(stored.uri, stored.id);
           result.stored++;
         } catch (error) {
           result.failed++;
@@ -472,6 +518,30 @@ export class PostgresContentStore {
     return row ? this.rowToNode(row) : undefined;
   }
 
+  /**
+   * Get several nodes by ID in one query.
+   * Results follow the order of `ids`; missing IDs are skipped.
+   */
+  async getNodes(ids: string[]): Promise<StoredNode[]> {
+    this.ensureInitialized();
+
+    if (ids.length === 0) return [];
+
+    const result = await this.pool!.query(GET_NODES_BY_IDS, [ids]);
+    const byId = new Map<string, StoredNode>();
+    for (const row of result.rows as DbRow[]) {
+      const node = this.rowToNode(row);
+      byId.set(node.id, node);
+    }
+
+    const nodes: StoredNode[] = [];
+    for (const id of ids) {
+      const node = byId.get(id);
+      if (node) nodes.push(node);
+    }
+    return nodes;
+  }
+
   /**
    * Get a node by URI
    */
@@ -496,21 +566,77 @@ export class PostgresContentStore {
     return row ? this.rowToNode(row) : undefined;
   }
 
+  /**
+   * Which of the given content hashes are already stored (one query)
+   */
+  async getExistingContentHashes(hashes: string[]): Promise<Set<string>> {
+    this.ensureInitialized();
+
+    if (hashes.length === 0) return new Set();
+
+    const result = await this.pool!.query(GET_EXISTING_CONTENT_HASHES, [hashes]);
+    return new Set(result.rows.map((r: DbRow) => r.content_hash as string));
+  }
+
+  /**
+   * Source update time of already-imported nodes, keyed by URI (one query)
+   *
+   * Only nodes from completed import jobs count, so a conversation left
+   * half-written by an interrupted import is never reported as present.
+   */
+  async getImportedSourceUpdatedAt(uris: string[]): Promise<Map<string, Date>> {
+    this.ensureInitialized();
+
+    if (uris.length === 0) return new Map();
+
+    const result = await this.pool!.query(GET_IMPORTED_SOURCE_UPDATED_AT, [uris]);
+    return new Map(
+      result.rows.map((r: DbRow) => [r.uri as string, r.source_updated_at as Date])
+    );
+  }
+
+  /**
+   * Record a newer source update time for already-imported nodes (one query)
+   *
+   * Never moves a timestamp backwards.
+   */
+  async refreshImportedSourceUpdatedAt(updatedAt: Map<string, Date>): Promise<void> {
+    this.ensureInitialized();
+
+    if (updatedAt.size === 0) return;
+
+    await this.pool!.query(REFRESH_IMPORTED_SOURCE_UPDATED_AT, [
+      [...updatedAt.keys()],
+      [...updatedAt.values()],
+    ]);
+  }
+
   /**
    * Query nodes with filters
+   *
+   * With no filters on a large table, COUNT(*) would scan every row, so the
+   * total is the planner's estimate instead (totalIsEstimate is set).
+   * hasMore is always exact.
    */
   async queryNodes(options: QueryOptions): Promise<QueryResult> {
     this.ensureInitialized();
 
-    const { sql, params } = this.buildQuerySql(options);
+    const { sql, params, filtered } = this.buildQuerySql(options);
 
     // Get total count
-    const countSql = sql.replace('SELECT *', 'SELECT COUNT(*) as count');
-    const countResult = await this.pool!.query(countSql, params);
-    const total = parseInt(countResult.rows[0].count, 10);
+    const estimatedTotal = filtered ? undefined : await this.estimateLargeNodeCount();
+    const totalIsEstimate = estimatedTotal !== undefined;
+    let total = estimatedTotal ?? 0;
+    if (estimatedTotal === undefined) {
+      const countSql = sql.replace('SELECT *', 'SELECT COUNT(*) as count');
+      const countResult = await this.pool!.query(countSql, params);
+      total = parseInt(countResult.rows[0].count, 10);
+    }
 
-    // Get paginated results
-    let paginatedSql = sql;
+    // Get paginated results, leaving the embedding and tsv columns behind
+    let paginatedSql = options.includeEmbedding
+      ? sql
+      : sql.replace('SELECT *', `SELECT ${CONTENT_NODE_COLUMNS}`);
     const paginatedParams = [...params];
 
     if (options.orderBy) {
@@ -521,9 +647,11 @@ export class PostgresContentStore {
       paginatedSql += ' ORDER BY created_at DESC';
     }
 
+    // An estimated total can't tell whether another page exists, so fetch
+    // one extra row to find out
     if (options.limit) {
       paginatedSql += ` LIMIT $${paginatedParams.length + 1}`;
-      paginatedParams.push(options.limit);
+      paginatedParams.push(totalIsEstimate ? options.limit + 1 : options.limit);
     }
 
     if (options.offset) {
@@ -532,7 +660,24 @@ export class PostgresContentStore {
     }
 
     const result = await this.pool!.query(paginatedSql, paginatedParams);
-    const nodes = result.rows.map((row: DbRow) => this.rowToNode(row));
+    let rows = result.rows as DbRow[];
+
+    if (totalIsEstimate) {
+      const hasMore = options.limit !== undefined && rows.length > options.limit;
+      if (hasMore) rows = rows.slice(0, options.limit);
+      const nodes = rows.map((row) => this.rowToNode(row));
+      const seen = (options.offset ?? 0) + nodes.length;
+
+      return {
+        nodes,
+        // A stale estimate must not fall below what this page proves exists
+        total: Math.max(total, hasMore ? seen + 1 : seen),
+        hasMore,
+        totalIsEstimate: true,
+      };
+    }
+
+    const nodes = rows.map((row) => this.rowToNode(row));
 
     return {
       nodes,
@@ -541,6 +686,16 @@ export class PostgresContentStore {
     };
   }
 
+  /**
+   * Planner row estimate for content_nodes, or undefined when the table is
+   * small enough that an exact COUNT(*) is cheap
+   */
+  private async estimateLargeNodeCount(): Promise<number | undefined> {
+    const result = await this.pool!.query(ESTIMATE_NODE_COUNT);
+    const estimate = Number(result.rows[0]?.estimate ?? 0);
+    return estimate >= COUNT_ESTIMATE_MIN_ROWS ? estimate : undefined;
+  }
+
   /**
    * Delete a node by ID
    */
@@ -669,6 +824,28 @@ export class PostgresContentStore {
     return fromSql(embedding);
   }
 
+  /**
+   * Get embeddings for several nodes in one query.
+   * Nodes without an embedding are absent from the returned map.
+   */
+  async getEmbeddings(nodeIds: string[]): Promise<Map<string, number[]>> {
+    this.ensureInitialized();
+
+    const embeddings = new Map<string, number[]>();
+    if (!this.config.enableVec || nodeIds.length === 0) {
+      return embeddings;
+    }
+
+    const result = await this.pool!.query(GET_EMBEDDINGS_BY_IDS, [nodeIds]);
+    for (const row of result.rows as Array<{ id: string; embedding: number[] | string }>) {
+      embeddings.set(
+        row.id,
+        Array.isArray(row.embedding) ? row.embedding : fromSql(row.embedding)
+      );
+    }
+    return embeddings;
+  }
+
   /**
    * Check if an embedding is stale (text changed since embedding)
    */
@@ -685,23 +862,45 @@ export class PostgresContentStore {
   }
 
   /**
-   * Get nodes that need embeddings
+   * Get nodes that need embeddings, optionally only those with at least
+   * `minWordCount` words (filtered in the database on word_count)
    */
-  async getNodesNeedingEmbeddings(limit: number): Promise<StoredNode[]> {
+  async getNodesNeedingEmbeddings(limit: number, minWordCount = 0): Promise<StoredNode[]> {
     this.ensureInitialized();
 
-    const result = await this.pool!.query(GET_NODES_NEEDING_EMBEDDINGS, [limit]);
+    const result = await this.pool!.query(GET_NODES_NEEDING_EMBEDDINGS, [limit, minWordCount]);
     return result.rows.map((row: DbRow) => this.rowToNode(row));
   }
 
   /**
    * Get random nodes that have embeddings (for clustering seed selection).
-   * Returns node IDs only for efficiency - use getNode() to fetch full data.
+   * Returns node IDs only for efficiency - use getNodes() to fetch full data.
+   *
+   * When many nodes are embedded, they are sampled by probing the partial
+   * index of embedded ids at random UUID pivots, which costs O(limit) index
+   * lookups instead of sorting every row. Few embedded nodes, a missing
+   * index or a short sample fall back to ORDER BY RANDOM().
    */
-  async getRandomEmbeddedNodeIds(limit: number): Promise<string[]> {
+  async getRandomEmbeddedNodeIds(limit: number, minWordCount = 0): Promise<string[]> {
     this.ensureInitialized();
 
-    const result = await this.pool!.query(GET_RANDOM_EMBEDDED_NODES, [limit]);
+    const estimateResult = await this.pool!.query(ESTIMATE_EMBEDDED_NODE_COUNT);
+    const estimate = Number(estimateResult.rows[0]?.estimate ?? 0);
+
+    if (estimate >= KEY_SAMPLE_MIN_ROWS) {
+      for (const factor of KEY_SAMPLE_OVERSAMPLE) {
+        const pivots = Array.from({ length: limit * factor }, () => randomUUID());
+        const sampled = await this.pool!.query(GET_EMBEDDED_NODES_AT_KEYS, [pivots, minWordCount]);
+
+        // Nearby pivots can land on the same node
+        const ids = new Set<string>(sampled.rows.map((row: { id: string }) => row.id));
+        if (ids.size >= limit) {
+          return [...ids].slice(0, limit);
+        }
+      }
+    }
+
+    const result = await this.pool!.query(GET_RANDOM_EMBEDDED_NODES, [limit, minWordCount]);
     return result.rows.map((row: { id: string }) => row.id);
   }
 
@@ -728,16 +927,21 @@ export class PostgresContentStore {
     // Get candidates from vector search
     const vecResults = await this.pool!.query(VECTOR_SEARCH, [vectorSql, limit * 2]);
 
+    const candidates = (vecResults.rows as Array<{ id: string; similarity: number }>).filter(
+      (row) => !options.threshold || row.similarity >= options.threshold
+    );
+
+    // Enrich all candidates in one round trip instead of one per row
+    const nodesById = new Map(
+      (await this.getNodes(candidates.map((row) => row.id))).map((node) => [node.id, node])
+    );
+
     // Filter and enrich results
     const results: SearchResult[] = [];
-    for (const row of vecResults.rows as Array<{ id: string; similarity: number }>) {
+    for (const row of candidates) {
       const similarity = row.similarity;
 
-      if (options.threshold && similarity < options.threshold) {
-        continue;
-      }
-
-      const node = await this.getNode(row.id);
+      const node = nodesById.get(row.id);
       if (!node) continue;
 
       // Apply filters
@@ -783,10 +987,17 @@ export class PostgresContentStore {
     // Search using tsvector
     const ftsResults = await this.pool!.query(FTS_SEARCH, [query, limit * 2]);
 
+    const rows = ftsResults.rows as Array<{ id: string; rank: number }>;
+
+    // Enrich all hits in one round trip instead of one per row
+    const nodesById = new Map(
+      (await this.getNodes(rows.map((row) => row.id))).map((node) => [node.id, node])
+    );
+
     // Enrich results
     const results: SearchResult[] = [];
-    for (const row of ftsResults.rows as Array<{ id: string; rank: number }>) {
-      const node = await this.getNode(row.id);
+    for (const row of rows) {
+      const node = nodesById.get(row.id);
       if (!node) continue;
 
       // Apply filters
@@ -1009,6 +1220,9 @@ export class PostgresContentStore {
 
   /**
    * Store multiple media-text associations in batch
+   *
+   * One transaction per batch, with a savepoint per row: a failed insert
+   * rolls back only itself instead of aborting the rest of the batch.
    */
   async storeMediaTextAssociations(
     associations: Array<Omit<MediaTextAssociation, 'id' | 'createdAt'>>
@@ -1050,9 +1264,12 @@ export class PostgresContentStore {
             now,
           ];
 
+          await client.query('SAVEPOINT association');
           await client.query(INSERT_MEDIA_TEXT_ASSOCIATION, params);
+          await client.query('RELEASE SAVEPOINT association');
           stored++;
         } catch (error) {
+          await client.query('ROLLBACK TO SAVEPOINT association');
           failed++;
         }
       }
@@ -1550,31 +1767,45 @@ export class PostgresContentStore {
   async getStats(): Promise<ContentStoreStats> {
     this.ensureInitialized();
 
-    // Get basic stats
-    const statsResult = await this.pool!.query(GET_STATS);
-    const stats = statsResult.rows[0];
+    // Totals and both breakdowns come back from a single grouping-sets query
+    const result = await this.pool!.query(GET_STATS);
 
-    // Get nodes by source type
-    const byTypeResult = await this.pool!.query(GET_NODES_BY_SOURCE_TYPE);
     const nodesBySourceType: Record<string, number> = {};
-    for (const row of byTypeResult.rows as Array<{ source_type: string; count: string }>) {
-      nodesBySourceType[row.source_type] = parseInt(row.count, 10);
-    }
-
-    // Get nodes by adapter
-    const byAdapterResult = await this.pool!.query(GET_NODES_BY_ADAPTER);
     const nodesByAdapter: Record<string, number> = {};
-    for (const row of byAdapterResult.rows as Array<{ source_adapter: string; count: string }>) {
-      nodesByAdapter[row.source_adapter] = parseInt(row.count, 10);
+    let totalNodes = 0;
+    let nodesWithEmbeddings = 0;
+    let totalLinks = 0;
+    let totalJobs = 0;
+
+    for (const row of result.rows as Array<{
+      grouping: number;
+      source_type: string;
+      source_adapter: string;
+      count: string;
+      nodes_with_embeddings: string;
+      total_links: string;
+      total_jobs: string;
+    }>) {
+      const count = parseInt(row.count, 10);
+      if (row.grouping === 1) {
+        nodesBySourceType[row.source_type] = count;
+      } else if (row.grouping === 2) {
+        nodesByAdapter[row.source_adapter] = count;
+      } else {
+        totalNodes = count;
+        nodesWithEmbeddings = parseInt(row.nodes_with_embeddings, 10);
+      }
+      totalLinks = parseInt(row.total_links, 10);
+      totalJobs = parseInt(row.total_jobs, 10);
     }
 
     return {
-      totalNodes: parseInt(stats.total_nodes, 10),
+      totalNodes,
       nodesBySourceType,
       nodesByAdapter,
-      nodesWithEmbeddings: parseInt(stats.nodes_with_embeddings, 10),
-      totalLinks: parseInt(stats.total_links, 10),
-      totalJobs: parseInt(stats.total_jobs, 10),
+      nodesWithEmbeddings,
+      totalLinks,
+      totalJobs,
     };
   }
 
@@ -1601,35 +1832,20 @@ export class PostgresContentStore {
     }
   }
 
-  private async getNodeByHashWithClient(client: PoolClient, hash: string): Promise<StoredNode | undefined> {
-    const result = await client.query(GET_NODE_BY_HASH, [hash]);
-    const row = result.rows[0] as DbRow | undefined;
-    return row ? this.rowToNode(row) : undefined;
-  }
-
-  private async storeNodeWithClient(client: PoolClient, node: ImportedNode, jobId?: string): Promise<StoredNode> {
+  private async storeNodeWithClient(
+    client: PoolClient,
+    node: ImportedNode,
+    jobId: string | undefined,
+    uriIds: Map<string, string>
+  ): Promise<StoredNode> {
     const now = new Date();
     const id = node.id || randomUUID();
     const wordCount = this.countWords(node.content);
     const sourceAdapter = node.uri.split('/')[2] || 'unknown';
 
-    // Resolve parent and thread root IDs
-    let parentNodeId: string | null = null;
-    let threadRootId: string | null = null;
-
-    if (node.parentUri) {
-      const parentResult = await client.query(GET_NODE_BY_URI, [node.parentUri]);
-      if (parentResult.rows.length > 0) {
-        parentNodeId = parentResult.rows[0].id;
-      }
-    }
-
-    if (node.threadRootUri) {
-      const threadResult = await client.query(GET_NODE_BY_URI, [node.threadRootUri]);
-      if (threadResult.rows.length > 0) {
-        threadRootId = threadResult.rows[0].id;
-      }
-    }
+    // Parent and thread root IDs come from the batch's pre-resolved URIs
+    const parentNodeId = node.parentUri ? uriIds.get(node.parentUri) ?? null : null;
+    const threadRootId = node.threadRootUri ? uriIds.get(node.threadRootUri) ?? null : null;
 
     const params = [
       id,
@@ -1705,7 +1921,11 @@ export class PostgresContentStore {
     wordCount: 'word_count',
   };
 
-  private buildQuerySql(options: QueryOptions): { sql: string; params: unknown[] } {
+  private buildQuerySql(options: QueryOptions): {
+    sql: string;
+    params: unknown[];
+    filtered: boolean;
+  } {
     const conditions: string[] = [];
     const params: unknown[] = [];
     let paramIndex = 1;
@@ -1751,6 +1971,10 @@ export class PostgresContentStore {
       params.push(options.authorRole);
     }
 
+    if (options.threadRootsOnly) {
+      conditions.push('(parent_node_id IS NULL OR id = thread_root_id)');
+    }
+
     if (options.dateRange?.start) {
       conditions.push(`source_created_at >= $${paramIndex++}`);
       params.push(new Date(options.dateRange.start));
@@ -1766,7 +1990,7 @@ export class PostgresContentStore {
       sql += ' WHERE ' + conditions.join(' AND ');
     }
 
-    return { sql, params };
+    return { sql, params, filtered: conditions.length > 0 };
   }
 
   private rowToNode(row: DbRow): StoredNode {
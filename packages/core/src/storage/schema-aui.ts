@@ -8,6 +8,7 @@
  */
 
 import type { PoolClient } from 'pg';
+import type { ConcurrentIndex } from './schema-postgres.js';
 
 // ═══════════════════════════════════════════════════════════════════
 // AUI SESSION TABLE
@@ -130,6 +131,11 @@ CREATE TABLE IF NOT EXISTS aui_books (
   status TEXT NOT NULL DEFAULT 'draft' CHECK (status IN ('draft', 'published', 'archived')),
   source_cluster_id TEXT,
   metadata JSONB DEFAULT '{}',
+
+  -- Denormalized chapter stats (maintained by trigger)
+  chapter_count INTEGER NOT NULL DEFAULT 0,
+  word_count INTEGER NOT NULL DEFAULT 0,
+
   created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
   updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
 );
@@ -153,6 +159,67 @@ CREATE TABLE IF NOT EXISTS aui_book_chapters (
 );
 `;
 
+/**
+ * Add chapter stats columns to books created before they existed
+ */
+export const ALTER_AUI_BOOKS_ADD_CHAPTER_STATS = `
+ALTER TABLE aui_books
+  ADD COLUMN IF NOT EXISTS chapter_count INTEGER NOT NULL DEFAULT 0,
+  ADD COLUMN IF NOT EXISTS word_count INTEGER NOT NULL DEFAULT 0;
+`;
+
+/**
+ * Keep aui_books.chapter_count / word_count in step with its chapters,
+ * so book listings never have to count chapter rows.
+ */
+export const CREATE_AUI_BOOK_CHAPTER_STATS_TRIGGER = `
+CREATE OR REPLACE FUNCTION update_aui_book_chapter_stats()
+RETURNS TRIGGER AS $$
+BEGIN
+  IF TG_OP IN ('UPDATE', 'DELETE') THEN
+    UPDATE aui_books SET
+      chapter_count = chapter_count - 1,
+      word_count = word_count - OLD.word_count
+    WHERE id = OLD.book_id;
+  END IF;
+  IF TG_OP IN ('INSERT', 'UPDATE') THEN
+    UPDATE aui_books SET
+      chapter_count = chapter_count + 1,
+      word_count = word_count + NEW.word_count
+    WHERE id = NEW.book_id;
+  END IF;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS aui_book_chapter_stats_trigger ON aui_book_chapters;
+
+CREATE TRIGGER aui_book_chapter_stats_trigger
+  AFTER INSERT OR DELETE OR UPDATE OF book_id, word_count ON aui_book_chapters
+  FOR EACH ROW
+  EXECUTE FUNCTION update_aui_book_chapter_stats();
+`;
+
+/**
+ * Recompute chapter stats for books whose stored values have drifted
+ * (e.g. rows written before the trigger existed). Only stale rows are updated.
+ */
+export const BACKFILL_AUI_BOOK_CHAPTER_STATS = `
+UPDATE aui_books b SET
+  chapter_count = s.chapter_count,
+  word_count = s.word_count
+FROM (
+  SELECT bk.id,
+         COUNT(c.id)::int AS chapter_count,
+         COALESCE(SUM(c.word_count), 0)::int AS word_count
+  FROM aui_books bk
+  LEFT JOIN aui_book_chapters c ON c.book_id = bk.id
+  GROUP BY bk.id
+) s
+WHERE b.id = s.id
+  AND (b.chapter_count <> s.chapter_count OR b.word_count <> s.word_count)
+`;
+
 // ═══════════════════════════════════════════════════════════════════
 // TRANSCRIPTION TABLES
 // ═══════════════════════════════════════════════════════════════════
@@ -726,6 +793,52 @@ CREATE TABLE IF NOT EXISTS aui_user_usage_snapshots (
 );
 `;
 
+/**
+ * User usage breakdowns table - per-model and per-operation counters
+ *
+ * One row per (snapshot, dimension, key). Recording a call upserts two
+ * small rows instead of rewriting the snapshot's JSONB documents, which
+ * grow with every distinct model and operation a user touches. The legacy
+ * by_model / by_operation snapshot columns are no longer written.
+ */
+export const CREATE_AUI_USER_USAGE_BREAKDOWNS_TABLE = `
+CREATE TABLE IF NOT EXISTS aui_user_usage_breakdowns (
+  user_id TEXT NOT NULL,
+  tenant_id TEXT NOT NULL DEFAULT 'humanizer',
+  billing_period TEXT NOT NULL,
+  dimension TEXT NOT NULL CHECK (dimension IN ('model', 'operation')),
+  key TEXT NOT NULL,
+
+  tokens BIGINT NOT NULL DEFAULT 0,
+  requests INTEGER NOT NULL DEFAULT 0,
+  cost_millicents BIGINT NOT NULL DEFAULT 0,
+
+  PRIMARY KEY (user_id, tenant_id, billing_period, dimension, key)
+);
+`;
+
+/**
+ * One-shot backfill of breakdown rows from the legacy snapshot JSONB.
+ * Only runs while the breakdowns table is still empty.
+ */
+export const BACKFILL_AUI_USER_USAGE_BREAKDOWNS = `
+INSERT INTO aui_user_usage_breakdowns (
+  user_id, tenant_id, billing_period, dimension, key, tokens, requests, cost_millicents
+)
+SELECT s.user_id, s.tenant_id, s.billing_period, d.dimension, e.key,
+  COALESCE((e.value ->> 'tokens')::bigint, 0),
+  COALESCE((e.value ->> 'requests')::integer, 0),
+  COALESCE((e.value ->> 'cost')::bigint, 0)
+FROM aui_user_usage_snapshots s
+CROSS JOIN LATERAL (
+  VALUES ('model', COALESCE(s.by_model, '{}'::jsonb)),
+         ('operation', COALESCE(s.by_operation, '{}'::jsonb))
+) AS d(dimension, doc)
+CROSS JOIN LATERAL jsonb_each(d.doc) AS e
+WHERE NOT EXISTS (SELECT 1 FROM aui_user_usage_breakdowns)
+ON CONFLICT DO NOTHING
+`;
+
 /**
  * API keys table - user-owned API keys for programmatic access
  *
@@ -1650,6 +1763,87 @@ CREATE INDEX IF NOT EXISTS idx_aui_user_preferences_tenant ON aui_user_preferenc
 CREATE INDEX IF NOT EXISTS idx_aui_provider_cost_rates_active ON aui_provider_cost_rates(provider, model_id) WHERE effective_until IS NULL;
 `;
 
+/**
+ * Indexes on tables that can be large on existing installs
+ */
+export const AUI_CONCURRENT_INDEXES: ConcurrentIndex[] = [
+  // Serves the per-period event listing without a sort
+  {
+    name: 'idx_aui_usage_events_user_period_created',
+    on: 'aui_usage_events(user_id, billing_period, created_at DESC)',
+    replaces: 'idx_aui_usage_events_user_period',
+  },
+
+  // Trigram indexes let SEARCH_AUI_AUDIT_EVENTS' ILIKE '%q%' probe instead of scanning
+  {
+    name: 'idx_aui_audit_events_action_trgm',
+    on: 'aui_audit_events USING gin(action gin_trgm_ops)',
+  },
+  {
+    name: 'idx_aui_audit_events_actor_email_trgm',
+    on: 'aui_audit_events USING gin(actor_email gin_trgm_ops)',
+  },
+  {
+    name: 'idx_aui_audit_events_target_name_trgm',
+    on: 'aui_audit_events USING gin(target_name gin_trgm_ops)',
+  },
+
+  // Trigram indexes for the email / display name substring filter in user listings
+  {
+    name: 'idx_aui_users_email_trgm',
+    on: 'aui_users USING gin(email gin_trgm_ops)',
+  },
+  {
+    name: 'idx_aui_users_display_name_trgm',
+    on: 'aui_users USING gin(display_name gin_trgm_ops)',
+  },
+
+  // Composite indexes matching the list queries' filter and ORDER BY, so
+  // they read rows in order instead of sorting
+  {
+    name: 'idx_aui_sessions_user_updated',
+    on: 'aui_sessions(user_id, updated_at DESC)',
+    replaces: 'idx_aui_sessions_user',
+  },
+  {
+    name: 'idx_aui_tasks_session_created',
+    on: 'aui_tasks(session_id, created_at DESC)',
+    replaces: 'idx_aui_tasks_session',
+  },
+  {
+    name: 'idx_aui_books_user_updated',
+    on: 'aui_books(user_id, updated_at DESC)',
+    replaces: 'idx_aui_books_user',
+  },
+  {
+    name: 'idx_aui_books_updated',
+    on: 'aui_books(updated_at DESC)',
+  },
+  {
+    name: 'idx_aui_clusters_user_created',
+    on: 'aui_clusters(user_id, created_at DESC)',
+    replaces: 'idx_aui_clusters_user',
+  },
+  {
+    name: 'idx_aui_artifacts_user_created',
+    on: 'aui_artifacts(user_id, created_at DESC)',
+    replaces: 'idx_aui_artifacts_user',
+  },
+  {
+    name: 'idx_aui_audit_events_tenant_created',
+    on: 'aui_audit_events(tenant_id, created_at DESC)',
+    replaces: 'idx_aui_audit_events_tenant',
+  },
+  {
+    name: 'idx_aui_users_tenant_created',
+    on: 'aui_users(tenant_id, created_at DESC)',
+  },
+  {
+    name: 'idx_aui_archive_subsets_owner_updated',
+    on: 'aui_archive_subsets(tenant_id, user_id, updated_at DESC)',
+  },
+];
+
 /**
  * Create HNSW vector index for cluster centroids (optional)
  */
@@ -2008,6 +2202,14 @@ ORDER BY updated_at DESC
 LIMIT $2 OFFSET $3
 `;
 
+export const LIST_AUI_BOOK_SUMMARIES = `
+SELECT id, user_id, title, description, status, chapter_count, word_count, created_at, updated_at
+FROM aui_books
+WHERE ($1::text IS NULL OR user_id = $1)
+ORDER BY updated_at DESC
+LIMIT $2 OFFSET $3
+`;
+
 // Chapters
 export const INSERT_AUI_CHAPTER = `
 INSERT INTO aui_book_chapters (id, book_id, title, content, position, word_count, passage_ids, metadata, created_at, updated_at)
@@ -2019,6 +2221,10 @@ export const GET_AUI_CHAPTERS = `
 SELECT * FROM aui_book_chapters WHERE book_id = $1 ORDER BY position ASC
 `;
 
+export const GET_AUI_CHAPTERS_FOR_BOOKS = `
+SELECT * FROM aui_book_chapters WHERE book_id = ANY($1::uuid[]) ORDER BY book_id, position ASC
+`;
+
 export const UPDATE_AUI_CHAPTER = `
 UPDATE aui_book_chapters SET
   title = COALESCE($2, title),
@@ -2515,7 +2721,7 @@ INSERT INTO aui_usage_events (
   id, tenant_id, user_id, operation_type, model_id, model_provider,
   tokens_input, tokens_output, provider_cost_millicents, user_charge_millicents,
   latency_ms, status, error, session_id, request_id, api_key_id, billing_period, created_at
-) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17, $18)
+) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17, NOW())
 RETURNING *
 `;
 
@@ -2572,23 +2778,41 @@ export const UPSERT_AUI_USER_USAGE_SNAPSHOT = `
 INSERT INTO aui_user_usage_snapshots (
   user_id, tenant_id, billing_period,
   tokens_used, requests_count, cost_millicents,
-  tokens_limit, requests_limit, cost_limit_millicents,
-  by_model, by_operation, updated_at
-) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12)
+  tokens_limit, requests_limit, cost_limit_millicents, updated_at
+) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, NOW())
 ON CONFLICT (user_id, tenant_id, billing_period)
 DO UPDATE SET
   tokens_used = aui_user_usage_snapshots.tokens_used + EXCLUDED.tokens_used,
   requests_count = aui_user_usage_snapshots.requests_count + EXCLUDED.requests_count,
   cost_millicents = aui_user_usage_snapshots.cost_millicents + EXCLUDED.cost_millicents,
-  by_model = aui_user_usage_snapshots.by_model || EXCLUDED.by_model,
-  by_operation = aui_user_usage_snapshots.by_operation || EXCLUDED.by_operation,
   updated_at = NOW()
 RETURNING *
 `;
 
+/**
+ * Get a usage snapshot, with by_model / by_operation assembled from
+ * aui_user_usage_breakdowns (NULL when a dimension has no rows yet).
+ */
 export const GET_AUI_USER_USAGE_SNAPSHOT = `
-SELECT * FROM aui_user_usage_snapshots
-WHERE user_id = $1 AND tenant_id = $2 AND billing_period = $3
+SELECT
+  s.user_id, s.tenant_id, s.billing_period,
+  s.tokens_used, s.requests_count, s.cost_millicents,
+  s.tokens_limit, s.requests_limit, s.cost_limit_millicents,
+  s.updated_at,
+  b.by_model, b.by_operation
+FROM aui_user_usage_snapshots s
+LEFT JOIN LATERAL (
+  SELECT
+    jsonb_object_agg(key, jsonb_build_object(
+      'tokens', tokens, 'requests', requests, 'cost', cost_millicents
+    )) FILTER (WHERE dimension = 'model') AS by_model,
+    jsonb_object_agg(key, jsonb_build_object(
+      'tokens', tokens, 'requests', requests, 'cost', cost_millicents
+    )) FILTER (WHERE dimension = 'operation') AS by_operation
+  FROM aui_user_usage_breakdowns
+  WHERE user_id = s.user_id AND tenant_id = s.tenant_id AND billing_period = s.billing_period
+) b ON TRUE
+WHERE s.user_id = $1 AND s.tenant_id = $2 AND s.billing_period = $3
 `;
 
 export const GET_AUI_USER_USAGE_HISTORY = `
@@ -2598,6 +2822,11 @@ ORDER BY billing_period DESC
 LIMIT $3
 `;
 
+/**
+ * Increment a usage snapshot's totals in place.
+ * Per-model / per-operation counters go through
+ * UPSERT_AUI_USER_USAGE_BREAKDOWNS.
+ */
 export const INCREMENT_AUI_USER_USAGE = `
 UPDATE aui_user_usage_snapshots SET
   tokens_used = tokens_used + $4,
@@ -2608,6 +2837,23 @@ WHERE user_id = $1 AND tenant_id = $2 AND billing_period = $3
 RETURNING *
 `;
 
+/**
+ * Add one call to the model and operation breakdown rows.
+ * $4 = model id, $5 = operation type, $6 = tokens, $7 = cost (millicents).
+ */
+export const UPSERT_AUI_USER_USAGE_BREAKDOWNS = `
+INSERT INTO aui_user_usage_breakdowns (
+  user_id, tenant_id, billing_period, dimension, key, tokens, requests, cost_millicents
+) VALUES
+  ($1, $2, $3, 'model', $4, $6, 1, $7),
+  ($1, $2, $3, 'operation', $5, $6, 1, $7)
+ON CONFLICT (user_id, tenant_id, billing_period, dimension, key)
+DO UPDATE SET
+  tokens = aui_user_usage_breakdowns.tokens + EXCLUDED.tokens,
+  requests = aui_user_usage_breakdowns.requests + EXCLUDED.requests,
+  cost_millicents = aui_user_usage_breakdowns.cost_millicents + EXCLUDED.cost_millicents
+`;
+
 // API Keys
 export const INSERT_AUI_API_KEY = `
 INSERT INTO aui_api_keys (
@@ -2780,13 +3026,18 @@ export const UPSERT_AUI_USER_PREFERENCES = `
 INSERT INTO aui_user_preferences (
   user_id, tenant_id, model_preferences, prompt_customizations,
   transformation_defaults, ui_preferences, updated_at
-) VALUES ($1, $2, $3, $4, $5, $6, NOW())
+) VALUES (
+  $1, $2,
+  COALESCE($3::jsonb, '{}'), COALESCE($4::jsonb, '{}'),
+  COALESCE($5::jsonb, '{}'), COALESCE($6::jsonb, '{}'),
+  NOW()
+)
 ON CONFLICT (user_id, tenant_id)
 DO UPDATE SET
-  model_preferences = COALESCE(EXCLUDED.model_preferences, aui_user_preferences.model_preferences),
-  prompt_customizations = COALESCE(EXCLUDED.prompt_customizations, aui_user_preferences.prompt_customizations),
-  transformation_defaults = COALESCE(EXCLUDED.transformation_defaults, aui_user_preferences.transformation_defaults),
-  ui_preferences = COALESCE(EXCLUDED.ui_preferences, aui_user_preferences.ui_preferences),
+  model_preferences = COALESCE($3::jsonb, aui_user_preferences.model_preferences),
+  prompt_customizations = COALESCE($4::jsonb, aui_user_preferences.prompt_customizations),
+  transformation_defaults = COALESCE($5::jsonb, aui_user_preferences.transformation_defaults),
+  ui_preferences = COALESCE($6::jsonb, aui_user_preferences.ui_preferences),
   updated_at = NOW()
 RETURNING *
 `;
@@ -22,7 +22,7 @@ import type { Pool, PoolClient } from 'pg';
 // ═══════════════════════════════════════════════════════════════════
 
 /** Current schema version */
-export const SCHEMA_VERSION = 8;
+export const SCHEMA_VERSION = 10;
 
 // ═══════════════════════════════════════════════════════════════════
 // EXTENSION SETUP
@@ -545,6 +545,80 @@ export async function initializeSchema(
   } finally {
     client.release();
   }
+
+  await buildConcurrentIndexes(pool);
+}
+
+/**
+ * An index built with CREATE INDEX CONCURRENTLY after the migration
+ * transaction commits, so large tables stay writable while it builds.
+ */
+export interface ConcurrentIndex {
+  /** Index name */
+  name: string;
+  /** Everything after "ON", e.g. "aui_users(created_at DESC)" */
+  on: string;
+  /** Older index this one supersedes, dropped once the new one is valid */
+  replaces?: string;
+}
+
+/**
+ * Concurrently built indexes on content_nodes
+ */
+export const CONTENT_CONCURRENT_INDEXES: ConcurrentIndex[] = [
+  // Embedding backfill filters on word_count; the partial index shrinks as
+  // nodes gain embeddings
+  {
+    name: 'idx_content_nodes_unembedded_words',
+    on: 'content_nodes(word_count) WHERE embedding IS NULL',
+  },
+
+  // Random-key sampling probes only embedded rows (GET_EMBEDDED_NODES_AT_KEYS)
+  {
+    name: 'idx_content_nodes_embedded_id',
+    on: 'content_nodes(id) WHERE embedding IS NOT NULL',
+  },
+];
+
+/**
+ * Build indexes on large tables with CREATE INDEX CONCURRENTLY.
+ *
+ * CONCURRENTLY cannot run inside a transaction, so this runs after the
+ * migrations commit, on every startup. Each step is idempotent: a build
+ * that was interrupted leaves an INVALID index, which is dropped and
+ * rebuilt. Failures are logged and retried on the next startup.
+ */
+async function buildConcurrentIndexes(pool: Pool): Promise<void> {
+  const { AUI_CONCURRENT_INDEXES } = await import('./schema-aui.js');
+  const client = await pool.connect();
+
+  try {
+    for (const index of [...CONTENT_CONCURRENT_INDEXES, ...AUI_CONCURRENT_INDEXES]) {
+      try {
+        const existing = await client.query(
+          'SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass($1)',
+          [index.name]
+        );
+        const valid = existing.rows.length > 0 && existing.rows[0].indisvalid === true;
+
+        if (!valid) {
+          if (existing.rows.length > 0) {
+            await client.query(`DROP INDEX CONCURRENTLY IF EXISTS ${index.name}`);
+          }
+          await client.query(`CREATE INDEX CONCURRENTLY IF NOT EXISTS ${index.name} ON ${index.on}`);
+        }
+
+        if (index.replaces) {
+          await client.query(`DROP INDEX CONCURRENTLY IF EXISTS ${index.replaces}`);
+        }
+      } catch (error) {
+        // Log but don't fail - the build is retried on the next startup
+        console.warn(`Could not build index ${index.name}:`, error);
+      }
+    }
+  } finally {
+    client.release();
+  }
 }
 
 /**
@@ -728,6 +802,44 @@ async function runMigrations(
     `);
 
     // Update schema version to 8
+    await client.query(
+      "INSERT INTO schema_meta (key, value) VALUES ('schema_version', $1) ON CONFLICT (key) DO UPDATE SET value = $1",
+      ['8']
+    );
+  }
+
+  // Migration to version 9: Index unembedded nodes by word count
+  if (fromVersion < 9) {
+    // The embedding backfill index is built after commit
+    // (CONTENT_CONCURRENT_INDEXES) so content_nodes stays writable
+
+    // Update schema version to 9
+    await client.query(
+      "INSERT INTO schema_meta (key, value) VALUES ('schema_version', $1) ON CONFLICT (key) DO UPDATE SET value = $1",
+      ['9']
+    );
+  }
+
+  // Migration to version 10: Normalized usage breakdowns, book chapter stats
+  if (fromVersion < 10) {
+    const {
+      CREATE_AUI_USER_USAGE_BREAKDOWNS_TABLE,
+      BACKFILL_AUI_USER_USAGE_BREAKDOWNS,
+      ALTER_AUI_BOOKS_ADD_CHAPTER_STATS,
+      CREATE_AUI_BOOK_CHAPTER_STATS_TRIGGER,
+      BACKFILL_AUI_BOOK_CHAPTER_STATS,
+    } = await import('./schema-aui.js');
+
+    // Per-model / per-operation counters move out of the snapshot JSONB
+    await client.query(CREATE_AUI_USER_USAGE_BREAKDOWNS_TABLE);
+    await client.query(BACKFILL_AUI_USER_USAGE_BREAKDOWNS);
+
+    // Book listings read chapter stats from the book row
+    await client.query(ALTER_AUI_BOOKS_ADD_CHAPTER_STATS);
+    await client.query(CREATE_AUI_BOOK_CHAPTER_STATS_TRIGGER);
+    await client.query(BACKFILL_AUI_BOOK_CHAPTER_STATS);
+
+    // Update schema version to 10
     await client.query(
       "INSERT INTO schema_meta (key, value) VALUES ('schema_version', $1) ON CONFLICT (key) DO UPDATE SET value = $1",
       [SCHEMA_VERSION.toString()]
@@ -735,7 +847,7 @@ async function runMigrations(
   }
 
   // Future migrations would go here:
-  // if (fromVersion < 9) { ... }
+  // if (fromVersion < 11) { ... }
 }
 
 // ═══════════════════════════════════════════════════════════════════
@@ -770,6 +882,37 @@ INSERT INTO content_nodes (
 RETURNING *
 `;
 
+/**
+ * Insert a content node unless one with the same content hash exists.
+ * Dedup check and insert are one statement; no row comes back when the
+ * hash is already stored.
+ */
+export const INSERT_CONTENT_NODE_IF_NEW = `
+INSERT INTO content_nodes (
+  id, content_hash, uri, text, format, word_count,
+  embedding, embedding_model, embedding_at, embedding_text_hash,
+  parent_node_id, position, chunk_index, chunk_start_offset, chunk_end_offset,
+  hierarchy_level, thread_root_id,
+  source_type, source_adapter, source_original_id, source_original_path, import_job_id,
+  title, author, author_role, tags, media_refs, source_metadata,
+  paragraph_hashes, line_hashes, first_seen_at,
+  has_pasted_content, paste_segments, paste_confidence, paste_reasons,
+  source_created_at, source_updated_at, created_at, imported_at
+)
+SELECT
+  $1, $2, $3, $4, $5, $6,
+  $7, $8, $9, $10,
+  $11, $12, $13, $14, $15,
+  $16, $17,
+  $18, $19, $20, $21, $22,
+  $23, $24, $25, $26, $27, $28,
+  $29, $30, $31,
+  $32, $33, $34, $35,
+  $36, $37, $38, $39
+WHERE NOT EXISTS (SELECT 1 FROM content_nodes WHERE content_hash = $2)
+RETURNING *
+`;
+
 /**
  * Update embedding for a node
  */
@@ -815,11 +958,49 @@ LIMIT $2
  */
 export const GET_RANDOM_EMBEDDED_NODES = `
 SELECT id FROM content_nodes
-WHERE embedding IS NOT NULL
+WHERE embedding IS NOT NULL AND word_count >= $2
 ORDER BY RANDOM()
 LIMIT $1
 `;
 
+/**
+ * Get embedded nodes at random points of the primary-key space.
+ * $1 = random UUID pivots, $2 = minimum word count.
+ * Node ids are random (v4) UUIDs, so the first qualifying id at or after a
+ * random pivot is a uniform-enough pick; each pivot is one probe of the
+ * partial idx_content_nodes_embedded_id index, which holds only embedded
+ * rows, instead of a random sort key for every row.
+ */
+export const GET_EMBEDDED_NODES_AT_KEYS = `
+SELECT n.id
+FROM unnest($1::uuid[]) AS p(pivot)
+CROSS JOIN LATERAL (
+  SELECT id FROM content_nodes
+  WHERE id >= p.pivot AND embedding IS NOT NULL AND word_count >= $2
+  ORDER BY id
+  LIMIT 1
+) n
+`;
+
+/**
+ * Planner estimate of embedded content_nodes rows, read from the partial
+ * idx_content_nodes_embedded_id index. No row until that index is built
+ * and valid.
+ */
+export const ESTIMATE_EMBEDDED_NODE_COUNT = `
+SELECT c.reltuples::bigint AS estimate
+FROM pg_class c
+JOIN pg_index i ON i.indexrelid = c.oid
+WHERE c.oid = to_regclass('idx_content_nodes_embedded_id') AND i.indisvalid
+`;
+
+/**
+ * Planner row estimate for content_nodes (cheap; no table scan)
+ */
+export const ESTIMATE_NODE_COUNT = `
+SELECT reltuples::bigint AS estimate FROM pg_class WHERE oid = 'content_nodes'::regclass
+`;
+
 /**
  * Full-text search using tsvector
  */
@@ -831,6 +1012,23 @@ ORDER BY rank DESC
 LIMIT $2
 `;
 
+/**
+ * Columns read back into a StoredNode: everything but the embedding vector
+ * and the tsv search column, which together outweigh most rows' text and
+ * are never returned by node queries
+ */
+export const CONTENT_NODE_COLUMNS = `
+id, content_hash, uri, text, format, word_count,
+embedding_model, embedding_at, embedding_text_hash,
+parent_node_id, position, chunk_index, chunk_start_offset, chunk_end_offset,
+hierarchy_level, thread_root_id,
+source_type, source_adapter, source_original_id, source_original_path, import_job_id,
+title, author, author_role, tags, media_refs, source_metadata,
+paragraph_hashes, line_hashes, first_seen_at,
+has_pasted_content, paste_segments, paste_confidence, paste_reasons,
+source_created_at, source_updated_at, created_at, imported_at
+`;
+
 /**
  * Get node by ID
  */
@@ -838,6 +1036,13 @@ export const GET_NODE_BY_ID = `
 SELECT * FROM content_nodes WHERE id = $1
 `;
 
+/**
+ * Get nodes by ID (batch)
+ */
+export const GET_NODES_BY_IDS = `
+SELECT ${CONTENT_NODE_COLUMNS} FROM content_nodes WHERE id = ANY($1::uuid[])
+`;
+
 /**
  * Get node by URI
  */
@@ -852,6 +1057,47 @@ export const GET_NODE_BY_HASH = `
 SELECT * FROM content_nodes WHERE content_hash = $1
 `;
 
+/**
+ * Get IDs for a set of URIs (batch parent resolution)
+ */
+export const GET_NODE_IDS_BY_URIS = `
+SELECT id, uri FROM content_nodes WHERE uri = ANY($1::text[])
+`;
+
+/**
+ * Get which of a set of content hashes are already stored (batch dedup)
+ */
+export const GET_EXISTING_CONTENT_HASHES = `
+SELECT content_hash FROM content_nodes WHERE content_hash = ANY($1::text[])
+`;
+
+/**
+ * Latest source update time per URI, counting only nodes written by
+ * completed import jobs (batch incremental-import check)
+ */
+export const GET_IMPORTED_SOURCE_UPDATED_AT = `
+SELECT n.uri, MAX(n.source_updated_at) AS source_updated_at
+FROM content_nodes n
+JOIN import_jobs j ON j.id = n.import_job_id
+WHERE n.uri = ANY($1::text[])
+  AND j.status = 'completed'
+  AND n.source_updated_at IS NOT NULL
+GROUP BY n.uri
+`;
+
+/**
+ * Advance source_updated_at for already-imported nodes by URI. Conversation
+ * roots are stored without it and stamped here once every node of the
+ * conversation is stored, so a partly failed conversation is re-imported.
+ */
+export const REFRESH_IMPORTED_SOURCE_UPDATED_AT = `
+UPDATE content_nodes n
+SET source_updated_at = v.source_updated_at
+FROM unnest($1::text[], $2::timestamptz[]) AS v(uri, source_updated_at)
+WHERE n.uri = v.uri
+  AND (n.source_updated_at IS NULL OR n.source_updated_at < v.source_updated_at)
+`;
+
 /**
  * Delete node by ID
  */
@@ -894,7 +1140,7 @@ ORDER BY started_at DESC
  */
 export const GET_NODES_NEEDING_EMBEDDINGS = `
 SELECT * FROM content_nodes
-WHERE embedding IS NULL
+WHERE embedding IS NULL AND word_count >= $2
 LIMIT $1
 `;
 
@@ -905,27 +1151,31 @@ export const GET_EMBEDDING = `
 SELECT embedding FROM content_nodes WHERE id = $1 AND embedding IS NOT NULL
 `;
 
+/**
+ * Get embeddings for several nodes (batch)
+ */
+export const GET_EMBEDDINGS_BY_IDS = `
+SELECT id, embedding FROM content_nodes WHERE id = ANY($1::uuid[]) AND embedding IS NOT NULL
+`;
+
 /**
  * Get storage statistics
+ *
+ * One scan of content_nodes yields the per-source-type rows (grouping = 1),
+ * the per-adapter rows (grouping = 2) and the totals row (grouping = 3).
+ * Link and job counts are uncorrelated subqueries, evaluated once.
  */
 export const GET_STATS = `
-SELECT 
-  (SELECT COUNT(*) FROM content_nodes) as total_nodes,
-  (SELECT COUNT(*) FROM content_nodes WHERE embedding IS NOT NULL) as nodes_with_embeddings,
+SELECT
+  GROUPING(source_type, source_adapter) as grouping,
+  source_type,
+  source_adapter,
+  COUNT(*) as count,
+  COUNT(embedding) as nodes_with_embeddings,
   (SELECT COUNT(*) FROM content_links) as total_links,
   (SELECT COUNT(*) FROM import_jobs) as total_jobs
-`;
-
-export const GET_NODES_BY_SOURCE_TYPE = `
-SELECT source_type, COUNT(*) as count 
-FROM content_nodes 
-GROUP BY source_type
-`;
-
-export const GET_NODES_BY_ADAPTER = `
-SELECT source_adapter, COUNT(*) as count
 FROM content_nodes
-GROUP BY source_adapter
+GROUP BY GROUPING SETS ((source_type), (source_adapter), ())
 `;
 
 // ═══════════════════════════════════════════════════════════════════
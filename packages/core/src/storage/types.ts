@@ -526,6 +526,9 @@ export interface QueryOptions {
   /** Filter by parent node */
   parentNodeId?: string;
 
+  /** Only thread roots: nodes with no parent, or that are their own thread root */
+  threadRootsOnly?: boolean;
+
   /** Filter by author role */
   authorRole?: AuthorRole;
 
@@ -566,6 +569,9 @@ export interface QueryResult {
 
   /** Whether more results exist */
   hasMore: boolean;
+
+  /** True when total is a planner estimate rather than an exact count */
+  totalIsEstimate?: boolean;
 }
 
 // ═══════════════════════════════════════════════════════════════════
@@ -84,20 +84,32 @@ export function chunkText(text: string, targetSentences: number = 10): TextChunk
   return chunks;
 }
 
+/**
+ * Abbreviations whose trailing period does not end a sentence
+ */
+const ABBREVIATIONS = [
+  'Mr', 'Mrs', 'Ms', 'Dr', 'Prof', 'Sr', 'Jr', 'vs', 'etc',
+  'e.g', 'i.e', 'cf', 'al', 'Inc', 'Ltd', 'Co', 'Corp', 'St', 'Ave', 'Blvd',
+];
+
+/** Canonical spelling of each abbreviation, keyed by lowercase form */
+const ABBREVIATION_BY_LOWER = new Map(ABBREVIATIONS.map((abbr) => [abbr.toLowerCase(), abbr]));
+
+/** Any abbreviation followed by its period, in one alternation */
+const ABBREVIATION_PATTERN = new RegExp(
+  `\\b(${ABBREVIATIONS.map((abbr) => abbr.replace(/\./g, '\\.')).join('|')})\\.`,
+  'gi'
+);
+
 /**
  * Split text into sentences
  */
 export function splitIntoSentences(text: string): string[] {
-  const abbreviations = [
-    'Mr', 'Mrs', 'Ms', 'Dr', 'Prof', 'Sr', 'Jr', 'vs', 'etc',
-    'e.g', 'i.e', 'cf', 'al', 'Inc', 'Ltd', 'Co', 'Corp', 'St', 'Ave', 'Blvd',
-  ];
-
-  let processedText = text;
-  for (const abbr of abbreviations) {
-    const regex = new RegExp(`\\b${abbr}\\.`, 'gi');
-    processedText = processedText.replace(regex, `${abbr}<<DOT>>`);
-  }
+  // Protect abbreviation periods in a single pass over the text
+  let processedText = text.replace(
+    ABBREVIATION_PATTERN,
+    (_match, abbr: string) => `${ABBREVIATION_BY_LOWER.get(abbr.toLowerCase())}<<DOT>>`
+  );
 
   processedText = processedText.replace(/(\d)\.(\d)/g, '$1<<DOT>>$2');
   processedText = processedText.replace(/\.{3}/g, '<<ELLIPSIS>>');
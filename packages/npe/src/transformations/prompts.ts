@@ -180,16 +180,18 @@ OUTPUT:
 Output ONLY the transformed text - no explanations.
 Begin directly with the transformed content.`;
 
+/** A {{variable}} placeholder */
+const TEMPLATE_VARIABLE = /\{\{(\w+)\}\}/g;
+
 /**
  * Simple template variable substitution.
- * Replaces {{variable}} patterns with provided values.
+ * Replaces {{variable}} patterns with provided values in a single pass;
+ * placeholders without a value are left as-is.
  */
 function fillTemplate(template: string, variables: Record<string, string>): string {
-  let result = template;
-  for (const [key, value] of Object.entries(variables)) {
-    result = result.replace(new RegExp(`\\{\\{${key}\\}\\}`, 'g'), value);
-  }
-  return result;
+  return template.replace(TEMPLATE_VARIABLE, (match, key: string) =>
+    Object.prototype.hasOwnProperty.call(variables, key) ? variables[key] : match
+  );
 }
 
 /**
@@ -64,6 +64,22 @@ describe('TransformerService', () => {
       expect(capturedPrompt).toContain('same length');
     });
 
+    it('should insert source text verbatim into the prompt', async () => {
+      let capturedPrompt = '';
+      const adapter = createMockAdapter((input) => {
+        capturedPrompt = input;
+        return 'Transformed text here.';
+      });
+
+      const transformer = new TransformerService(adapter);
+      await transformer.transformPersona(
+        'It cost $& and $1, not {{personaName}}.',
+        BUILTIN_PERSONAS.romantic
+      );
+
+      expect(capturedPrompt).toContain('It cost $& and $1, not {{personaName}}.');
+    });
+
     it('should use all builtin personas', async () => {
       const adapter = createMockAdapter(() => 'Result.');
       const transformer = new TransformerService(adapter);
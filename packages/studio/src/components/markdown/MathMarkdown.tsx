@@ -41,6 +41,13 @@ function loadKatexCss(): void {
   katexCssLoaded = true;
 }
 
+/**
+ * Display math, inline math and equation environments as one alternation,
+ * so each message is scanned once rather than once per delimiter style
+ */
+const LATEX_DELIMITERS =
+  /\\\[([\s\S]*?)\\\]|\\\(([\s\S]*?)\\\)|\\begin\{(equation|align|gather|multline)\*?\}([\s\S]*?)\\end\{\3\*?\}/g;
+
 /**
  * Preprocess text to normalize LaTeX delimiters to standard markdown math
  * Converts:
@@ -50,21 +57,17 @@ function loadKatexCss(): void {
  *   \}       → \rbrace
  */
 function normalizeLatexDelimiters(text: string): string {
-  let result = text;
-
-  // Convert display math: \[...\] → $$...$$
-  result = result.replace(/\\\[([\s\S]*?)\\\]/g, '$$$$1$$');
-
-  // Convert inline math: \(...\) → $...$
-  result = result.replace(/\\\(([\s\S]*?)\\\)/g, '$$$1$$');
-
-  // Handle LaTeX environments (begin/end) - wrap in $$
-  result = result.replace(
-    /\\begin\{(equation|align|gather|multline)\*?\}([\s\S]*?)\\end\{\1\*?\}/g,
-    '$$\\begin{$1}$2\\end{$1}$$'
+  return text.replace(
+    LATEX_DELIMITERS,
+    (_match, display?: string, inline?: string, env?: string, body?: string) => {
+      // Display math: \[...\] → $$...$$
+      if (display !== undefined) return `$$${display}$$`;
+      // Inline math: \(...\) → $...$
+      if (inline !== undefined) return `$${inline}$`;
+      // LaTeX environments (begin/end) - wrap in $$
+      return `$$\\begin{${env}}${body}\\end{${env}}$$`;
+    }
   );
-
-  return result;
 }
 
 /**